@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options: {}
+notes:
+  - The disk cache is stored in the directory of the C(OMAM_CACHE_DIR) environment variable,
+    else in C(~/.ansible/dellemc_openmanage_cache). The entries can be deleted at any time,
+    a deleted entry is fetched again on the next run.
+'''
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r'''
+options:
+  idrac_ip:
+    required: false
+    type: str
+    description:
+      - iDRAC IP Address.
+      - I(idrac_ip) is mutually exclusive with I(targets), one of them is required.
+  idrac_user:
+    required: false
+    type: str
+    description:
+      - iDRAC username.
+      - If the username is not provided, then the environment variable E(IDRAC_USERNAME) is used.
+      - "Example: export IDRAC_USERNAME=username"
+      - I(idrac_user) is not required when each of the I(targets) sets its own I(idrac_user).
+  idrac_password:
+    required: false
+    type: str
+    description:
+      - iDRAC user password.
+      - If the password is not provided, then the environment variable E(IDRAC_PASSWORD) is used.
+      - "Example: export IDRAC_PASSWORD=password"
+      - I(idrac_password) is not required when each of the I(targets) sets its own I(idrac_password).
+    aliases: ['idrac_pwd']
+  targets:
+    description:
+      - List of iDRACs to be queried concurrently from this module run.
+      - Each target takes the connection options of the module unless it overrides them.
+      - The results are returned in I(results) keyed by the I(idrac_ip) of each target.
+      - I(targets) is mutually exclusive with I(idrac_ip).
+    type: list
+    elements: dict
+    version_added: 9.9.0
+    suboptions:
+      idrac_ip:
+        description: iDRAC IP Address.
+        type: str
+        required: true
+      idrac_user:
+        description: iDRAC username.
+        type: str
+      idrac_password:
+        description: iDRAC user password.
+        type: str
+        aliases: ['idrac_pwd']
+      idrac_port:
+        description: iDRAC port.
+        type: int
+      validate_certs:
+        description: If C(false), the SSL certificates will not be validated.
+        type: bool
+      ca_path:
+        description: The Privacy Enhanced Mail (PEM) file that contains a CA certificate to be used for the validation.
+        type: path
+      timeout:
+        description: The socket level timeout in seconds for the requests to this target.
+        type: int
+  max_workers:
+    description:
+      - Maximum number of I(targets) queried concurrently.
+      - If not specified, up to C(8) targets are queried concurrently.
+      - While several targets are queried concurrently, the requests of each target are sent one at a time.
+    type: int
+    version_added: 9.9.0
+  target_timeout:
+    description:
+      - Time in seconds within which each of the I(targets) is to complete.
+      - A target that does not complete within this time is reported as failed in I(results), while
+        I(timeout) applies to each request of a target.
+      - If not specified, the targets are not limited in time.
+    type: int
+    version_added: 9.9.0
+'''
@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.4.0
-# Copyright (C) 2022-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -76,39 +76,81 @@ options:
     description: To include group variables in the inventory source.
     type: dict
     required: false
+  max_workers:
+    description:
+    - Maximum number of concurrent requests used to fetch the subgroups and devices of the groups.
+    - Only the sibling groups of one parent group are fetched concurrently, the subgroups of each sibling
+      are fetched after it, one sibling after the other. A deep tree of single child groups is therefore
+      fetched one group at a time.
+    - C(1) fetches the groups one after the other.
+    env:
+    - name: OMAM_MAX_WORKERS
+    type: int
+    default: 1
+    version_added: "9.9.0"
+  fetch_devices_once:
+    description:
+    - If C(true), the management addresses of all the devices are fetched once from C(DeviceService/Devices),
+      and only the device IDs are fetched for each group.
+    - If C(false), the full device details are fetched for each group.
+    - Use C(true) when a device belongs to several nested groups, so that it is not downloaded once per group.
+    type: bool
+    default: false
+    version_added: "9.9.0"
+  refresh_cache:
+    description:
+    - If C(true), the groups and hosts are fetched from OpenManage Enterprise and the cache is updated
+      even when the cached inventory has not expired.
+    - Applicable only when I(cache) is C(true).
+    type: bool
+    default: false
+    version_added: "9.9.0"
+extends_documentation_fragment:
+  - inventory_cache
 requirements:
   - "python >= 3.9.6"
 author:
   - "Felix Stephen (@felixs88)"
 notes:
   - Run this plugin on a system that has direct access to Dell OpenManage Enterprise.
+  - One session is created on OpenManage Enterprise for the whole inventory parse.
+  - With I(cache) enabled, the group tree and the hosts of each group are cached for I(cache_timeout) seconds,
+    I(host_vars) and I(group_vars) are always applied from the inventory source.
 """
 
-from ansible.plugins.inventory import BaseInventoryPlugin
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination, \
+    get_api_path, concurrent_map, get_max_workers
 
 GROUP_API = "GroupService/Groups"
+DEVICE_API = "DeviceService/Devices"
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Cacheable):
 
     NAME = "dellemc.openmanage.ome_inventory"
 
     def __init__(self):
         super(InventoryModule, self).__init__()
         self.config = None
+        self.ome = None
+        self.device_index = None
 
-    def _get_connection_resp(self):
+    def _get_module_params(self):
         port = self.get_option("port") if "port" in self.config else 443
         validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
         module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
                          "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
         if "ca_path" in self.config:
             module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            all_group_data = get_all_data_with_pagination(ome, GROUP_API)
-        return all_group_data
+        return module_params
+
+    def _get_max_workers(self):
+        return get_max_workers({"max_workers": self.get_option("max_workers")})
+
+    def _get_connection_resp(self):
+        return get_all_data_with_pagination(self.ome, GROUP_API)
 
     def _set_host_vars(self, host):
         self.inventory.set_variable(host, "idrac_ip", host)
@@ -138,71 +180,101 @@ class InventoryModule(BaseInventoryPlugin):
 
     def _get_all_devices(self, device_uri):
         device_host = []
-        device_host_uri = device_uri.strip("/api/")
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {
-            "hostname": self.get_option("hostname"),
-            "username": self.get_option("username"),
-            "password": self.get_option("password"),
-            "port": port,
-            "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            device_resp = get_all_data_with_pagination(ome, device_host_uri)
-            device_data = device_resp.get("report_list", [])
-            if device_data is not None:
-                for mgmt in device_data:
-                    if (len(mgmt["DeviceManagement"]) != 0):
-                        device_host.append(self._get_device_host(mgmt))
+        device_host_uri = get_api_path(device_uri)
+        device_resp = get_all_data_with_pagination(self.ome, device_host_uri)
+        device_data = device_resp.get("report_list", [])
+        if device_data is not None:
+            for mgmt in device_data:
+                if (len(mgmt["DeviceManagement"]) != 0):
+                    device_host.append(self._get_device_host(mgmt))
         return device_host
 
-    def _set_child_group(self, group_data):
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
-                         "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            for gdata in group_data:
-                group_name = gdata["Name"]
-                subgroup_uri = gdata["SubGroups@odata.navigationLink"].strip("/api/")
-                sub_group = get_all_data_with_pagination(ome, subgroup_uri)
-                gdata = sub_group.get("report_list", [])
-                if gdata:
-                    self._add_group_data(gdata)
-                    self._add_child_group_data(group_name, gdata)
+    def _get_device_index(self):
+        """:return: dict of device Id to its management address"""
+        device_resp = get_all_data_with_pagination(self.ome, DEVICE_API,
+                                                   query_param={"$select": "Id,DeviceManagement"})
+        device_index = {}
+        for mgmt in device_resp.get("report_list") or []:
+            if mgmt.get("DeviceManagement"):
+                device_index[mgmt["Id"]] = self._get_device_host(mgmt)
+        return device_index
+
+    def _get_indexed_devices(self, device_uri):
+        device_host_uri = get_api_path(device_uri)
+        device_resp = get_all_data_with_pagination(self.ome, device_host_uri, query_param={"$select": "Id"})
+        device_ids = [device["Id"] for device in device_resp.get("report_list") or []]
+        return [self.device_index[device_id] for device_id in device_ids if device_id in self.device_index]
+
+    def _get_sub_groups(self, gdata):
+        subgroup_uri = get_api_path(gdata["SubGroups@odata.navigationLink"])
+        sub_group = get_all_data_with_pagination(self.ome, subgroup_uri)
+        return sub_group.get("report_list", [])
+
+    def _get_group_tree(self, group_data):
+        """
+        Fetches the hosts and subgroups of the groups.
+        :return: list of dict with the group Name, its hosts and its children groups.
+        """
+        group_data = list(filter(lambda d: d.get("Visible") not in [False], group_data))
+        device_uris = [gdata["AllLeafDevices@odata.navigationLink"] for gdata in group_data]
+        get_devices = self._get_all_devices if self.device_index is None else self._get_indexed_devices
+        all_device_ip = concurrent_map(get_devices, device_uris, self._get_max_workers())
+        sub_groups = concurrent_map(self._get_sub_groups, group_data, self._get_max_workers())
+        group_tree = []
+        for gdata, device_ip, sub_group in zip(group_data, all_device_ip, sub_groups):
+            children = self._get_group_tree(sub_group) if sub_group else []
+            group_tree.append({"Name": gdata["Name"], "hosts": device_ip, "children": children})
+        return group_tree
 
     def _add_child_group_data(self, group_name, gdata):
         for child_name in gdata:
             self.inventory.add_child(group_name, child_name["Name"])
 
-    def _add_group_data(self, group_data):
-        visible_gdata = list(filter(lambda d: d.get("Visible") in [False], group_data))
-        if visible_gdata:
-            for gp in visible_gdata:
-                group_data.remove(gp)
-        for gdata in group_data:
+    def _add_group_data(self, group_tree):
+        for gdata in group_tree:
             self._set_group_vars(gdata["Name"])
-            device_ip = self._get_all_devices(gdata["AllLeafDevices@odata.navigationLink"])
-            for hst in device_ip:
+            for hst in gdata["hosts"]:
                 self.inventory.add_host(host=hst, group=gdata["Name"])
                 self._set_host_vars(hst)
-        self._set_child_group(group_data)
+        for gdata in group_tree:
+            if gdata["children"]:
+                self._add_group_data(gdata["children"])
+                self._add_child_group_data(gdata["Name"], gdata["children"])
 
-    def _populate(self, all_group_data):
+    def _get_root_groups(self, all_group_data):
         group_data = all_group_data.get("report_list", [])
         group_name = str(self.get_option("ome_group_name")) if "ome_group_name" in self.config else None
         if group_name is not None:
             group_data = list(filter(lambda d: d.get("Name").lower() in [group_name.lower()], group_data))
         elif group_name is None:
             group_data = list(filter(lambda d: d.get("Name") in ["All Devices"], group_data))
-        self._add_group_data(group_data)
+        return group_data
+
+    def _fetch_group_tree(self):
+        with RestOME(self._get_module_params(), req_session=True) as ome:
+            self.ome = ome
+            all_group_data = self._get_connection_resp()
+            if self.get_option("fetch_devices_once"):
+                self.device_index = self._get_device_index()
+            group_tree = self._get_group_tree(self._get_root_groups(all_group_data))
+        self.ome, self.device_index = None, None
+        return group_tree
 
     def parse(self, inventory, loader, path, cache=True):
         super(InventoryModule, self).parse(inventory, loader, path, cache)
         self.config = self._read_config_data(path)
-        all_group_data = self._get_connection_resp()
-        self._populate(all_group_data)
+        cache_key = self.get_cache_key(path)
+        user_cache_setting = self.get_option("cache")
+        attempt_to_read_cache = user_cache_setting and cache and not self.get_option("refresh_cache")
+        cache_needs_update = user_cache_setting and not attempt_to_read_cache
+        group_tree = None
+        if attempt_to_read_cache:
+            try:
+                group_tree = self._cache[cache_key]
+            except KeyError:
+                cache_needs_update = True
+        if group_tree is None:
+            group_tree = self._fetch_group_tree()
+        if cache_needs_update:
+            self._cache[cache_key] = group_tree
+        self._add_group_data(group_tree)
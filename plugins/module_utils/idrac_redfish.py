@@ -37,7 +37,12 @@ from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationEr
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.parameters import env_fallback
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6, check_fanout_options, iter_scp_attributes
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport, OpenURLResponse, \
+    conditional_get, http_cache_enabled
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import track_request, PerfStatsMixin, \
+    record_sleep
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import get_job_event_listener
 from ansible.module_utils.basic import AnsibleModule
 
 idrac_auth_params = {
@@ -61,40 +66,6 @@ IMPORT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.
 IMPORT_PREVIEW = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview"
 
 
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        return self.resp.reason
-
-
 class iDRACRedfishAPI(object):
     """REST api for iDRAC modules."""
 
@@ -113,6 +84,7 @@ class iDRACRedfishAPI(object):
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.ipaddress = config_ipv6(self.ipaddress)
+        self.connection_pool = get_transport(module_params)
 
     def _get_url(self, uri):
         return "{0}://{1}:{2}{3}".format(self.protocol, self.ipaddress, self.port, uri)
@@ -165,7 +137,13 @@ class iDRACRedfishAPI(object):
         url_kwargs["force_basic_auth"] = False
         return url_kwargs
 
-    def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True):
+    def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True,
+                       stream=False, cache=False):
+        """
+        Sends the request and returns :class:`OpenURLResponse` object.
+        With stream the body is left unread for :meth:`OpenURLResponse.write_to`, to download large files.
+        With cache a GET is revalidated against the on-disk response cache when OMAM_HTTP_CACHE is enabled.
+        """
         try:
             if 'X-Auth-Token' in self._headers:
                 url_kwargs = self._args_with_session(method, api_timeout, headers=headers)
@@ -174,12 +152,30 @@ class iDRACRedfishAPI(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(uri, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            with track_request(method, url) as trace:
+                sender = self.connection_pool.open_url if self.connection_pool is not None else open_url
+                if cache and method == "GET" and http_cache_enabled():
+                    resp = conditional_get(sender, url, user=self.username, **url_kwargs)
+                else:
+                    resp = sender(url, data=data, **url_kwargs)
+                resp_data = OpenURLResponse(resp, stream=stream)
+                trace.done(resp_data)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def open_stream(self, uri, query_param=None, api_timeout=None):
+        """
+        Opens a long-lived GET request, such as the server-sent event stream, and returns the
+        unread response so that it can be consumed line by line.
+        """
+        if 'X-Auth-Token' in self._headers:
+            url_kwargs = self._args_with_session('GET', api_timeout)
+        else:
+            url_kwargs = self._args_without_session(uri, 'GET', api_timeout)
+        url_kwargs["headers"] = dict(url_kwargs["headers"], Accept='text/event-stream')
+        return open_url(self._build_url(uri, query_param=query_param), **url_kwargs)
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
         if self.req_session and not self.x_auth_token:
@@ -230,6 +226,7 @@ class iDRACRedfishAPI(object):
                 response = self.invoke_request(task_uri, "GET")
                 if response.json_data.get("TaskState") == "Running":
                     time.sleep(10)
+                    record_sleep(10)
                 else:
                     break
             except ValueError:
@@ -245,15 +242,27 @@ class iDRACRedfishAPI(object):
         :return: object
         """
         time.sleep(5)
+        record_sleep(5)
         response = self.invoke_request(job_uri, "GET")
-        while job_wait:
-            response = self.invoke_request(job_uri, "GET")
-            if response.json_data.get("PercentComplete") == 100 and \
-                    response.json_data.get("JobState") == "Completed":
-                break
-            if response.json_data.get("JobState") == "Starting" and not reboot and apply_update:
-                break
-            time.sleep(30)
+        listener = get_job_event_listener(self, job_uri) if job_wait else None
+        try:
+            while job_wait:
+                response = self.invoke_request(job_uri, "GET")
+                if response.json_data.get("PercentComplete") == 100 and \
+                        response.json_data.get("JobState") == "Completed":
+                    break
+                if response.json_data.get("JobState") == "Starting" and not reboot and apply_update:
+                    break
+                if listener is None:
+                    time.sleep(30)
+                    record_sleep(30)
+                else:
+                    started = time.monotonic()
+                    listener.wait(30)
+                    record_sleep(time.monotonic() - started)
+        finally:
+            if listener is not None:
+                listener.close()
         return response
 
     def export_scp(self, export_format=None, export_use=None, target=None,
@@ -426,12 +435,8 @@ class iDRACRedfishAPI(object):
         """
         user_attr = None
         if "SystemConfiguration" in idrac_attribues:
-            sys_config = idrac_attribues.get("SystemConfiguration")
-            for comp in sys_config.get("Components"):
-                if comp.get("FQDD") == fqdd:
-                    attributes = comp.get("Attributes")
-                    break
-            user_attr = dict([(attr["Name"], attr["Value"]) for attr in attributes if attr["Name"].startswith("Users.")])
+            user_attr = dict((name, value) for _fqdd, name, value in iter_scp_attributes(idrac_attribues, fqdds=[fqdd])
+                             if name.startswith("Users."))
         return user_attr
 
     def _get_omam_ca_env(self):
@@ -439,7 +444,7 @@ class iDRACRedfishAPI(object):
         return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
 
 
-class IdracAnsibleModule(AnsibleModule):
+class IdracAnsibleModule(PerfStatsMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -465,14 +470,23 @@ class IdracAnsibleModule(AnsibleModule):
         mutually_exclusive.extend(auth_mutually_exclusive)
         if required_together is None:
             required_together = []
-        required_together.extend(auth_required_together)
         if required_one_of is None:
             required_one_of = []
-        required_one_of.extend(auth_required_one_of)
         if required_by is None:
             required_by = {}
+        fan_out = "targets" in argument_spec
+        if fan_out:
+            argument_spec["idrac_ip"]["required"] = False
+            mutually_exclusive.append(("idrac_ip", "targets"))
+            required_one_of.append(("idrac_ip", "targets"))
+        else:
+            required_together.extend(auth_required_together)
+            required_one_of.extend(auth_required_one_of)
 
         super().__init__(argument_spec, bypass_checks, no_log,
                          mutually_exclusive, required_together,
                          required_one_of, add_file_common_args,
                          supports_check_mode, required_if, required_by)
+        if fan_out:
+            # The credentials of a target may be set on the target instead of the module.
+            check_fanout_options(self, auth_required_one_of, auth_required_together)
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import threading
+from ansible.module_utils.common.text.converters import to_text
+
+SSE_URI = "/redfish/v1/SSE"
+JOB_EVENTS_ENV = "OMAM_JOB_EVENTS"
+JOB_EVENT_FILTER = "EventFormatType eq Event"
+MAX_RECONNECTS = 3
+ODATA_ID = "@odata.id"
+
+
+def parse_sse_events(stream):
+    """
+    Parses a text/event-stream and yields the JSON payload of every event.
+    :param stream: iterable of the stream lines (bytes or str), such as an HTTP response.
+    """
+    data = []
+    for line in stream:
+        line = to_text(line).rstrip("\r\n")
+        if not line:
+            if data:
+                try:
+                    yield json.loads("\n".join(data))
+                except ValueError:
+                    pass
+                data = []
+        elif line.startswith("data:"):
+            data.append(line[5:].lstrip(" "))
+
+
+def event_job_ids(payload):
+    """Returns the set of job ids an event payload refers to through its message args or origin."""
+    job_ids = set()
+    events = payload.get("Events") if isinstance(payload, dict) else None
+    for event in events or [payload]:
+        if not isinstance(event, dict):
+            continue
+        for arg in event.get("MessageArgs") or []:
+            job_ids.add(str(arg))
+        origin = event.get("OriginOfCondition") or {}
+        if isinstance(origin, dict):
+            origin = origin.get(ODATA_ID, "")
+        if origin:
+            job_ids.add(str(origin).rstrip("/").split("/")[-1])
+    return job_ids
+
+
+class JobEventListener(object):
+    """
+    Listens on the Redfish server-sent event stream in a background thread and wakes
+    up a job poller as soon as an event about the tracked job arrives.
+    When the stream can not be opened or breaks, :meth:`wait` behaves like a plain sleep.
+    """
+
+    def __init__(self, open_stream, job_id):
+        """
+        :param open_stream: callable returning the event stream response.
+        :param job_id: id of the job to listen for, for example JID_123456789012.
+        """
+        self.job_id = str(job_id)
+        self.available = False
+        self.event_count = 0
+        self._open_stream = open_stream
+        self._stream = None
+        self._closed = False
+        self._job_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        try:
+            self._stream = self._open_stream()
+        except Exception:
+            return self
+        self.available = True
+        self._thread = threading.Thread(target=self._listen)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def _listen(self):
+        reconnects = 0
+        while not self._closed and reconnects <= MAX_RECONNECTS:
+            try:
+                for payload in parse_sse_events(self._stream):
+                    reconnects = 0
+                    if self.job_id in event_job_ids(payload):
+                        self.event_count += 1
+                        self._job_event.set()
+            except Exception:
+                pass
+            if self._closed:
+                break
+            # The stream ended or hit its read timeout, open it again.
+            reconnects += 1
+            try:
+                self._stream = self._open_stream()
+            except Exception:
+                break
+            if self._closed:
+                self._stream.close()
+        self.available = False
+
+    def wait(self, timeout):
+        """
+        Sleeps up to timeout seconds.
+        :return: True when woken early by an event about the job.
+        """
+        woken = self._job_event.wait(timeout)
+        self._job_event.clear()
+        return woken
+
+    def close(self):
+        self._closed = True
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def job_events_enabled(module_params=None):
+    """SSE job tracking is requested through the job_events parameter or OMAM_JOB_EVENTS environment variable."""
+    job_events = (module_params or {}).get("job_events")
+    if job_events is None:
+        job_events = os.environ.get(JOB_EVENTS_ENV, "").lower() in ("1", "true", "yes", "on", "sse")
+    return bool(job_events)
+
+
+def get_job_event_listener(rest_obj, job_uri, timeout=None):
+    """
+    Returns a started :class:`JobEventListener` for the job of job_uri, or None when
+    SSE job tracking is not enabled or the client can not open an event stream.
+    :param rest_obj: client object, needs an open_stream method.
+    :param job_uri: uri of the job, its last path segment is the job id.
+    :param timeout: (optional) read timeout of the stream in seconds.
+    """
+    if not job_events_enabled() or not hasattr(rest_obj, "open_stream"):
+        return None
+    job_id = str(job_uri).split("?")[0].rstrip("/").split("/")[-1]
+    listener = JobEventListener(lambda: rest_obj.open_stream(SSE_URI, query_param={"$filter": JOB_EVENT_FILTER},
+                                                             api_timeout=timeout), job_id)
+    return listener.start()
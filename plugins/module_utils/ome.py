@@ -38,7 +38,12 @@ from ansible.module_utils.common.parameters import env_fallback
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport, OpenURLResponse, \
+    conditional_get, http_cache_enabled
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import track_request, PerfStatsMixin, \
+    record_sleep
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import concurrent_map, get_max_workers
 from ansible.module_utils.basic import AnsibleModule
 
 ome_auth_params = {
@@ -60,35 +65,14 @@ JOB_URI = "JobService/Jobs({job_id})"
 JOB_SERVICE_URI = "JobService/Jobs"
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 JOB_EXEC_HISTORY = "JobService/Jobs({job_id})/ExecutionHistories"
-
-
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        return self.status_code in (200, 201, 202, 204)
-
-    @property
-    def token_header(self):
-        return self.resp.headers.get('X-Auth-Token')
+JOB_STATUS_MAP = {
+    2020: "Scheduled", 2030: "Queued", 2040: "Starting", 2050: "Running", 2060: "Completed",
+    2070: "Failed", 2090: "Warning", 2080: "New", 2100: "Aborted", 2101: "Paused", 2102: "Stopped",
+    2103: "Canceled"
+}
+FAILED_JOB_STATUS = [2070, 2090, 2100, 2101, 2102, 2103]
+JOB_BATCH_SIZE = 50
+JOB_BATCH_RETRIES = 3
 
 
 class RestOME(object):
@@ -109,6 +93,8 @@ class RestOME(object):
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.hostname = config_ipv6(self.hostname)
+        self.connection_pool = get_transport(module_params)
+        self.max_workers = get_max_workers(module_params)
 
     def _get_base_url(self):
         """builds base url"""
@@ -164,7 +150,7 @@ class RestOME(object):
         return url_kwargs
 
     def invoke_request(self, method, path, data=None, query_param=None, headers=None,
-                       api_timeout=None, dump=True):
+                       api_timeout=None, dump=True, cache=False):
         """
         Sends a request through open_url
         Returns :class:`OpenURLResponse` object.
@@ -177,6 +163,8 @@ class RestOME(object):
         :arg api_timeout: (optional) How long to wait for the server to send
             data before giving up
         :arg dump: (Optional) boolean value for dumping payload data.
+        :arg cache: (Optional) revalidates a GET against the on-disk response
+            cache with If-None-Match when OMAM_HTTP_CACHE is enabled.
         :returns: OpenURLResponse
         """
         try:
@@ -187,8 +175,14 @@ class RestOME(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            with track_request(method, url) as trace:
+                sender = self.connection_pool.open_url if self.connection_pool is not None else open_url
+                if cache and method == "GET" and http_cache_enabled():
+                    resp = conditional_get(sender, url, user=self.username, **url_kwargs)
+                else:
+                    resp = sender(url, data=data, **url_kwargs)
+                resp_data = OpenURLResponse(resp)
+                trace.done(resp_data)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
@@ -218,11 +212,15 @@ class RestOME(object):
             self.invoke_request('DELETE', path)
         return False
 
-    def get_all_report_details(self, uri):
+    def get_all_report_details(self, uri, max_workers=None):
         """
         This implementation mainly dependent on '@odata.count' value.
         Currently first request without query string, always returns total number of available
         reports in '@odata.count'.
+        The remaining pages are requested as '$top'/'$skip' windows by up to max_workers
+        concurrent requests, and one page after the other if any window fails.
+        :param uri: uri which supports '$top' and '$skip'
+        :param max_workers: (optional) concurrent page requests, defaults to max_workers of the client
         """
         try:
             resp = self.invoke_request('GET', uri)
@@ -231,6 +229,14 @@ class RestOME(object):
             total_count = data['@odata.count']
             remaining_count = total_count - len(report_list)
             first_page_count = len(report_list)
+            if max_workers is None:
+                max_workers = self.max_workers
+            if remaining_count > 0 and first_page_count and max_workers > 1:
+                pages = self._get_report_windows(uri, first_page_count, total_count, max_workers)
+                if pages is not None:
+                    for resp, value in pages:
+                        report_list.extend(value)
+                    return {"resp_obj": resp, "report_list": report_list}
             while remaining_count > 0:
                 resp = self.invoke_request('GET', uri,
                                            query_param={"$top": first_page_count, "$skip": len(report_list)})
@@ -242,10 +248,26 @@ class RestOME(object):
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
 
+    def _get_report_windows(self, uri, top, total_count, max_workers):
+        """
+        Fetches the '$skip' windows after the first page concurrently.
+        :return: list of (response, value) in window order, None when a window failed or came back short.
+        """
+        def get_window(skip):
+            resp = self.invoke_request('GET', uri, query_param={"$top": top, "$skip": skip})
+            value = resp.json_data["value"]
+            if len(value) != min(top, total_count - skip):
+                raise ValueError("Unexpected page size for $skip={0}.".format(skip))
+            return resp, value
+        try:
+            return concurrent_map(get_window, range(top, total_count, top), max_workers)
+        except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError, KeyError):
+            return None
+
     def get_job_type_id(self, jobtype_name):
         """This provides an ID of the job type."""
         job_type_id = None
-        resp = self.invoke_request('GET', "JobService/JobTypes")
+        resp = self.invoke_request('GET', "JobService/JobTypes", cache=True)
         data = resp.json_data["value"]
         for each in data:
             if each["Name"] == jobtype_name:
@@ -294,6 +316,25 @@ class RestOME(object):
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
 
+    def iter_items_with_pagination(self, uri, query_param=None):
+        """
+        Generator variant of :meth:`get_all_items_with_pagination`, yields the items page by page
+        while following '@odata.nextLink', so only one page is held in memory at a time.
+        :param uri: uri which supports pagination
+        :param query_param: (optional) query parameters of the first request
+        :return: generator of items
+        """
+        next_link = uri
+        while next_link:
+            resp = self.invoke_request('GET', next_link, query_param=query_param)
+            data = resp.json_data
+            next_link = data.get('@odata.nextLink', '')
+            if next_link:
+                next_link = next_link.split('/api')[-1]
+            query_param = None
+            for item in data.get("value", []):
+                yield item
+
     def get_device_type(self):
         """
         Returns device type map where as key is type and value is type name
@@ -301,40 +342,34 @@ class RestOME(object):
         :return: dict, first item dict gives device type map
         """
         device_map = {}
-        response = self.invoke_request("GET", "DeviceService/DeviceType")
+        response = self.invoke_request("GET", "DeviceService/DeviceType", cache=True)
         if response.json_data.get("value"):
             device_map = dict([(item["DeviceType"], item["Name"]) for item in response.json_data["value"]])
         return device_map
 
     def get_job_info(self, job_id):
         try:
-            job_status_map = {
-                2020: "Scheduled", 2030: "Queued", 2040: "Starting", 2050: "Running", 2060: "Completed",
-                2070: "Failed", 2090: "Warning", 2080: "New", 2100: "Aborted", 2101: "Paused", 2102: "Stopped",
-                2103: "Canceled"
-            }
-            failed_job_status = [2070, 2090, 2100, 2101, 2102, 2103]
             job_url = JOB_URI.format(job_id=job_id)
             job_resp = self.invoke_request('GET', job_url)
             job_dict = job_resp.json_data
-            job_status = job_dict['LastRunStatus']['Id']
-            if job_status in [2060, 2020]:
-                job_failed = False
-                message = "Job {0} successfully.".format(job_status_map[job_status])
-                exit_poll = True
-                return exit_poll, job_failed, message
-            elif job_status in failed_job_status:
-                exit_poll = True
-                job_failed = True
-                message = "Job is in {0} state, and is not completed.".format(job_status_map[job_status])
-                return exit_poll, job_failed, message
-            return False, False, None
+            return self._get_job_result(job_dict['LastRunStatus']['Id'])
         except HTTPError:
             job_failed = True
             message = "Unable to track the job status of {0}.".format(job_id)
             exit_poll = True
             return exit_poll, job_failed, message
 
+    @staticmethod
+    def _get_job_result(job_status):
+        """:return: tuple of exit_poll, job_failed and message for a job LastRunStatus Id"""
+        if job_status in [2060, 2020]:
+            message = "Job {0} successfully.".format(JOB_STATUS_MAP[job_status])
+            return True, False, message
+        elif job_status in FAILED_JOB_STATUS:
+            message = "Job is in {0} state, and is not completed.".format(JOB_STATUS_MAP[job_status])
+            return True, True, message
+        return False, False, None
+
     def job_tracking(self, job_id, job_wait_sec=600, sleep_time=60):
         """
         job_id: job id
@@ -350,11 +385,73 @@ class RestOME(object):
                 sleep_interval = max_sleep_time
                 max_sleep_time = 0
             time.sleep(sleep_interval)
+            record_sleep(sleep_interval)
             exit_poll, job_failed, job_message = self.get_job_info(job_id)
             if exit_poll is True:
                 return job_failed, job_message
         return True, "The job is not complete after {0} seconds.".format(job_wait_sec)
 
+    def get_jobs_status(self, job_ids):
+        """
+        Fetches the LastRunStatus Id of several jobs with one filtered request
+        per JOB_BATCH_SIZE jobs.
+        :param job_ids: list of job ids
+        :return: dict of job id to LastRunStatus Id, jobs not found are left out.
+        """
+        job_status = {}
+        job_ids = list(job_ids)
+        for index in range(0, len(job_ids), JOB_BATCH_SIZE):
+            id_list = ",".join(str(job_id) for job_id in job_ids[index:index + JOB_BATCH_SIZE])
+            query_param = {"$filter": "Id in ({0})".format(id_list)}
+            for job in self.iter_items_with_pagination(JOB_SERVICE_URI, query_param=query_param):
+                job_status[job["Id"]] = job.get("LastRunStatus", {}).get("Id")
+        return job_status
+
+    def iter_jobs_tracking(self, job_ids, job_wait_sec=600, sleep_time=60):
+        """
+        Tracks several jobs with a single JobService/Jobs request per poll, see :meth:`job_tracking`.
+        :param job_ids: list of job ids
+        :param job_wait_sec: Maximum time to wait for all the jobs in seconds
+        :param sleep_time: Maximum time to sleep in seconds between the polls
+        :return: generator of (job_id, job_failed, job_message) in the order the jobs finish.
+        """
+        pending = list(dict.fromkeys(job_ids))
+        retries = JOB_BATCH_RETRIES
+        max_sleep_time = job_wait_sec
+        sleep_interval = sleep_time
+        while max_sleep_time and pending:
+            if max_sleep_time > sleep_interval:
+                max_sleep_time = max_sleep_time - sleep_interval
+            else:
+                sleep_interval = max_sleep_time
+                max_sleep_time = 0
+            time.sleep(sleep_interval)
+            record_sleep(sleep_interval)
+            try:
+                job_status = self.get_jobs_status(pending)
+            except HTTPError:
+                retries = retries - 1
+                if retries:
+                    continue
+                for job_id in pending:
+                    yield job_id, True, "Unable to track the job status of {0}.".format(job_id)
+                return
+            for job_id in list(pending):
+                exit_poll, job_failed, job_message = self._get_job_result(job_status.get(job_id))
+                if exit_poll is True:
+                    pending.remove(job_id)
+                    yield job_id, job_failed, job_message
+        for job_id in pending:
+            yield job_id, True, "The job is not complete after {0} seconds.".format(job_wait_sec)
+
+    def jobs_tracking(self, job_ids, job_wait_sec=600, sleep_time=60):
+        """
+        Waits for several jobs, see :meth:`iter_jobs_tracking`.
+        :return: dict of job id to (job_failed, job_message).
+        """
+        return dict((job_id, (job_failed, job_message)) for job_id, job_failed, job_message in
+                    self.iter_jobs_tracking(job_ids, job_wait_sec=job_wait_sec, sleep_time=sleep_time))
+
     def strip_substr_dict(self, odata_dict, chkstr='@odata.'):
         cp = odata_dict.copy()
         klist = cp.keys()
@@ -427,7 +524,7 @@ class RestOME(object):
         return job_detail_status
 
 
-class OmeAnsibleModule(AnsibleModule):
+class OmeAnsibleModule(PerfStatsMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -31,6 +31,7 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_api import RestAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import PerfStatsMixin
 from ansible.module_utils.common.parameters import env_fallback
 from ansible.module_utils.basic import AnsibleModule
 
@@ -74,7 +75,7 @@ class RestOMEVV(RestAPI):
                                          api_timeout, dump)
 
 
-class OMEVVAnsibleModule(AnsibleModule):
+class OMEVVAnsibleModule(PerfStatsMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+PERF_STATS_ENV = "OMAM_PERF_STATS"
+PERF_TRACE_ENV = "OMAM_PERF_TRACE"
+ID_SEGMENT_REGEX = r"^(\d+|[A-Z]+_\d+|[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12})$"
+ODATA_KEY_REGEX = r"\([^)/]*\)"
+
+_stats = None
+_stats_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_path_template(url):
+    """
+    Returns the path of the URL without the query, with the resource ids such as 10074, JID_123456789012,
+    UUIDs and OData keys replaced by {id}, so that the requests to one endpoint are aggregated together.
+    """
+    path = urlparse(url).path or "/"
+    path = re.sub(ODATA_KEY_REGEX, "({id})", path)
+    return "/".join("{id}" if re.match(ID_SEGMENT_REGEX, segment) else segment for segment in path.split("/"))
+
+
+class RequestStats(object):
+    """
+    Aggregates the wall time, response bytes, errors and retries of the requests sent by the clients
+    per method and path template, the job polls, and the time spent sleeping while waiting for the device.
+    Each request can also be appended to a JSON lines trace file.
+    """
+
+    def __init__(self, trace_file=None):
+        self.trace_file = trace_file
+        self.started = time.time()
+        self.sleep_time = 0.0
+        self.job_polls = 0
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def add(self, record):
+        key = (record["method"], record["path"])
+        with self._lock:
+            endpoint = self._endpoints.setdefault(key, {"method": record["method"], "path": record["path"],
+                                                        "count": 0, "errors": 0, "retries": 0, "time": 0.0,
+                                                        "max_time": 0.0, "bytes": 0})
+            endpoint["count"] += 1
+            endpoint["errors"] += int(record["status"] is None or record["status"] >= 400)
+            endpoint["retries"] += record["retries"]
+            endpoint["time"] += record["time"]
+            endpoint["max_time"] = max(endpoint["max_time"], record["time"])
+            endpoint["bytes"] += record["bytes"]
+            if self.trace_file:
+                self._write_trace(record)
+
+    def add_sleep(self, secs):
+        with self._lock:
+            self.sleep_time += secs
+
+    def add_job_polls(self, count):
+        with self._lock:
+            self.job_polls += count
+
+    def _write_trace(self, record):
+        try:
+            with open(self.trace_file, "a") as trace:
+                trace.write(json.dumps(record, sort_keys=True) + "\n")
+        except (IOError, OSError):
+            self.trace_file = None
+
+    def summary(self):
+        """
+        :returns: totals of the module run and the endpoints sorted by their total time, slowest first.
+        """
+        with self._lock:
+            endpoints = sorted((dict(endpoint) for endpoint in self._endpoints.values()),
+                               key=lambda endpoint: endpoint["time"], reverse=True)
+            sleep_time = self.sleep_time
+            job_polls = self.job_polls
+        for endpoint in endpoints:
+            endpoint["time"] = round(endpoint["time"], 3)
+            endpoint["max_time"] = round(endpoint["max_time"], 3)
+        return {
+            "elapsed_time": round(time.time() - self.started, 3),
+            "requests": sum(endpoint["count"] for endpoint in endpoints),
+            "errors": sum(endpoint["errors"] for endpoint in endpoints),
+            "retries": sum(endpoint["retries"] for endpoint in endpoints),
+            "request_time": round(sum(endpoint["time"] for endpoint in endpoints), 3),
+            "bytes": sum(endpoint["bytes"] for endpoint in endpoints),
+            "sleep_time": round(sleep_time, 3),
+            "job_polls": job_polls,
+            "endpoints": endpoints,
+        }
+
+
+def perf_stats_enabled():
+    return os.environ.get(PERF_STATS_ENV, "").lower() in ("1", "true", "yes", "on") or \
+        bool(os.environ.get(PERF_TRACE_ENV))
+
+
+def get_request_stats():
+    """
+    Returns the request statistics shared by every client in the process when they are enabled
+    through the OMAM_PERF_STATS or OMAM_PERF_TRACE environment variables, else None.
+    """
+    global _stats
+    if not perf_stats_enabled():
+        return None
+    with _stats_lock:
+        if _stats is None:
+            _stats = RequestStats(os.environ.get(PERF_TRACE_ENV) or None)
+    return _stats
+
+
+def reset_request_stats():
+    global _stats
+    with _stats_lock:
+        _stats = None
+
+
+class RequestTrace(object):
+    """Measures one request, the client reports the response it received with :meth:`done`."""
+
+    def __init__(self, method, url):
+        self.record = {"method": (method or "GET").upper(), "path": get_path_template(url), "status": None,
+                       "time": 0.0, "bytes": 0, "retries": 0}
+
+    def done(self, response):
+        resp = getattr(response, "resp", None)
+        body = getattr(response, "body", None)
+        self.record["status"] = getattr(resp, "status", None) or getattr(resp, "code", None)
+        self.record["bytes"] = len(body) if isinstance(body, (bytes, str)) else 0
+
+
+class _NullTrace(object):
+    def done(self, response):
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+
+@contextmanager
+def track_request(method, url):
+    """
+    Context manager around one request of a client. When the statistics are disabled it yields a trace
+    that records nothing, else the wall time, status, response bytes and retries are added on exit.
+    """
+    stats = get_request_stats()
+    if stats is None:
+        yield NULL_TRACE
+        return
+    trace = RequestTrace(method, url)
+    _local.trace = trace
+    start = time.time()
+    try:
+        yield trace
+    except HTTPError as err:
+        trace.record["status"] = err.code
+        raise
+    finally:
+        _local.trace = None
+        trace.record["time"] = round(time.time() - start, 6)
+        stats.add(trace.record)
+
+
+def note_retry():
+    """Counts a transport retry against the request that is in progress on this thread."""
+    trace = getattr(_local, "trace", None)
+    if trace is not None:
+        trace.record["retries"] += 1
+
+
+def record_sleep(secs):
+    """Adds the seconds slept waiting for the device, such as between job polls."""
+    stats = get_request_stats()
+    if stats is not None and secs:
+        stats.add_sleep(secs)
+
+
+def record_job_polls(count):
+    """Adds the number of polls a job tracker sent."""
+    stats = get_request_stats()
+    if stats is not None and count:
+        stats.add_job_polls(count)
+
+
+class PerfStatsMixin(object):
+    """Adds the aggregated request statistics as perf_stats to the module result when they are enabled."""
+
+    def exit_json(self, **kwargs):
+        self._add_perf_stats(kwargs)
+        super(PerfStatsMixin, self).exit_json(**kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        self._add_perf_stats(kwargs)
+        super(PerfStatsMixin, self).fail_json(msg=msg, **kwargs)
+
+    @staticmethod
+    def _add_perf_stats(result):
+        stats = get_request_stats()
+        if stats is not None and "perf_stats" not in result:
+            result["perf_stats"] = stats.summary()
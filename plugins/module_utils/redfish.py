@@ -35,7 +35,10 @@ from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationEr
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.parameters import env_fallback
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6, check_fanout_options
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport, OpenURLResponse, \
+    conditional_get, http_cache_enabled
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import track_request, PerfStatsMixin
 from ansible.module_utils.basic import AnsibleModule
 
 redfish_auth_params = {
@@ -55,40 +58,6 @@ SESSION_RESOURCE_COLLECTION = {
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 
 
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        return self.resp.reason
-
-
 class Redfish(object):
     """Handles iDRAC Redfish API requests"""
 
@@ -108,6 +77,7 @@ class Redfish(object):
         self.root_uri = '/redfish/v1/'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.hostname = config_ipv6(self.hostname)
+        self.connection_pool = get_transport(module_params)
 
     def _get_base_url(self):
         """builds base url"""
@@ -162,7 +132,7 @@ class Redfish(object):
         return url_kwargs
 
     def invoke_request(self, method, path, data=None, query_param=None, headers=None,
-                       api_timeout=None, dump=True):
+                       api_timeout=None, dump=True, cache=False):
         """
         Sends a request through open_url
         Returns :class:`OpenURLResponse` object.
@@ -175,6 +145,8 @@ class Redfish(object):
         :arg api_timeout: (optional) How long to wait for the server to send
             data before giving up
         :arg dump: (Optional) boolean value for dumping payload data.
+        :arg cache: (Optional) revalidates a GET against the on-disk response
+            cache with If-None-Match when OMAM_HTTP_CACHE is enabled.
         :returns: OpenURLResponse
         """
         try:
@@ -185,12 +157,30 @@ class Redfish(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            with track_request(method, url) as trace:
+                sender = self.connection_pool.open_url if self.connection_pool is not None else open_url
+                if cache and method == "GET" and http_cache_enabled():
+                    resp = conditional_get(sender, url, user=self.username, **url_kwargs)
+                else:
+                    resp = sender(url, data=data, **url_kwargs)
+                resp_data = OpenURLResponse(resp)
+                trace.done(resp_data)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def open_stream(self, path, query_param=None, api_timeout=None):
+        """
+        Opens a long-lived GET request, such as the server-sent event stream, and returns the
+        unread response so that it can be consumed line by line.
+        """
+        if 'X-Auth-Token' in self._headers:
+            url_kwargs = self._args_with_session('GET', api_timeout)
+        else:
+            url_kwargs = self._args_without_session(path, 'GET', api_timeout)
+        url_kwargs["headers"] = dict(url_kwargs["headers"], Accept='text/event-stream')
+        return open_url(self._build_url(path, query_param=query_param), **url_kwargs)
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
         if self.req_session and not self.x_auth_token:
@@ -228,7 +218,7 @@ class Redfish(object):
         return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
 
 
-class RedfishAnsibleModule(AnsibleModule):
+class RedfishAnsibleModule(PerfStatsMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -253,14 +243,23 @@ class RedfishAnsibleModule(AnsibleModule):
         mutually_exclusive.extend(auth_mutually_exclusive)
         if required_together is None:
             required_together = []
-        required_together.extend(auth_required_together)
         if required_one_of is None:
             required_one_of = []
-        required_one_of.extend(auth_required_one_of)
         if required_by is None:
             required_by = {}
+        fan_out = "targets" in argument_spec
+        if fan_out:
+            argument_spec["baseuri"]["required"] = False
+            mutually_exclusive.append(("baseuri", "targets"))
+            required_one_of.append(("baseuri", "targets"))
+        else:
+            required_together.extend(auth_required_together)
+            required_one_of.extend(auth_required_one_of)
 
         super().__init__(argument_spec, bypass_checks, no_log,
                          mutually_exclusive, required_together,
                          required_one_of, add_file_common_args,
                          supports_check_mode, required_if, required_by)
+        if fan_out:
+            # The credentials of a target may be set on the target instead of the module.
+            check_fanout_options(self, auth_required_one_of, auth_required_together)
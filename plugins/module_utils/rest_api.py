@@ -35,54 +35,8 @@ import os
 from ansible.module_utils.urls import open_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
-
-
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, response):
-        """
-        Initializes a new instance of the class.
-
-        Args:
-            response (object): The response object to read the body from.
-
-        Returns:
-            None
-        """
-        self.body = None
-        self.resp = response
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        """
-        Returns the JSON data parsed from the `body` attribute of the object.
-
-        Returns:
-            dict: The parsed JSON data.
-
-        Raises:
-            ValueError: If the `body` attribute cannot be parsed as JSON.
-        """
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def token_header(self):
-        return self.resp.headers.get('X-Auth-Token')
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import track_request
 
 
 class RestAPI:
@@ -100,6 +54,7 @@ class RestAPI:
         self.protocol = protocol
         self.root_uri = root_uri
         self._headers = basic_headers or {}
+        self.connection_pool = get_transport(module_params)
 
     def __build_url(self, path, query_param=None):
         url = '{0}://{1}:{2}'.format(self.protocol, self.hostname, self.port)
@@ -167,8 +122,13 @@ class RestAPI:
             data = json.dumps(data)
         path = self.root_uri + path
         url = self.__build_url(path, query_param=query_param)
-        resp = open_url(url, data=data, **url_kwargs)
-        resp_data = OpenURLResponse(resp)
+        with track_request(method, url) as trace:
+            if self.connection_pool is not None:
+                resp = self.connection_pool.open_url(url, data=data, **url_kwargs)
+            else:
+                resp = open_url(url, data=data, **url_kwargs)
+            resp_data = OpenURLResponse(resp)
+            trace.done(resp_data)
         return resp_data
 
     def __enter__(self):
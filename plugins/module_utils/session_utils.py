@@ -34,90 +34,14 @@ import os
 from ansible.module_utils.urls import open_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_transport, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import track_request
 from ansible.module_utils.urls import open_url
 from abc import ABC, abstractmethod
 
 HEADER_TYPE = "application/json"
 
 
-class OpenURLResponse():
-    """
-    HTTP response handler class.
-    """
-    def __init__(self, resp):
-        """
-        Initializes a new instance of the class.
-
-        Args:
-            resp (Response): The response object to read the body from.
-
-        Initializes the following instance variables:
-            - body (bytes): The body of the response, or None if the response is None.
-            - resp (Response): The response object.
-
-        If the response is not None, the body is set to the content of the response.
-        """
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        """
-        Returns the JSON data parsed from the `body` attribute of the object.
-
-        :return: The parsed JSON data.
-        :raises ValueError: If the `body` attribute cannot be parsed as JSON.
-        """
-        try:
-            return json.loads(self.body)
-        except ValueError as exc:
-            raise ValueError("Unable to parse json") from exc
-
-    @property
-    def status_code(self):
-        """
-        Get the status code of the response.
-
-        Returns:
-            int: The status code of the response.
-        """
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        """
-        Returns a boolean indicating whether the status code of the response is within the range
-          of 200-299.
-
-        :return: True if the status code is within the range of 200-299, False otherwise.
-        :rtype: bool
-        """
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        """
-        Returns the headers of the response object.
-
-        :return: A dictionary containing the headers of the response object.
-        :rtype: dict
-        """
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        """
-        Get the reason for the response.
-
-        Returns:
-            str: The reason for the response.
-        """
-        return self.resp.reason
-
-
 class SessionAPI():
     """
     Main class for session operations.
@@ -151,6 +75,7 @@ class SessionAPI():
         self.use_proxy = module_params.get("use_proxy", True)
         self.protocol = 'https'
         self.ipaddress = config_ipv6(self.ipaddress)
+        self.connection_pool = get_transport(module_params)
         self.set_headers(module_params)
 
     def set_headers(self, module_params):
@@ -308,8 +233,13 @@ class SessionAPI():
         if data and dump:
             data = json.dumps(data)
         url = self._build_url(uri, query_param=query_param)
-        resp = open_url(url, data=data, **url_kwargs)
-        resp_data = OpenURLResponse(resp)
+        with track_request(method, url) as trace:
+            if self.connection_pool is not None:
+                resp = self.connection_pool.open_url(url, data=data, **url_kwargs)
+            else:
+                resp = open_url(url, data=data, **url_kwargs)
+            resp_data = OpenURLResponse(resp)
+            trace.done(resp_data)
         return resp_data
 
     def _get_omam_ca_env(self):
@@ -0,0 +1,613 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import hashlib
+import json
+import os
+import re
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from io import BytesIO
+from ansible.module_utils.common.text.converters import to_bytes, to_native
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlparse, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible.module_utils.urls import open_url, make_context, basic_auth_header
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import note_retry
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_cache_file, read_cache_file, \
+    write_cache_file, remove_cache_file
+
+KEEP_ALIVE_ENV = "OMAM_HTTP_KEEP_ALIVE"
+POOL_MAXSIZE_ENV = "OMAM_HTTP_POOL_MAXSIZE"
+DEFAULT_CHUNK_SIZE = 64 * 1024
+CASSETTE_ENV = "OMAM_HTTP_CASSETTE"
+CASSETTE_MODE_ENV = "OMAM_HTTP_CASSETTE_MODE"
+REPLAY_LATENCY_ENV = "OMAM_HTTP_REPLAY_LATENCY"
+HTTP_CACHE_ENV = "OMAM_HTTP_CACHE"
+HTTP_CACHE = "http_responses"
+NOT_MODIFIED = 304
+DEFAULT_POOL_MAXSIZE = 4
+MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+HTTP_AGENT = "ansible-httpget"
+# open_url arguments that only the urllib based path knows how to handle.
+UNPOOLED_ARGS = ("client_cert", "client_key", "cookies", "use_gssapi", "unix_socket", "last_mod_time",
+                 "ciphers", "context")
+# Errors raised on a reused keep-alive connection that the server already closed.
+STALE_CONN_ERRORS = (http_client.BadStatusLine, http_client.CannotSendRequest, BrokenPipeError,
+                     ConnectionResetError, ConnectionAbortedError)
+
+# Response headers kept in a cassette, the values of secret ones are redacted.
+CASSETTE_HEADERS = ("Content-Type", "Location", "Retry-After", "ETag", "X-Auth-Token")
+SECRET_HEADERS = ("X-Auth-Token",)
+SECRET_KEY_REGEX = r"(?i)(password|passwd|passphrase|token|secret|community)"
+# Names of secret XML elements and attributes or key=value pairs in the text of responses that are not JSON.
+SECRET_NAME_REGEX = r"[\w.:#-]*(?:password|passwd|passphrase|token|secret|community)[\w.:#-]*"
+SECRET_TEXT_REGEXES = (
+    # <Attribute Name="Users.2#Password">value</Attribute> of a Server Configuration Profile
+    r'(?i)(<(\w+)[^<>]*\bName\s*=\s*"' + SECRET_NAME_REGEX + r'"[^<>]*>)[^<]*(</\2>)',
+    # <Password>value</Password>
+    r"(?i)(<(" + SECRET_NAME_REGEX + r")(?:\s[^<>]*)?>)[^<]*(</\2>)",
+)
+SECRET_ASSIGNMENT_REGEX = r"""(?i)(\b""" + SECRET_NAME_REGEX + r"""\s*=\s*)("[^"]*"|'[^']*'|[^\s"'<>&,;]+)"""
+REDACTED = "********"
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+_cassettes = {}
+
+
+class PooledResponse(object):
+    """Fully read HTTP response, exposes the subset of HTTPResponse used by the clients"""
+
+    def __init__(self, url, status, reason, headers, body):
+        self.url = url
+        self.status = status
+        self.code = status
+        self.reason = reason
+        self.headers = headers
+        self._body = body or b""
+        self._pos = 0
+
+    def read(self, amt=None):
+        # A full read hands out the body that was received instead of a copy of it.
+        end = len(self._body) if amt is None or amt < 0 else min(self._pos + amt, len(self._body))
+        data = self._body if self._pos == 0 and end == len(self._body) else self._body[self._pos:end]
+        self._pos = end
+        return data
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def close(self):
+        self._pos = len(self._body)
+
+
+class OpenURLResponse(object):
+    """
+    Handles HTTPResponse for all the clients.
+    The body is read once and parsed as JSON on the first access to :attr:`json_data`, later accesses
+    return the parsed data. With ``stream`` the body is left unread so that :meth:`write_to` can copy it
+    to a file in chunks.
+    """
+
+    def __init__(self, resp, stream=False):
+        self.body = None
+        self.resp = resp
+        self._json = None
+        self._json_body = None
+        self._unread = bool(self.resp) and stream
+        if self.resp and not stream:
+            self.body = self.resp.read()
+
+    @property
+    def json_data(self):
+        # The parsed data is cached for the body it was parsed from, so assigning a new body reparses.
+        if self._json_body is None or self._json_body is not self.body:
+            try:
+                self._json = json.loads(self.body)
+            except ValueError:
+                raise ValueError("Unable to parse json")
+            self._json_body = self.body
+        return self._json
+
+    @property
+    def raw(self):
+        """Read-only view of the body bytes, without a copy."""
+        return memoryview(self.body or b"")
+
+    def write_to(self, sink, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Writes the body to the file-like sink, reading a streamed response in chunks of chunk_size bytes.
+        :returns: number of bytes written.
+        """
+        if not self._unread:
+            sink.write(self.body or b"")
+            return len(self.body or b"")
+        self._unread = False
+        written = 0
+        chunk = self.resp.read(chunk_size)
+        while chunk:
+            sink.write(chunk)
+            written += len(chunk)
+            chunk = self.resp.read(chunk_size)
+        return written
+
+    @property
+    def status_code(self):
+        return self.resp.getcode()
+
+    @property
+    def success(self):
+        return 200 <= self.status_code <= 299
+
+    @property
+    def headers(self):
+        return self.resp.headers
+
+    @property
+    def reason(self):
+        return self.resp.reason
+
+    @property
+    def token_header(self):
+        return self.resp.headers.get('X-Auth-Token')
+
+
+class ConnectionPool(object):
+    """
+    Keeps idle HTTP(S) connections per host so that consecutive requests
+    reuse one TCP connection and TLS session instead of opening a new one.
+    """
+
+    def __init__(self, maxsize=DEFAULT_POOL_MAXSIZE):
+        """
+        :param maxsize: maximum number of idle connections kept for each host.
+        """
+        self.maxsize = max(int(maxsize), 1)
+        self._idle = {}
+        self._contexts = {}
+        self._lock = threading.Lock()
+
+    def _get_context(self, validate_certs, ca_path):
+        """Builds the SSL context once per certificate setting, loading CA certs is costly."""
+        ctx_key = (validate_certs, ca_path)
+        with self._lock:
+            context = self._contexts.get(ctx_key)
+            if context is None:
+                context = make_context(cafile=ca_path, validate_certs=validate_certs)
+                self._contexts[ctx_key] = context
+        return context
+
+    def _new_connection(self, key, timeout):
+        scheme, host, port, validate_certs, ca_path = key
+        if scheme == "https":
+            return http_client.HTTPSConnection(host, port, timeout=timeout,
+                                               context=self._get_context(validate_certs, ca_path))
+        return http_client.HTTPConnection(host, port, timeout=timeout)
+
+    def _acquire(self, key, timeout):
+        """Returns an idle connection for the host if one is available, else a new one."""
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return self._new_connection(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def idle_count(self, host=None):
+        """Number of idle connections in the pool, optionally for a single host."""
+        with self._lock:
+            return sum(len(conns) for key, conns in self._idle.items() if host is None or key[1] == host)
+
+    def clear(self):
+        """Closes every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _send(self, key, method, selector, body, headers, timeout):
+        conn, reused = self._acquire(key, timeout)
+        try:
+            conn.request(method, selector, body=body, headers=headers)
+            resp = conn.getresponse()
+        except STALE_CONN_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            note_retry()
+            if hasattr(body, "seek"):
+                body.seek(0)
+            conn = self._new_connection(key, timeout)
+            conn.request(method, selector, body=body, headers=headers)
+            resp = conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+        try:
+            resp_body = resp.read()
+        except Exception:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return resp, resp_body
+
+    def open_url(self, url, data=None, headers=None, method=None, use_proxy=True, timeout=10,
+                 validate_certs=True, url_username=None, url_password=None, http_agent=None,
+                 force_basic_auth=False, follow_redirects='urllib2', ca_path=None, **kwargs):
+        """
+        Drop-in replacement of :func:`ansible.module_utils.urls.open_url` for JSON REST calls.
+        Requests that need proxying, client certificates or other urllib features are
+        passed on to ``open_url`` unchanged.
+        :returns: :class:`PooledResponse`
+        :raises HTTPError: for 4xx and 5xx responses, same as ``open_url``.
+        :raises URLError: when the connection could not be established.
+        """
+        parsed = urlparse(url)
+        if (parsed.scheme not in ("http", "https") or any(kwargs.get(arg) for arg in UNPOOLED_ARGS) or
+                (url_username and not force_basic_auth) or (use_proxy and self._uses_proxy(parsed))):
+            return open_url(url, data=data, headers=headers, method=method, use_proxy=use_proxy, timeout=timeout,
+                            validate_certs=validate_certs, url_username=url_username, url_password=url_password,
+                            http_agent=http_agent, force_basic_auth=force_basic_auth,
+                            follow_redirects=follow_redirects, ca_path=ca_path, **kwargs)
+        method = (method or ('POST' if data else 'GET')).upper()
+        req_headers = {"User-Agent": http_agent or HTTP_AGENT}
+        if url_username and force_basic_auth:
+            req_headers["Authorization"] = basic_auth_header(url_username, url_password or "")
+        req_headers.update(headers or {})
+        if not hasattr(data, "read"):
+            data = to_bytes(data, nonstring='passthru')
+        for dummy in range(MAX_REDIRECTS + 1):
+            key = (parsed.scheme, parsed.hostname, parsed.port, validate_certs, ca_path)
+            selector = parsed.path or "/"
+            if parsed.query:
+                selector = "{0}?{1}".format(selector, parsed.query)
+            try:
+                resp, body = self._send(key, method, selector, data, req_headers, timeout)
+            except (socket.error, ssl.SSLError, http_client.HTTPException) as err:
+                raise URLError(err)
+            if resp.status not in REDIRECT_CODES or not resp.getheader("Location"):
+                break
+            if follow_redirects in ('no', 'none', False) or \
+                    (follow_redirects == 'safe' and method not in ('GET', 'HEAD')):
+                break
+            new_url = urljoin(url, resp.getheader("Location"))
+            new_parsed = urlparse(new_url)
+            if new_parsed.hostname != parsed.hostname:
+                req_headers.pop("Authorization", None)
+            if resp.status not in (307, 308):
+                method = 'HEAD' if method == 'HEAD' else 'GET'
+                data = None
+                req_headers.pop("Content-Type", None)
+            url, parsed = new_url, new_parsed
+        if resp.status >= 400 or resp.status in REDIRECT_CODES:
+            raise HTTPError(url, resp.status, to_native(resp.reason), resp.msg, BytesIO(body))
+        return PooledResponse(url, resp.status, resp.reason, resp.msg, body)
+
+    @staticmethod
+    def _uses_proxy(parsed):
+        proxies = getproxies()
+        return bool(proxies.get(parsed.scheme)) and not proxy_bypass(parsed.hostname)
+
+
+def get_connection_pool(maxsize=None):
+    """
+    Returns the connection pool shared by every client in the process.
+    :param maxsize: (optional) idle connections kept per host, applied when the pool is created.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ConnectionPool(maxsize or get_pool_maxsize())
+    return _shared_pool
+
+
+def get_pool_maxsize():
+    try:
+        return int(os.environ.get(POOL_MAXSIZE_ENV, DEFAULT_POOL_MAXSIZE))
+    except ValueError:
+        return DEFAULT_POOL_MAXSIZE
+
+
+def keep_alive_pool(module_params=None):
+    """
+    Returns the shared pool when keep-alive is requested through the module
+    parameter ``keep_alive`` or the OMAM_HTTP_KEEP_ALIVE environment variable, else None.
+    """
+    keep_alive = (module_params or {}).get("keep_alive")
+    if keep_alive is None:
+        keep_alive = os.environ.get(KEEP_ALIVE_ENV, "").lower() in ("1", "true", "yes", "on")
+    if not keep_alive:
+        return None
+    return get_connection_pool()
+
+
+def redact_secrets(data):
+    """
+    Returns a copy of the JSON data with the string values of password, token and secret like keys
+    redacted. Flags and counters such as ``PasswordChangeRequired`` or ``TokenCount`` are kept.
+    """
+    if isinstance(data, dict):
+        return dict((key, REDACTED if re.search(SECRET_KEY_REGEX, key) and isinstance(value, str)
+                     else redact_secrets(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return [redact_secrets(value) for value in data]
+    return data
+
+
+def redact_text_secrets(text):
+    """
+    Returns the text of a response that is not JSON with the values of password, token and secret like
+    XML elements, XML attributes and key=value pairs redacted. Unlike :func:`redact_secrets`, the type of
+    a value is not known in text, so flags such as ``PasswordChangeRequired`` are redacted as well.
+    """
+    for regex in SECRET_TEXT_REGEXES:
+        text = re.sub(regex, lambda match: match.group(1) + REDACTED + match.group(3), text)
+
+    def redact_value(match):
+        quote = match.group(2)[0] if match.group(2)[0] in "\"'" else ""
+        return match.group(1) + quote + REDACTED + quote
+    return re.sub(SECRET_ASSIGNMENT_REGEX, redact_value, text)
+
+
+def _make_headers(items):
+    headers = http_client.HTTPMessage()
+    for key, value in items:
+        headers[key] = value
+    return headers
+
+
+class CassetteTransport(object):
+    """
+    Records the responses of the requests to a cassette file, one JSON line per request, or replays
+    them from the file without contacting the server.
+    In a cassette the request is kept as its method and path only, the response as its status, a subset
+    of the headers, the body and the time it took. Request payloads are never kept and the secrets in
+    JSON responses are redacted. Other text bodies, such as exported Server Configuration Profiles, are
+    kept with the secret XML elements, attributes and key=value pairs redacted, and binary bodies are not
+    kept. Responses are replayed in the recorded order for each method and path, the last one is repeated
+    when a request is sent more often than it was recorded.
+    """
+
+    def __init__(self, cassette, mode="replay", connection_pool=None, latency_scale=1.0):
+        """
+        :param cassette: path of the cassette file.
+        :param mode: ``record`` or ``replay``.
+        :param connection_pool: (optional) :class:`ConnectionPool` the requests are recorded through.
+        :param latency_scale: factor applied to the recorded time of a response on replay, 0 to not wait.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError("Unsupported cassette mode {0}.".format(mode))
+        self.cassette = cassette
+        self.mode = mode
+        self.connection_pool = connection_pool
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._entries = self._load() if mode == "replay" else {}
+
+    def _load(self):
+        entries = {}
+        with open(self.cassette) as cassette:
+            for line in cassette:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries.setdefault((entry["method"], entry["path"]), deque()).append(entry)
+        return entries
+
+    @staticmethod
+    def _request_path(url):
+        parsed = urlparse(url)
+        return "{0}?{1}".format(parsed.path, parsed.query) if parsed.query else parsed.path
+
+    def open_url(self, url, data=None, headers=None, method=None, **kwargs):
+        """
+        Same interface as :meth:`ConnectionPool.open_url`.
+        :returns: :class:`PooledResponse`
+        :raises HTTPError: for a 4xx or 5xx response, recorded or replayed.
+        :raises URLError: on replay when no response was recorded for the request.
+        """
+        method = (method or ('POST' if data else 'GET')).upper()
+        path = self._request_path(url)
+        if self.mode == "record":
+            return self._record(url, method, path, data, headers, kwargs)
+        return self._replay(url, method, path)
+
+    def _record(self, url, method, path, data, headers, kwargs):
+        start = time.time()
+        sender = self.connection_pool.open_url if self.connection_pool is not None else open_url
+        error = None
+        try:
+            resp = sender(url, data=data, headers=headers, method=method, **kwargs)
+            status, reason, resp_headers, body = resp.getcode(), getattr(resp, "reason", ""), resp.headers, resp.read()
+        except HTTPError as err:
+            error = err
+            status, reason, resp_headers, body = err.code, err.reason, err.headers, err.read()
+        self._write(method, path, status, reason, resp_headers, body, time.time() - start)
+        if error is not None:
+            raise HTTPError(url, status, reason, resp_headers, BytesIO(body))
+        return PooledResponse(url, status, reason, resp_headers, body)
+
+    def _write(self, method, path, status, reason, resp_headers, body, elapsed):
+        entry = {"method": method, "path": path, "status": status, "reason": to_native(reason or ""),
+                 "elapsed": round(elapsed, 4), "headers": []}
+        for key in CASSETTE_HEADERS:
+            value = resp_headers.get(key) if resp_headers is not None else None
+            if value is not None:
+                entry["headers"].append([key, REDACTED if key in SECRET_HEADERS else value])
+        try:
+            entry["json"] = redact_secrets(json.loads(body)) if body else None
+        except ValueError:
+            try:
+                entry["text"] = redact_text_secrets(body.decode("utf-8"))
+            except UnicodeDecodeError:
+                entry["body_omitted"] = True
+        with self._lock:
+            with open(self.cassette, "a") as cassette:
+                cassette.write(json.dumps(entry, sort_keys=True) + "\n")
+
+    def _replay(self, url, method, path):
+        with self._lock:
+            recorded = self._entries.get((method, path))
+            if not recorded:
+                raise URLError("No response recorded for {0} {1} in {2}.".format(method, path, self.cassette))
+            entry = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        if self.latency_scale and entry["elapsed"]:
+            time.sleep(entry["elapsed"] * self.latency_scale)
+        if "body_base64" in entry:
+            body = base64.b64decode(entry["body_base64"])
+        elif "text" in entry:
+            body = to_bytes(entry["text"])
+        else:
+            body = to_bytes(json.dumps(entry["json"])) if entry.get("json") is not None else b""
+        resp_headers = _make_headers(entry["headers"])
+        if entry["status"] >= 400:
+            raise HTTPError(url, entry["status"], entry["reason"], resp_headers, BytesIO(body))
+        return PooledResponse(url, entry["status"], entry["reason"], resp_headers, body)
+
+
+def get_cassette_transport(connection_pool=None):
+    """
+    Returns the cassette transport shared by every client in the process when OMAM_HTTP_CASSETTE
+    names a cassette file, else None.
+    OMAM_HTTP_CASSETTE_MODE selects ``record`` or ``replay``, the default, and OMAM_HTTP_REPLAY_LATENCY
+    scales the recorded response times on replay.
+    """
+    cassette = os.environ.get(CASSETTE_ENV)
+    if not cassette:
+        return None
+    mode = os.environ.get(CASSETTE_MODE_ENV, "replay").lower()
+    try:
+        latency_scale = float(os.environ.get(REPLAY_LATENCY_ENV, 1.0))
+    except ValueError:
+        latency_scale = 1.0
+    with _shared_pool_lock:
+        transport = _cassettes.get((cassette, mode))
+        if transport is None:
+            transport = CassetteTransport(cassette, mode, connection_pool, latency_scale)
+            _cassettes[(cassette, mode)] = transport
+    return transport
+
+
+def get_transport(module_params=None):
+    """
+    Returns the object the clients send their requests through: the cassette transport when one is
+    configured, else the keep-alive pool when requested, else None for a plain ``open_url``.
+    """
+    pool = keep_alive_pool(module_params)
+    return get_cassette_transport(pool) or pool
+
+
+def http_cache_enabled():
+    return os.environ.get(HTTP_CACHE_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def _cache_identity(user, headers, kwargs):
+    """
+    Identity a cached response belongs to, the user name, else a digest of the token the request is
+    authenticated with, so that the responses of one user are never answered to another.
+    """
+    user = user or kwargs.get("url_username")
+    if user:
+        return "user:{0}".format(user)
+    token = headers.get("X-Auth-Token") or headers.get("Authorization")
+    return "token:{0}".format(hashlib.sha256(to_bytes(token)).hexdigest()) if token else ""
+
+
+def conditional_get(sender, url, headers=None, user=None, **kwargs):
+    """
+    Sends a GET for url through sender, ``open_url`` or the ``open_url`` of a transport, revalidating
+    the cached response of the host and user with If-None-Match. A 304 response is answered from the cache
+    without a body transfer, a 200 response with an ETag replaces the cache entry. The cache is on disk under
+    OMAM_CACHE_DIR and only holds UTF-8 bodies.
+    :param user: (optional) user name the request is sent as, else the cache entry is of the
+     ``url_username`` or of the token in the headers.
+    :returns: response of sender, or :class:`PooledResponse` with the cached body.
+    """
+    parsed = urlparse(url)
+    path = "{0}?{1}".format(parsed.path, parsed.query) if parsed.query else parsed.path
+    cache_file = get_cache_file(HTTP_CACHE, parsed.netloc, _cache_identity(user, headers or {}, kwargs), path)
+    entry = read_cache_file(cache_file)
+    req_headers = dict(headers or {})
+    if entry:
+        req_headers["If-None-Match"] = entry["etag"]
+    try:
+        resp = sender(url, headers=req_headers, **kwargs)
+    except HTTPError as err:
+        if err.code == NOT_MODIFIED and entry:
+            return _cached_response(url, entry)
+        raise
+    if resp.getcode() == NOT_MODIFIED and entry:
+        return _cached_response(url, entry)
+    body = resp.read()
+    etag = resp.headers.get("ETag") if resp.headers is not None else None
+    try:
+        text = body.decode("utf-8") if etag and resp.getcode() == 200 else None
+    except UnicodeDecodeError:
+        text = None
+    if text is not None:
+        write_cache_file(cache_file, {"etag": etag, "content_type": resp.headers.get("Content-Type"), "body": text})
+    elif entry:
+        remove_cache_file(cache_file)
+    return PooledResponse(url, resp.getcode(), getattr(resp, "reason", ""), resp.headers, body)
+
+
+def _cached_response(url, entry):
+    headers = _make_headers([("ETag", entry["etag"])] +
+                            ([("Content-Type", entry["content_type"])] if entry.get("content_type") else []))
+    return PooledResponse(url, 200, "OK", headers, to_bytes(entry["body"]))
@@ -50,20 +50,50 @@ MANAGER_JOB_ID_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{0}"
 GET_IDRAC_FIRMWARE_VER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion"
 HOSTNAME_REGEX = r"^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$"
 OME_INFO = "ApplicationService/Info"
+OME_API_PREFIX = "/api/"
 ODATA_ID = "@odata.id"
 POWER_CHECK_RETRIES = 30
 POWER_CHECK_INTERVAL = 10
 GET_IDRAC_FIRMWARE_DETAILS_URI_10 = "/redfish/v1/UpdateService/Oem/Dell/DellSoftwareInventory?$select=Members"
 GET_IDRAC_FIRMWARE_URI_10 = "/redfish/v1/UpdateService/Oem/Dell/DellSoftwareInventory"
-
-
+MAX_WORKERS_ENV = "OMAM_MAX_WORKERS"
+DEFAULT_MAX_WORKERS = 1
+DEFAULT_FANOUT_WORKERS = 8
+FANOUT_SUCCESS_MSG = "Successfully fetched the details of {0} out of {1} target(s)."
+TARGET_TIMEOUT_MSG = "Unable to fetch the details of the target within {0} second(s)."
+JOB_POLL_ENV = "OMAM_JOB_POLL"
+ADAPTIVE_POLL_INITIAL_SECS = 2
+ADAPTIVE_POLL_FACTOR = 2
+ADAPTIVE_POLL_MAX_INTERVALS = 12
+ISO_DURATION_REGEX = r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?)?$"
+CACHE_DIR_ENV = "OMAM_CACHE_DIR"
+DEFAULT_CACHE_DIR = "~/.ansible/dellemc_openmanage_cache"
+FILE_CHUNK_SIZE = 1024 * 1024
+SCP_CHUNK_SIZE = 64 * 1024
+REGISTRY_CACHE = "attribute_registries"
+
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
 import time
+import xml.etree.ElementTree as ET
+from bisect import bisect_right
+from email.utils import parsedate_tz, mktime_tz
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from inspect import getfullargspec
+from itertools import chain
 import re
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.common.validation import check_required_one_of, check_required_together
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import get_job_event_listener
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep, record_job_polls
 
 
 def strip_substr_dict(odata_dict, chkstr='@odata.', case_sensitive=False):
@@ -117,10 +147,47 @@ def compress_ipv6(ipv6_long):
     return ipv6_short
 
 
+class IPIntervalIndex(object):
+    """
+    Index of IP addresses, networks and ranges merged into sorted intervals of (version, value) keys,
+    so that looking up an address is a bisect instead of a scan over all the selectors.
+    The selectors are netaddr or ipaddress objects; networks and ranges provide first and last.
+    """
+
+    def __init__(self, selectors):
+        starts, ends = [], []
+        for start, end in sorted(self._interval(selector) for selector in selectors):
+            if ends and start[0] == ends[-1][0] and start[1] <= ends[-1][1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts = starts
+        self._ends = ends
+
+    @staticmethod
+    def _interval(selector):
+        if hasattr(selector, "first"):
+            return (selector.version, selector.first), (selector.version, selector.last)
+        if hasattr(selector, "network_address"):
+            return (selector.version, int(selector.network_address)), \
+                (selector.version, int(selector.broadcast_address))
+        return (selector.version, int(selector)), (selector.version, int(selector))
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __contains__(self, ip):
+        key = (ip.version, int(ip))
+        pos = bisect_right(self._starts, key) - 1
+        return pos >= 0 and key <= self._ends[pos]
+
+
 def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRunStatus', 'Id'),
                  job_complete_states=(2060, 2020, 2090), job_fail_states=(2070, 2101, 2102, 2103),
                  job_running_states=(2050, 2040, 2030, 2100),
-                 sleep_interval_secs=10, max_unresponsive_wait=30, initial_wait=1):
+                 sleep_interval_secs=10, max_unresponsive_wait=30, initial_wait=1, job_event_listener=None,
+                 poll_interval=None):
     '''
     :param rest_obj: the rest_obj either of the below
     ansible_collections.dellemc.openmanage.plugins.module_utils.ome.RestOME
@@ -133,6 +200,10 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     :param sleep_interval_secs:
     :param max_unresponsive_wait:
     :param initial_wait:
+    :param job_event_listener: JobEventListener to wake up on job events instead of sleeping the full
+     interval, by default one is started when SSE job tracking is enabled
+    :param poll_interval: AdaptivePollInterval deciding the wait between polls instead of the constant
+     sleep_interval_secs, by default one is used when OMAM_JOB_POLL is set to adaptive
     :return:
     '''
     # ome_job_status_map = {
@@ -150,40 +221,167 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     if set(job_complete_states) & set(job_fail_states):
         return job_failed, "Overlapping job states found.", job_dict, wait_time
     msg = "Job tracking started."
+    listener = job_event_listener or get_job_event_listener(rest_obj, job_uri, max_job_wait_sec)
+    poll_interval = get_job_poll_interval(sleep_interval_secs, poll_interval)
     time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
-        try:
-            job_resp = rest_obj.invoke_request('GET', job_uri)
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            for x in job_state_var:
-                job_status = job_status.get(x, {})
-            if job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in Failed state."
-                loop_ctr = max_retries
-            if job_running_states:
-                if job_status in job_running_states:
-                    time.sleep(sleep_interval_secs)
-                    wait_time = wait_time + sleep_interval_secs
-            else:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-        except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+    # Polls at the constant interval are bounded by their count, early wakes and adaptive intervals by the time.
+    constant = listener is None and poll_interval is None
+    max_polls = max_retries if constant else float("inf")
+    deadline = None if constant else time.monotonic() + max_job_wait_sec
+    polls = 0
+    try:
+        while loop_ctr < max_polls and wait_time < max_job_wait_sec and _before_deadline(deadline):
+            loop_ctr += 1
+            polls += 1
+            try:
+                job_resp = rest_obj.invoke_request('GET', job_uri)
+                job_dict = job_resp.json_data
+                job_status = job_dict
+                for x in job_state_var:
+                    job_status = job_status.get(x, {})
+                if job_status in job_complete_states:
+                    job_failed = False
+                    msg = "Job tracking completed."
+                    loop_ctr = max_polls
+                elif job_status in job_fail_states:
+                    job_failed = True
+                    msg = "Job is in Failed state."
+                    loop_ctr = max_polls
+                # Event driven and adaptive polls have no count bound, they wait on every state that is not final.
+                if not job_running_states or job_status in job_running_states or \
+                        (not constant and loop_ctr < max_polls):
+                    interval = _next_poll_interval(poll_interval, sleep_interval_secs, job_resp, wait_time,
+                                                   max_job_wait_sec)
+                    wait_time = wait_time + _wait_for_next_poll(listener, interval)
+            except Exception as err:
+                if unresp:
+                    interval = _unresponsive_wait(poll_interval, sleep_interval_secs, err)
+                    time.sleep(interval)
+                    wait_time = wait_time + interval
+                else:
+                    job_failed = True
+                    msg = "Exception in job tracking " + str(err)
+                    break
+                unresp = unresp - 1
+    finally:
+        if listener is not None and job_event_listener is None:
+            listener.close()
+    record_sleep(initial_wait + wait_time)
+    record_job_polls(polls)
+    return job_failed, msg, job_dict, int(round(wait_time))
+
+
+def _before_deadline(deadline):
+    return deadline is None or time.monotonic() < deadline
+
+
+def _wait_for_next_poll(job_event_listener, sleep_interval_secs):
+    """
+    Sleeps until the next job poll and returns the seconds waited.
+    With a job event listener the wait ends early when an event about the job arrives.
+    """
+    if job_event_listener is None:
+        time.sleep(sleep_interval_secs)
+        return sleep_interval_secs
+    start = time.monotonic()
+    job_event_listener.wait(sleep_interval_secs)
+    return time.monotonic() - start
+
+
+class AdaptivePollInterval(object):
+    """
+    Job poll interval that starts short and grows geometrically up to a cap.
+    The interval follows the remaining time estimated from PercentComplete or EstimatedDuration
+    of the job and is never shorter than the Retry-After requested by the server.
+    """
+
+    def __init__(self, initial_secs=ADAPTIVE_POLL_INITIAL_SECS, factor=ADAPTIVE_POLL_FACTOR, max_secs=120):
+        self.initial_secs = initial_secs
+        self.factor = factor
+        self.max_secs = max(max_secs, initial_secs)
+        self._interval = initial_secs
+
+    def next_interval(self, job_dict=None, retry_after=None, elapsed=0):
+        """
+        :param job_dict: last job response, used for the remaining time estimate.
+        :param retry_after: seconds from the Retry-After response header.
+        :param elapsed: seconds the job has been tracked so far.
+        :return: seconds to wait before the next poll.
+        """
+        interval = self._interval
+        self._interval = min(self._interval * self.factor, self.max_secs)
+        remaining = estimate_job_remaining_secs(job_dict or {}, elapsed)
+        if remaining is not None:
+            interval = min(max(remaining, self.initial_secs), self.max_secs)
+        if retry_after:
+            interval = max(interval, retry_after)
+        return int(math.ceil(interval))
+
+
+def get_job_poll_interval(sleep_interval_secs, poll_interval=None):
+    """
+    Returns the given poll interval, or an AdaptivePollInterval capped at a multiple of
+    sleep_interval_secs when OMAM_JOB_POLL is set to adaptive, else None for constant polling.
+    """
+    if poll_interval is not None:
+        return poll_interval
+    if os.environ.get(JOB_POLL_ENV, "").lower() != "adaptive":
+        return None
+    return AdaptivePollInterval(initial_secs=min(ADAPTIVE_POLL_INITIAL_SECS, sleep_interval_secs),
+                                max_secs=sleep_interval_secs * ADAPTIVE_POLL_MAX_INTERVALS)
+
+
+def estimate_job_remaining_secs(job_dict, elapsed):
+    """
+    Estimates the seconds left for a job from its PercentComplete progress or
+    its ISO 8601 EstimatedDuration, returns None when neither is usable.
+    """
+    percent = job_dict.get("PercentComplete")
+    if isinstance(percent, (int, float)) and 0 < percent < 100 and elapsed > 0:
+        return elapsed * (100 - percent) / percent
+    duration = parse_iso_duration(job_dict.get("EstimatedDuration"))
+    if duration is not None and duration > elapsed:
+        return duration - elapsed
+    return None
+
+
+def parse_iso_duration(duration):
+    """Converts an ISO 8601 duration such as PT1H30M to seconds, None when it is not one."""
+    if not isinstance(duration, str):
+        return None
+    match = re.match(ISO_DURATION_REGEX, duration)
+    if not match or duration in ("P", "PT"):
+        return None
+    days, hours, minutes, seconds = [float(val or 0) for val in match.groups()]
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def get_retry_after(headers):
+    """Returns the seconds requested by a Retry-After header in delay or HTTP-date form, else None."""
+    value = headers.get("Retry-After") if headers is not None else None
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(int(mktime_tz(date) - time.time()), 0)
+
+
+def _next_poll_interval(poll_interval, sleep_interval_secs, job_resp, wait_time, max_job_wait_sec):
+    if poll_interval is None:
+        return sleep_interval_secs
+    headers = getattr(getattr(job_resp, "resp", None), "headers", None)
+    interval = poll_interval.next_interval(job_resp.json_data, get_retry_after(headers), wait_time)
+    return max(min(interval, max_job_wait_sec - wait_time), 1)
+
+
+def _unresponsive_wait(poll_interval, sleep_interval_secs, err):
+    if poll_interval is None or not isinstance(err, HTTPError):
+        return sleep_interval_secs
+    return max(sleep_interval_secs, get_retry_after(err.headers) or 0)
 
 
 def idrac_redfish_job_tracking(
@@ -192,7 +390,8 @@ def idrac_redfish_job_tracking(
         job_fail_states=("Failed", "RebootFailed", "Unknown"),
         job_running_states=("Running", "RebootPending", "Scheduling", "Scheduled", "Downloading", "Waiting", "Paused",
                             "New", "PendingActivation", "ReadyForExecution"),
-        sleep_interval_secs=10, max_unresponsive_wait=30, initial_wait=1):
+        sleep_interval_secs=10, max_unresponsive_wait=30, initial_wait=1, job_event_listener=None,
+        poll_interval=None):
     # idrac_redfish_job_sates = [ "New", "Scheduled", "Running", "Completed", "Downloading", "Downloaded",
     # "Scheduling", "ReadyForExecution", "Waiting", "Paused", "Failed", "CompletedWithErrors", "RebootPending",
     # "RebootFailed", "RebootCompleted", "PendingActivation", "Unknown"]
@@ -205,38 +404,55 @@ def idrac_redfish_job_tracking(
     if set(job_complete_states) & set(job_fail_states):
         return job_failed, "Overlapping job states found.", job_dict, wait_time
     msg = "Job tracking started."
+    listener = job_event_listener or get_job_event_listener(rest_obj, job_uri, max_job_wait_sec)
+    poll_interval = get_job_poll_interval(sleep_interval_secs, poll_interval)
     time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
-        try:
-            job_resp = rest_obj.invoke_request(job_uri, 'GET')
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            job_status = job_status.get(job_state_var, "Unknown")
-            if job_status in job_running_states:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            elif job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in {0} state.".format(job_status)
-                loop_ctr = max_retries
-            else:  # unrecognised states, just wait
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-        except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+    # Polls at the constant interval are bounded by their count, early wakes and adaptive intervals by the time.
+    constant = listener is None and poll_interval is None
+    max_polls = max_retries if constant else float("inf")
+    deadline = None if constant else time.monotonic() + max_job_wait_sec
+    polls = 0
+    try:
+        while loop_ctr < max_polls and wait_time < max_job_wait_sec and _before_deadline(deadline):
+            loop_ctr += 1
+            polls += 1
+            try:
+                job_resp = rest_obj.invoke_request(job_uri, 'GET')
+                job_dict = job_resp.json_data
+                job_status = job_dict
+                job_status = job_status.get(job_state_var, "Unknown")
+                if job_status in job_running_states:
+                    interval = _next_poll_interval(poll_interval, sleep_interval_secs, job_resp, wait_time,
+                                                   max_job_wait_sec)
+                    wait_time = wait_time + _wait_for_next_poll(listener, interval)
+                elif job_status in job_complete_states:
+                    job_failed = False
+                    msg = "Job tracking completed."
+                    loop_ctr = max_polls
+                elif job_status in job_fail_states:
+                    job_failed = True
+                    msg = "Job is in {0} state.".format(job_status)
+                    loop_ctr = max_polls
+                else:  # unrecognised states, just wait
+                    interval = sleep_interval_secs if constant else _next_poll_interval(
+                        poll_interval, sleep_interval_secs, job_resp, wait_time, max_job_wait_sec)
+                    wait_time = wait_time + _wait_for_next_poll(listener, interval)
+            except Exception as err:
+                if unresp:
+                    interval = _unresponsive_wait(poll_interval, sleep_interval_secs, err)
+                    time.sleep(interval)
+                    wait_time = wait_time + interval
+                else:
+                    job_failed = True
+                    msg = "Exception in job tracking " + str(err)
+                    break
+                unresp = unresp - 1
+    finally:
+        if listener is not None and job_event_listener is None:
+            listener.close()
+    record_sleep(initial_wait + wait_time)
+    record_job_polls(polls)
+    return job_failed, msg, job_dict, int(round(wait_time))
 
 
 def get_rest_items(rest_obj, uri="DeviceService/Devices", key="Id", value="Identifier", selector="value"):
@@ -279,19 +495,23 @@ def wait_for_job_completion(redfish_obj, uri, job_wait=True, wait_timeout=120, s
                 sleep_interval = max_sleep_time
                 max_sleep_time = 0
             time.sleep(sleep_interval)
+            record_sleep(sleep_interval)
             job_resp = redfish_obj.invoke_request("GET", uri)
             if job_resp.json_data.get("PercentComplete") == 100:
                 time.sleep(10)
+                record_sleep(10)
                 return job_resp, ""
     else:
         job_resp = redfish_obj.invoke_request("GET", uri)
         time.sleep(10)
+        record_sleep(10)
         return job_resp, ""
     return {}, "The job is not complete after {0} seconds.".format(wait_timeout)
 
 
 def wait_after_idrac_reset(idrac, wait_time_sec, interval=30):
     time.sleep(interval // 2)
+    record_sleep(interval // 2)
     msg = RESET_UNTRACK
     wait = wait_time_sec
     track_failed = True
@@ -299,11 +519,13 @@ def wait_after_idrac_reset(idrac, wait_time_sec, interval=30):
         try:
             idrac.invoke_request(MANAGERS_URI, 'GET')
             time.sleep(interval // 2)
+            record_sleep(interval // 2)
             msg = RESET_SUCCESS
             track_failed = False
             break
         except Exception:
             time.sleep(interval)
+            record_sleep(interval)
             wait = wait - interval
     return track_failed, msg
 
@@ -347,16 +569,20 @@ def wait_for_idrac_job_completion(idrac, uri, job_wait=True, wait_timeout=120, s
                 sleep_interval = max_sleep_time
                 max_sleep_time = 0
             time.sleep(sleep_interval)
+            record_sleep(sleep_interval)
             job_resp = idrac.invoke_request(uri, "GET")
             if job_resp.json_data.get("PercentComplete") == 100:
                 time.sleep(10)
+                record_sleep(10)
                 return job_resp, ""
             if job_resp.json_data.get("JobState") == "RebootFailed":
                 time.sleep(10)
+                record_sleep(10)
                 return job_resp, job_msg
     else:
         job_resp = idrac.invoke_request(uri, "GET")
         time.sleep(10)
+        record_sleep(10)
         return job_resp, ""
     return {}, "The job is not complete after {0} seconds.".format(wait_timeout)
 
@@ -367,6 +593,7 @@ def idrac_system_reset(idrac, res_id, payload=None, job_wait=True, wait_time_sec
     try:
         idrac.invoke_request(SYSTEM_RESET_URI.format(res_id=res_id), 'POST', data=payload)
         time.sleep(10)
+        record_sleep(10)
         if wait_time_sec:
             resp = idrac.invoke_request(MANAGER_JOB_URI, "GET")
             job = list(filter(lambda d: d["JobState"] in ["RebootPending"], resp.json_data["Members"]))
@@ -398,6 +625,11 @@ def get_system_res_id(idrac):
     return res_id, error_msg
 
 
+def get_api_path(uri):
+    """Returns the path of an OME resource link, such as '@odata.nextLink', relative to the /api base URI."""
+    return uri[len(OME_API_PREFIX):] if uri.startswith(OME_API_PREFIX) else uri.lstrip("/")
+
+
 def get_all_data_with_pagination(ome_obj, uri, query_param=None):
     """To get all the devices with pagination based on the filter provided."""
     query, resp, report_list = "", None, []
@@ -409,7 +641,7 @@ def get_all_data_with_pagination(ome_obj, uri, query_param=None):
             for k, v in query_param.items():
                 query += "{0}={1}".format(k, v.replace(" ", "%20"))
         while next_uri is not None:
-            next_uri_query = "{0}&{1}".format(next_uri.strip("/api"), query) if query else next_uri.strip("/api")
+            next_uri_query = "{0}&{1}".format(get_api_path(next_uri), query) if query else get_api_path(next_uri)
             resp = ome_obj.invoke_request('GET', next_uri_query)
             report_list.extend(resp.json_data.get("value"))
             next_uri = resp.json_data.get("@odata.nextLink", None)
@@ -418,6 +650,402 @@ def get_all_data_with_pagination(ome_obj, uri, query_param=None):
     return {"resp_obj": resp, "report_list": report_list}
 
 
+def iter_data_with_pagination(ome_obj, uri, query_param=None):
+    """
+    Generator variant of get_all_data_with_pagination, yields the items page by page
+    while following '@odata.nextLink', so only one page is held in memory at a time.
+    """
+    query = ""
+    if query_param is not None:
+        for k, v in query_param.items():
+            query += "{0}={1}".format(k, v.replace(" ", "%20"))
+    next_uri = uri
+    while next_uri is not None:
+        data = ome_obj.invoke_request('GET', next_uri, query_param=query_param).json_data
+        next_uri = data.get("@odata.nextLink", None)
+        if next_uri is not None:
+            next_uri = "{0}&{1}".format(get_api_path(next_uri), query) if query else get_api_path(next_uri)
+        query_param = None
+        for item in data.get("value") or []:
+            yield item
+
+
+def get_max_workers(module_params=None):
+    """
+    Number of concurrent requests a client may issue, from the module parameter ``max_workers``
+    or the OMAM_MAX_WORKERS environment variable. The default of 1 sends the requests sequentially.
+    """
+    max_workers = (module_params or {}).get("max_workers")
+    if max_workers is None:
+        try:
+            max_workers = int(os.environ.get(MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS))
+        except ValueError:
+            max_workers = DEFAULT_MAX_WORKERS
+    return max(int(max_workers), 1)
+
+
+_map_worker = threading.local()
+
+
+def concurrent_map(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Applies func to each of the items using a bounded thread pool.
+    A concurrent_map called from func runs sequentially, so that nested maps, such as the resources
+    of each target of a fan-out, do not multiply the number of concurrent requests beyond max_workers.
+    :param func: callable taking one item
+    :param items: iterable of items
+    :param max_workers: maximum number of threads, 1 runs sequentially
+    :return: list of results in the order of items, the first exception raised by func is re-raised
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1 or getattr(_map_worker, "active", False):
+        return [func(item) for item in items]
+
+    def run_item(item):
+        _map_worker.active = True
+        try:
+            return func(item)
+        finally:
+            _map_worker.active = False
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(run_item, items))
+
+
+class ResourceFetcher(object):
+    """
+    Fetches each Redfish resource once per run, a request for a URI that is in flight on another
+    thread waits for that response instead of sending the request again.
+    """
+
+    def __init__(self, idrac, max_workers=DEFAULT_MAX_WORKERS, missing_codes=(400, 404)):
+        """
+        :param idrac: iDRACRedfishAPI client.
+        :param max_workers: maximum number of concurrent requests of :meth:`map`.
+        :param missing_codes: HTTP status codes for which a resource is returned as None, other errors
+         are raised.
+        """
+        self.idrac = idrac
+        self.max_workers = max_workers
+        self.missing_codes = missing_codes
+        self._responses = {}
+        self._uri_locks = {}
+        self._lock = threading.Lock()
+
+    def get(self, uri):
+        """:return: JSON of the resource, None when the resource is not available."""
+        with self._lock:
+            uri_lock = self._uri_locks.setdefault(uri, threading.Lock())
+        with uri_lock:
+            if uri not in self._responses:
+                try:
+                    self._responses[uri] = self.idrac.invoke_request(uri, "GET").json_data
+                except HTTPError as err:
+                    if err.code not in self.missing_codes:
+                        raise
+                    self._responses[uri] = None
+            return self._responses[uri]
+
+    def map(self, func, items):
+        return concurrent_map(func, items, self.max_workers)
+
+
+class TargetExit(Exception):
+    """Carries the result of one target of a fan-out, raised instead of exiting the module."""
+
+    def __init__(self, result):
+        super(TargetExit, self).__init__(result.get("msg"))
+        self.result = result
+
+
+class TargetModule(object):
+    """
+    Stands in for the module while one target of a fan-out runs, the parameters are
+    those of the target and exit_json or fail_json end only the target.
+    """
+
+    def __init__(self, module, params):
+        self._module = module
+        self.params = params
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+    def exit_json(self, **kwargs):
+        raise TargetExit(kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs.update(msg=msg, failed=True)
+        raise TargetExit(kwargs)
+
+
+def fanout_argument_spec(auth_spec, host_key):
+    """
+    Argument spec of the targets, max_workers and target_timeout options, the suboptions of a target
+    are the connection options in auth_spec without their defaults. The connection options of the
+    module are not required, as each target may set them, see :func:`check_fanout_options`.
+    """
+    target_options = {}
+    for key, spec in auth_spec.items():
+        target_options[key] = dict((attr, val) for attr, val in spec.items()
+                                   if attr not in ("required", "default", "fallback"))
+    target_options[host_key]["required"] = True
+    spec = dict((key, dict((attr, val) for attr, val in spec.items() if attr != "required"))
+                for key, spec in auth_spec.items() if spec.get("required"))
+    spec.update({"targets": {"type": "list", "elements": "dict", "options": target_options},
+                 "max_workers": {"type": "int"}, "target_timeout": {"type": "int"}})
+    return spec
+
+
+def check_fanout_options(module, required_one_of=None, required_together=None):
+    """
+    Fails the module unless each target, or the module when it has no targets, has the required
+    connection options, a target takes the options of the module that it does not set.
+    """
+    targets = module.params.get("targets")
+    for target in targets or [{}]:
+        params = dict((key, val) for key, val in chain(module.params.items(), target.items()) if val is not None)
+        try:
+            check_required_one_of(required_one_of, params, ["targets"] if targets else None)
+            check_required_together(required_together, params, ["targets"] if targets else None)
+        except TypeError as err:
+            module.fail_json(msg=str(err))
+
+
+def fan_out(func, module, host_key):
+    """
+    Runs func once for each of the targets of the module concurrently, up to max_workers targets
+    at a time. A target that does not complete within target_timeout seconds is reported as failed,
+    its thread is left to end on its own.
+    :param func: callable taking a module, it reports the result with exit_json or fail_json
+    :param module: module with the targets option
+    :param host_key: target option holding the host
+    :return: dict of the result of each target keyed by its host
+    """
+    base_params = dict((key, val) for key, val in module.params.items()
+                       if key not in ("targets", "max_workers", "target_timeout"))
+    target_timeout = module.params.get("target_timeout")
+
+    def run_target(target):
+        params = dict(base_params)
+        params.update((key, val) for key, val in target.items() if val is not None)
+        try:
+            func(TargetModule(module, params))
+        except TargetExit as exit_result:
+            return exit_result.result
+        except Exception as err:
+            return {"msg": str(err), "failed": True}
+        return {}
+
+    def run_target_with_deadline(target):
+        if not target_timeout:
+            return run_target(target)
+        results = []
+
+        def run_worker():
+            _map_worker.active = True
+            results.append(run_target(target))
+        worker = threading.Thread(target=run_worker)
+        worker.daemon = True
+        worker.start()
+        worker.join(target_timeout)
+        if worker.is_alive():
+            return {"msg": TARGET_TIMEOUT_MSG.format(target_timeout), "failed": True}
+        return results[0]
+
+    targets = module.params["targets"]
+    max_workers = max(module.params.get("max_workers") or DEFAULT_FANOUT_WORKERS, 1)
+    results = concurrent_map(run_target_with_deadline, targets, max_workers)
+    return dict((target[host_key], result) for target, result in zip(targets, results))
+
+
+def exit_fan_out(func, module, host_key):
+    """Queries every target with func and exits the module with the results keyed by host."""
+    results = fan_out(func, module, host_key)
+    success_count = len([result for result in results.values() if not result.get("failed") and
+                         not result.get("unreachable")])
+    module.exit_json(msg=FANOUT_SUCCESS_MSG.format(success_count, len(results)), results=results)
+
+
+def file_sha256(file_path, chunk_size=FILE_CHUNK_SIZE):
+    """Returns the SHA-256 hex digest of the file, read in chunks so that large files are not held in memory."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file_obj:
+        for chunk in iter(lambda: file_obj.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_cache_file(namespace, *key_parts):
+    """
+    Returns the path of the on-disk cache entry of the key made of key_parts, under the
+    namespace directory of the OMAM_CACHE_DIR environment variable or of the default cache directory.
+    """
+    cache_dir = os.path.expanduser(os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+    key = json.dumps([str(part) for part in key_parts]).encode("utf-8")
+    return os.path.join(cache_dir, namespace, "{0}.json".format(hashlib.sha256(key).hexdigest()))
+
+
+def read_cache_file(cache_file):
+    """Returns the data of the cache entry, None when it is missing or unreadable."""
+    try:
+        with open(cache_file) as file_obj:
+            return json.load(file_obj)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def write_cache_file(cache_file, data):
+    """
+    Writes the cache entry atomically and readable only by the user. The cache is best
+    effort, so a failure to write is ignored.
+    :return: True when the entry was written
+    """
+    tmp_file = None
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as file_obj:
+            json.dump(data, file_obj)
+        os.replace(tmp_file, cache_file)
+        return True
+    except (IOError, OSError, TypeError, ValueError):
+        if tmp_file is not None and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        return False
+
+
+def remove_cache_file(cache_file):
+    """Removes the cache entry if it exists."""
+    try:
+        os.remove(cache_file)
+    except OSError:
+        pass
+
+
+def get_registry_index(attributes, value_key="ValueName", readonly_key="ReadOnly"):
+    """
+    Compiles the attribute entries of an attribute registry into a lookup index keyed by attribute
+    name with the type, the read only flag, the enumeration values and the integer bounds.
+    :param value_key: key of the enumeration values to be compared, ValueName or ValueDisplayName.
+    :param readonly_key: key of the read only flag in the registry, ReadOnly or Readonly.
+    """
+    index = {}
+    for attr in attributes:
+        entry = {"Type": attr.get("Type"), "ReadOnly": bool(attr.get(readonly_key))}
+        if entry["Type"] == "Enumeration":
+            entry["Values"] = [val.get(value_key) for val in attr.get("Value", [])]
+        elif entry["Type"] == "Integer":
+            entry["LowerBound"] = attr.get("LowerBound")
+            entry["UpperBound"] = attr.get("UpperBound")
+        index[attr["AttributeName"]] = entry
+    return index
+
+
+def get_cached_registry(idrac, version_uri, version_key, fetch_registry, *registry_key):
+    """
+    Returns the registry data from the on-disk cache entry keyed by the model and the firmware version
+    of the resource at version_uri and by registry_key. When the entry is missing, the data is fetched
+    with fetch_registry and cached if it is not empty. The cache is skipped if the version is not known.
+    """
+    try:
+        resource = idrac.invoke_request(version_uri, "GET").json_data
+        key_parts = [resource["Model"], resource[version_key]] + list(registry_key)
+    except (HTTPError, URLError, KeyError, TypeError, ValueError, AttributeError):
+        return fetch_registry()
+    cache_file = get_cache_file(REGISTRY_CACHE, *key_parts)
+    registry = read_cache_file(cache_file)
+    if registry is None:
+        registry = fetch_registry()
+        if registry:
+            write_cache_file(cache_file, registry)
+    return registry
+
+
+def _read_chunks(source, chunk_size=FILE_CHUNK_SIZE):
+    if not hasattr(source, "read"):
+        yield source
+        return
+    for chunk in iter(lambda: source.read(chunk_size), source.read(0)):
+        yield chunk
+
+
+def _iter_scp_json(scp, fqdds, parents):
+    stack = [(comp, None, False) for comp in reversed(scp["SystemConfiguration"].get("Components", []))]
+    while stack:
+        comp, parent, parent_selected = stack.pop()
+        fqdd = comp.get("FQDD")
+        selected = fqdds is None or parent_selected or fqdd in fqdds
+        if selected:
+            if parents is not None:
+                parents[fqdd] = parent
+            for attr in comp.get("Attributes", []):
+                value = attr.get("Value")
+                yield fqdd, attr.get("Name"), "" if value is None else str(value)
+        stack.extend((child, fqdd, selected) for child in reversed(comp.get("Components", [])))
+
+
+def _iter_scp_xml(chunks, fqdds, parents):
+    parser = ET.XMLPullParser(events=("start", "end"))
+    elements, components = [], []
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                if elem.tag == "Component":
+                    parent = components[-1] if components else (None, False)
+                    fqdd = elem.get("FQDD")
+                    selected = fqdds is None or parent[1] or fqdd in fqdds
+                    if selected and parents is not None:
+                        parents[fqdd] = parent[0]
+                    components.append((fqdd, selected))
+                elements.append(elem)
+                continue
+            elements.pop()
+            if elem.tag == "Component":
+                components.pop()
+            elif elem.tag == "Attribute" and components and components[-1][1]:
+                yield components[-1][0], elem.get("Name"), elem.text or ""
+            if elements:
+                elements[-1].remove(elem)
+    parser.close()
+
+
+def iter_scp_attributes(scp, fqdds=None, parents=None, scp_format=None):
+    """
+    Yields the (FQDD, attribute name, value) of the attributes of a Server Configuration Profile.
+    An XML profile is parsed incrementally and each element is released once it is parsed, so a
+    profile read from a file object is never held in memory. Commented attributes are skipped.
+    :param scp: XML or JSON profile as a file object, a str or bytes buffer, or a loaded JSON dict.
+    :param fqdds: FQDDs of the components to be yielded along with their nested components, all if None.
+    :param parents: dict to be updated with the parent FQDD, or None, of each yielded component.
+    :param scp_format: XML or JSON, detected from the content if None.
+    """
+    if fqdds is not None:
+        fqdds = set(fqdds)
+    if isinstance(scp, dict):
+        for attribute in _iter_scp_json(scp, fqdds, parents):
+            yield attribute
+        return
+    chunks = _read_chunks(scp, SCP_CHUNK_SIZE)
+    head = []
+    for chunk in chunks:
+        head.append(chunk)
+        if chunk.strip():
+            break
+    content = head[-1].strip() if head else ""
+    if scp_format is None:
+        scp_format = "JSON" if content[:1] in ("{", b"{") else "XML"
+    if scp_format == "JSON":
+        rest = head + list(chunks)
+        scp = json.loads(rest[0][:0].join(rest))
+        for attribute in _iter_scp_json(scp, fqdds, parents):
+            yield attribute
+        return
+    for attribute in _iter_scp_xml(chain(head, chunks), fqdds, parents):
+        yield attribute
+
+
 def remove_key(data, regex_pattern='@odata.'):
     '''
     :param data: the dict/list to be stripped of unwanted keys
@@ -444,6 +1072,7 @@ def wait_for_redfish_reboot_job(redfish_obj, res_id, payload=None, wait_time_sec
     try:
         resp = redfish_obj.invoke_request('POST', SYSTEM_RESET_URI.format(res_id=res_id), data=payload, api_timeout=120)
         time.sleep(10)
+        record_sleep(10)
         if wait_time_sec and resp.status_code == 204:
             resp = redfish_obj.invoke_request("GET", MANAGER_JOB_URI)
             reboot_job_lst = list(filter(lambda d: (d["JobType"] in ["RebootNoForce"]), resp.json_data["Members"]))
@@ -470,15 +1099,19 @@ def wait_for_redfish_job_complete(redfish_obj, job_uri, job_wait=True, wait_time
                 sleep_interval = max_sleep_time
                 max_sleep_time = 0
             time.sleep(sleep_interval)
+            record_sleep(sleep_interval)
             job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
             if job_resp.json_data.get("PercentComplete") == 100:
                 time.sleep(10)
+                record_sleep(10)
                 return job_resp, ""
             if job_resp.json_data.get("JobState") == "RebootFailed":
                 time.sleep(10)
+                record_sleep(10)
                 return job_resp, job_msg
     else:
         time.sleep(10)
+        record_sleep(10)
         job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
         return job_resp, ""
     return job_resp, job_msg
@@ -583,6 +1216,7 @@ def wait_for_lc_status(idrac, job_wait_timeout=300, resource_id=None, interval=1
     waiting_before_lc_status_check = 12 * interval
     if job_wait_timeout >= waiting_before_lc_status_check:
         time.sleep(waiting_before_lc_status_check)
+        record_sleep(waiting_before_lc_status_check)
         job_wait_timeout = job_wait_timeout - waiting_before_lc_status_check
     max_idrac_reset_try = job_wait_timeout // interval
     uri, error_msg = validate_and_get_first_resource_id_uri(resource_id, idrac, MANAGERS_URI)
@@ -605,9 +1239,11 @@ def wait_for_lc_status(idrac, job_wait_timeout=300, resource_id=None, interval=1
                 lc_status_completed = True
                 break
             time.sleep(interval)
+            record_sleep(interval)
             retry_count = retry_count + 1
         except URLError:
             time.sleep(interval)
+            record_sleep(interval)
             retry_count = retry_count + 1
             if retry_count == max_idrac_reset_try:
                 error_msg = LC_STATUS_MSG.format(lc_status='unreachable', retries=max_idrac_reset_try)
@@ -696,6 +1332,7 @@ def track_power_state(idrac, base_uri, desired_state, retries=POWER_CHECK_RETRIE
             break
         else:
             time.sleep(interval)
+            record_sleep(interval)
         count = count - 1
     else:
         achieved = False
@@ -744,6 +1381,7 @@ def reset_host(idrac, restart_type, system_uri, base_uri):
         p_state = "On"
         if not state_achieved:
             time.sleep(10)
+            record_sleep(10)
             p_state = "ForceRestart"
     p_act = power_act_host(idrac, system_uri, p_state)
     if not p_act:
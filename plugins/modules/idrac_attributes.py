@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2022-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -23,6 +23,7 @@ description:
   - This module allows to configure the iDRAC attributes.
 extends_documentation_fragment:
   - dellemc.openmanage.idrac_x_auth_options
+  - dellemc.openmanage.disk_cache_options
 options:
   idrac_attributes:
     type: dict
@@ -61,6 +62,14 @@ options:
   resource_id:
     type: str
     description: Redfish ID of the resource.
+  registry_cache:
+    type: bool
+    description:
+      - Whether to cache the manager attribute registry on the disk to validate the attributes.
+      - If C(true), the registry is read from the cache entry of the iDRAC model and firmware version, and is
+        downloaded only when the entry is not found.
+    default: false
+    version_added: 9.9.0
 requirements:
   - "python >= 3.9.6"
 author:
@@ -263,7 +272,8 @@ import re
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_manager_res_id
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_manager_res_id, get_registry_index, \
+    get_cached_registry
 
 
 SUCCESS_MSG = "Successfully updated the attributes."
@@ -276,6 +286,7 @@ LC_ID = "LifecycleController.Embedded.1"
 MANAGERS_URI = "/redfish/v1/Managers"
 ATTR = "Attributes"
 JOB_URI = "/redfish/v1/Managers/{manager_id}/Jobs/{job_id}"
+MANAGER_VERSION_URI = "{0}/{1}?$select=Model,FirmwareVersion"
 
 
 def xml_data_conversion(attrbite, fqdd=None):
@@ -369,19 +380,25 @@ def get_response_attr(idrac, idrac_id, attr, uri_dict):
     return diff, response_attr
 
 
-def get_attributes_registry(idrac):
-    reggy = {}
-    try:
-        resp = idrac.invoke_request("/redfish/v1/Registries/ManagerAttributeRegistry", "GET")
-        loc_list = resp.json_data.get("Location", [])
-        if loc_list:
-            reg_json_uri = loc_list[-1].get("Uri")
-            reg_resp = idrac.invoke_request(reg_json_uri, "GET")
-            attr_list = reg_resp.json_data.get("RegistryEntries").get("Attributes")
-            reggy = dict((x["AttributeName"], x) for x in attr_list)
-    except Exception:
+def get_attributes_registry(idrac, res_id=MANAGER_ID, registry_cache=False):
+    def fetch_registry():
         reggy = {}
-    return reggy
+        try:
+            resp = idrac.invoke_request("/redfish/v1/Registries/ManagerAttributeRegistry", "GET", cache=True)
+            loc_list = resp.json_data.get("Location", [])
+            if loc_list:
+                reg_json_uri = loc_list[-1].get("Uri")
+                reg_resp = idrac.invoke_request(reg_json_uri, "GET", cache=True)
+                attr_list = reg_resp.json_data.get("RegistryEntries").get("Attributes")
+                reggy = get_registry_index(attr_list, value_key="ValueDisplayName", readonly_key="Readonly")
+        except Exception:
+            reggy = {}
+        return reggy
+    if registry_cache:
+        version_uri = MANAGER_VERSION_URI.format(MANAGERS_URI, res_id)
+        return get_cached_registry(idrac, version_uri, "FirmwareVersion", fetch_registry,
+                                   "ManagerAttributeRegistry")
+    return fetch_registry()
 
 
 def validate_vs_registry(registry, attr_dict):
@@ -389,17 +406,12 @@ def validate_vs_registry(registry, attr_dict):
     for k, v in attr_dict.items():
         if k in registry:
             val_dict = registry.get(k)
-            if val_dict.get("Readonly"):
+            if val_dict.get("ReadOnly"):
                 invalid[k] = "Read only Attribute cannot be modified."
             else:
                 type = val_dict.get("Type")
                 if type == "Enumeration":
-                    found = False
-                    for val in val_dict.get("Value", []):
-                        if v == val.get("ValueDisplayName"):
-                            found = True
-                            break
-                    if not found:
+                    if v not in val_dict.get("Values", []):
                         invalid[k] = "Invalid value for Enumeration."
                 if type == "Integer":
                     try:
@@ -431,7 +443,7 @@ def fetch_idrac_uri_attr(idrac, module, res_id):
         system_attr = module.params.get("system_attributes")
         lc_attr = module.params.get("lifecycle_controller_attributes")
         invalid = {}
-        attr_registry = get_attributes_registry(idrac)
+        attr_registry = get_attributes_registry(idrac, res_id, module.params.get("registry_cache"))
         if idrac_attr is not None:
             x, idrac_response_attr = get_response_attr(idrac, MANAGER_ID, idrac_attr, uri_dict)
             invalid.update(validate_vs_registry(attr_registry, idrac_response_attr))
@@ -493,7 +505,8 @@ def main():
         "idrac_attributes": {"required": False, "type": 'dict'},
         "system_attributes": {"required": False, "type": 'dict'},
         "lifecycle_controller_attributes": {"required": False, "type": 'dict'},
-        "resource_id": {"required": False, "type": 'str'}
+        "resource_id": {"required": False, "type": 'str'},
+        "registry_cache": {"required": False, "type": 'bool', "default": False}
     }
 
     module = IdracAnsibleModule(
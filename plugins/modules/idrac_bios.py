@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.6.0
-# Copyright (C) 2018-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2018-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -24,6 +24,7 @@ description:
     - Boot sources can be enabled or disabled. Boot sequence can be configured.
 extends_documentation_fragment:
     - dellemc.openmanage.idrac_auth_options
+    - dellemc.openmanage.disk_cache_options
 options:
     share_name:
         type: str
@@ -126,6 +127,15 @@ options:
           - The maximum wait time of I(job_wait) in seconds. The job is tracked only for this duration.
           - This option is applicable when I(job_wait) is C(true).
         default: 1200
+    registry_cache:
+        type: bool
+        description:
+          - Whether to cache the BIOS attribute registry on the disk to validate the I(attributes).
+          - If C(true), the registry is read from the cache entry of the system model and BIOS version, and is
+            downloaded only when the entry is not found.
+          - This is applicable only to I(attributes).
+        default: false
+        version_added: 9.9.0
 requirements:
     - "omsdk >= 1.2.490"
     - "python >= 3.9.6"
@@ -314,6 +324,7 @@ SYSTEM_URI = "/redfish/v1/Systems/System.Embedded.1"
 MANAGER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1"
 BIOS_URI = "/redfish/v1/Systems/System.Embedded.1/Bios"
 BIOS_REGISTRY = "/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry"
+SYSTEM_BIOS_VERSION_URI = "/redfish/v1/Systems/System.Embedded.1?$select=Model,BiosVersion"
 CLEAR_PENDING_URI = "/redfish/v1/Systems/System.Embedded.1/Bios/Settings/Actions/Oem/DellManager.ClearPending"
 RESET_BIOS_DEFAULT = "/redfish/v1/Systems/System.Embedded.1/Bios/Actions/Bios.ResetBios"
 BIOS_SETTINGS = "/redfish/v1/Systems/System.Embedded.1/Bios/Settings"
@@ -358,7 +369,8 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac i
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, \
-    strip_substr_dict
+    strip_substr_dict, get_registry_index, get_cached_registry
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 
 def run_server_bios_config(idrac, module):
@@ -492,6 +504,7 @@ def track_power_state(redfish_obj, desired_state, retries=POWER_CHECK_RETRIES, i
             break
         else:
             time.sleep(interval)
+            record_sleep(interval)
         count = count - 1
     else:
         achieved = False
@@ -514,6 +527,7 @@ def reset_host(module, redfish_obj):
         p_state = "On"
         if not state_achieved:
             time.sleep(10)
+            record_sleep(10)
             p_state = "ForceRestart"
     p_act = power_act_host(redfish_obj, p_state)
     if not p_act:
@@ -538,6 +552,7 @@ def track_log_entry(redfish_obj):
     intrvl = 15
     retries = 360 // intrvl
     time.sleep(intrvl)
+    record_sleep(intrvl)
     try:
         resp = redfish_obj.invoke_request(LOG_SERVICE_URI, "GET")
         uri = resp.json_data.get('Entries').get('@odata.id')
@@ -559,6 +574,7 @@ def track_log_entry(redfish_obj):
                 break
             retries = retries - 1
             time.sleep(intrvl)
+            record_sleep(intrvl)
             if retries < pvt:
                 fln = flen
         else:
@@ -605,15 +621,19 @@ def clear_pending_bios(module, redfish_obj):
     module.exit_json(status_msg=SUCCESS_CLEAR, changed=True)
 
 
-def get_attributes_registry(idrac):
-    reggy = {}
-    try:
-        resp = idrac.invoke_request(BIOS_REGISTRY, "GET")
-        attr_list = resp.json_data.get("RegistryEntries").get("Attributes")
-        reggy = dict((x["AttributeName"], x) for x in attr_list)
-    except Exception:
+def get_attributes_registry(idrac, registry_cache=False):
+    def fetch_registry():
         reggy = {}
-    return reggy
+        try:
+            resp = idrac.invoke_request(BIOS_REGISTRY, "GET", cache=True)
+            attr_list = resp.json_data.get("RegistryEntries").get("Attributes")
+            reggy = get_registry_index(attr_list)
+        except Exception:
+            reggy = {}
+        return reggy
+    if registry_cache:
+        return get_cached_registry(idrac, SYSTEM_BIOS_VERSION_URI, "BiosVersion", fetch_registry, "BiosRegistry")
+    return fetch_registry()
 
 
 def validate_vs_registry(registry, attr_dict):
@@ -626,12 +646,7 @@ def validate_vs_registry(registry, attr_dict):
             else:
                 type = val_dict.get("Type")
                 if type == "Enumeration":
-                    found = False
-                    for val in val_dict.get("Value", []):
-                        if v == val.get("ValueName"):
-                            found = True
-                            break
-                    if not found:
+                    if v not in val_dict.get("Values", []):
                         invalid[k] = "Invalid value for enumeration."
                 if type == "Integer":
                     try:
@@ -720,7 +735,7 @@ def attributes_config(module, redfish_obj):
         if diff_tuple[0]:
             attr = diff_tuple[0]
     invalid = {}
-    attr_registry = get_attributes_registry(redfish_obj)
+    attr_registry = get_attributes_registry(redfish_obj, module.params.get("registry_cache"))
     if attr_registry:
         invalid.update(validate_vs_registry(attr_registry, attr))
         if invalid:
@@ -783,7 +798,8 @@ def main():
         "reset_bios": {"type": 'bool'},
         "reset_type": {"type": 'str', "choices": ['graceful_restart', 'force_restart'], "default": 'graceful_restart'},
         "job_wait": {"type": 'bool', "default": True},
-        "job_wait_timeout": {"type": 'int', "default": 1200}
+        "job_wait_timeout": {"type": 'int', "default": 1200},
+        "registry_cache": {"type": 'bool', "default": False}
     }
     specs.update(idrac_auth_params)
     module = AnsibleModule(
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2022-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -268,6 +268,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish i
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (strip_substr_dict, idrac_system_reset,
                                                                                get_system_res_id,
                                                                                wait_for_idrac_job_completion)
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 
 SYSTEM_URI = "/redfish/v1/Systems"
@@ -340,6 +341,7 @@ def get_scheduled_job(idrac, job_state=None):
         job_state = ["Scheduled", "New", "Running"]
     is_job, job_type_name, progress_job = False, "BIOSConfiguration", []
     time.sleep(10)
+    record_sleep(10)
     job_resp = idrac.invoke_request(JOB_URI, "GET")
     job_resp_member = job_resp.json_data["Members"]
     if job_resp_member:
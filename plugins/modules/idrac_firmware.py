@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 8.4.0
-# Copyright (C) 2018-2023 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2018-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -238,6 +238,7 @@ from ssl import SSLError
 from xml.etree import ElementTree as ET
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six.moves.urllib.parse import urlparse
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -288,6 +289,7 @@ def wait_for_job_completion(module, job_uri, job_wait=False, reboot=False, apply
             msg = str(error_message)
             track_counter += 1
             time.sleep(10)
+            record_sleep(10)
     if track_counter < 5:
         msg = None
     #  reset track counter
@@ -302,6 +304,7 @@ def wait_for_job_completion(module, job_uri, job_wait=False, reboot=False, apply
             msg = str(error_message)
             track_counter += 2
             time.sleep(INTERVAL)
+            record_sleep(INTERVAL)
         else:
             if response.json_data.get("PercentComplete") == 100 and job_state == "Completed":  # apply now
                 break
@@ -309,6 +312,7 @@ def wait_for_job_completion(module, job_uri, job_wait=False, reboot=False, apply
                 break
             track_counter += 1
             time.sleep(INTERVAL)
+            record_sleep(INTERVAL)
     if track_counter > WAIT_COUNT:
         # TIMED OUT
         msg = JOB_WAIT_MSG.format((WAIT_COUNT * INTERVAL) / 60)
@@ -440,6 +444,7 @@ def get_error_syslog(idrac, curr_time, uri):
                 break
             retries = retries - 1
             time.sleep(intrvl)
+            record_sleep(intrvl)
         else:
             msg = "No Error log found."
             error_log_found = False
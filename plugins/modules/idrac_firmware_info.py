@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.8.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -20,6 +20,7 @@ short_description: Get Firmware Inventory
 version_added: "3.0.0"
 description: Get Firmware Inventory.
 extends_documentation_fragment:
+  - dellemc.openmanage.idrac_fanout_options
   - dellemc.openmanage.idrac_auth_options
 
 requirements:
@@ -41,6 +42,17 @@ EXAMPLES = """
     idrac_user: "user_name"
     idrac_password: "user_password"
     ca_path: "/path/to/ca_cert.pem"
+
+- name: Get Installed Firmware Inventory from several iDRACs concurrently
+  dellemc.openmanage.idrac_firmware_info:
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    max_workers: 16
+    targets:
+      - idrac_ip: "192.168.0.1"
+      - idrac_ip: "192.168.0.2"
+        timeout: 60
 """
 
 RETURN = r'''
@@ -83,6 +95,20 @@ firmware_info:
                 "impactsTPMmeasurements": "false"
             }]
   }
+results:
+  description: Result of each target keyed by its host, returned when I(targets) is specified.
+  returned: when targets is specified
+  type: dict
+  sample: {
+    "192.168.0.1": {
+      "msg": "Successfully fetched the firmware inventory details.",
+      "firmware_info": {"Firmware": []}
+    },
+    "192.168.0.2": {
+      "msg": "<urlopen error [Errno 113] No route to host>",
+      "unreachable": true
+    }
+  }
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -108,7 +134,8 @@ error_info:
 import json
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import GET_IDRAC_FIRMWARE_DETAILS_URI_10, GET_IDRAC_FIRMWARE_URI_10, remove_key
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import GET_IDRAC_FIRMWARE_DETAILS_URI_10, GET_IDRAC_FIRMWARE_URI_10, remove_key, \
+    fanout_argument_spec, check_fanout_options, exit_fan_out
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from urllib.error import URLError, HTTPError
@@ -191,14 +218,7 @@ def get_idrac_firmware_info(idrac, module):
         raise
 
 
-def main():
-    specs = {}
-    specs.update(idrac_auth_params)
-    module = AnsibleModule(
-        argument_spec=specs,
-        supports_check_mode=True
-    )
-
+def run_module(module):
     try:
         with iDRACRedfishAPI(module.params) as idrac:
             firmware_info = get_idrac_firmware_info(idrac, module)
@@ -213,5 +233,21 @@ def main():
         firmware_info=firmware_info)
 
 
+def main():
+    specs = {}
+    specs.update(idrac_auth_params)
+    specs.update(fanout_argument_spec(idrac_auth_params, "idrac_ip"))
+    module = AnsibleModule(
+        argument_spec=specs,
+        mutually_exclusive=[("idrac_ip", "targets")],
+        required_one_of=[("idrac_ip", "targets")],
+        supports_check_mode=True
+    )
+    check_fanout_options(module, [("idrac_user",), ("idrac_password",)])
+    if module.params.get("targets"):
+        exit_fan_out(run_module, module, "idrac_ip")
+    run_module(module)
+
+
 if __name__ == '__main__':
     main()
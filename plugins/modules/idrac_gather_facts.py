@@ -0,0 +1,549 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: idrac_gather_facts
+short_description: Gather the facts of the PowerEdge Server components from iDRAC
+version_added: "9.9.0"
+description:
+  - This module gathers the facts of the requested components from iDRAC through Redfish.
+  - The facts are the same as those set by the C(dellemc.openmanage.idrac_gather_facts) role,
+    they are fetched in one process with concurrent requests.
+extends_documentation_fragment:
+  - dellemc.openmanage.idrac_x_auth_options
+options:
+  target:
+    description:
+      - Target components for which information needs to be gathered.
+      - C(IDRAC) lists the attributes for iDRAC.
+      - C(System) lists the ComputerSystem resources for iDRAC.
+      - C(BIOS) lists the BIOS information.
+      - C(Controller) lists the available controllers for iDRAC.
+      - C(CPU) lists the system processors.
+      - C(Enclosure) lists the enclosures.
+      - C(EnclosureEMM) lists the enclosure management module specific data.
+      - C(Fan) lists the fans.
+      - C(Firmware) lists the firmware inventories.
+      - C(HostNIC) lists the host NIC.
+      - C(License) lists the license information.
+      - C(Memory) lists the memory device specific data.
+      - C(NIC) lists NIC device specific data.
+      - C(PCIeSSDBackPlane) lists PCIeSSD back plane specific data.
+      - C(PowerSupply) lists data specific to the Power Supply devices in the managed system.
+      - C(PresenceAndStatusSensor) lists the presence and status sensor specific data.
+      - C(Sensors_Battery) lists the sensors battery information.
+      - C(Sensors_Intrusion) lists the sensors intrusion information.
+      - C(Sensors_Voltage) lists the sensors voltage information.
+      - C(VirtualDisk) lists the virtual disks.
+      - C(PCIeDevice) lists the PCIeDevices.
+      - C(PhysicalDisk) lists the physical disks.
+      - C(SystemMetrics) lists the power, thermal and memory metrics.
+      - C(SecureBoot) lists the secure boot information.
+    type: list
+    elements: str
+    choices: [IDRAC, System, BIOS, Controller, CPU, Enclosure, EnclosureEMM, Fan, Firmware, HostNIC, License,
+              Memory, NIC, PCIeSSDBackPlane, PowerSupply, PresenceAndStatusSensor, Sensors_Battery,
+              Sensors_Intrusion, Sensors_Voltage, VirtualDisk, PCIeDevice, PhysicalDisk, SystemMetrics, SecureBoot]
+    default: [System]
+  computer_system_id:
+    description:
+      - Computer system id.
+      - If not specified, the first computer system is used.
+    type: str
+  manager_id:
+    description:
+      - Manager or BMC id.
+      - If not specified, the first manager is used.
+    type: str
+requirements:
+  - "python >= 3.9.6"
+author:
+  - "Felix Stephen (@felixs88)"
+  - "Jagadeesh N V (@jagadeeshnv)"
+notes:
+  - Run this module from a system that has direct access to Dell iDRAC.
+  - The components are fetched one after the other by default, set the C(OMAM_MAX_WORKERS) environment
+    variable to the number of concurrent requests to fetch them concurrently.
+  - A component that is not available on the iDRAC is returned with its empty default value.
+  - This module supports both IPv4 and IPv6 address for I(idrac_ip).
+  - This module supports C(check_mode).
+"""
+
+EXAMPLES = """
+---
+- name: Gather the system facts
+  dellemc.openmanage.idrac_gather_facts:
+    idrac_ip: "192.168.0.1"
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+
+- name: Gather the facts of the firmware, memory and storage components
+  dellemc.openmanage.idrac_gather_facts:
+    idrac_ip: "192.168.0.1"
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    target:
+      - Firmware
+      - Memory
+      - Controller
+      - PhysicalDisk
+      - VirtualDisk
+"""
+
+RETURN = r'''
+---
+msg:
+  description: Status of the facts gathering.
+  returned: always
+  type: str
+  sample: "Successfully gathered the facts."
+idrac:
+  description: System, manager and lifecycle controller attributes, set for C(IDRAC).
+  returned: success
+  type: dict
+  sample: {
+    "system_attributes": {"ServerOS.1.HostName": "host"},
+    "manager_attributes": {"IPMILan.1.Enable": "Enabled"},
+    "lifecycle_controller_attributes": {"LCAttributes.1.CollectSystemInventoryOnRestart": "Enabled"}
+  }
+system:
+  description: Dell system details combined with the server operating system attributes, set for C(System).
+  returned: success
+  type: dict
+  sample: {"BIOSReleaseDate": "02/07/2023", "ChassisServiceTag": "ABCD123", "ServerOS.1.HostName": "host"}
+bios:
+  description: BIOS details, set for C(BIOS).
+  returned: success
+  type: dict
+  sample: {"Attributes": {"BootMode": "Uefi"}}
+controller:
+  description: Storage controllers, set for C(Controller).
+  returned: success
+  type: list
+  sample: [{"Id": "RAID.SL.3-1", "Name": "PERC H755 Front"}]
+cpu:
+  description: Processors, set for C(CPU).
+  returned: success
+  type: list
+  sample: [{"Id": "CPU.Socket.1", "Model": "Intel(R) Xeon(R)"}]
+enclosure:
+  description: Enclosures, set for C(Enclosure).
+  returned: success
+  type: list
+  sample: []
+enclosure_emm:
+  description: Enclosure management modules, set for C(EnclosureEMM).
+  returned: success
+  type: list
+  sample: []
+fan:
+  description: Fans, set for C(Fan).
+  returned: success
+  type: list
+  sample: [{"Id": "Fan.Embedded.1A", "Name": "Fan 1A"}]
+firmware:
+  description: Firmware inventory, set for C(Firmware).
+  returned: success
+  type: list
+  sample: [{"Id": "Installed-25227-6.10.80.00", "Version": "6.10.80.00"}]
+hostnic:
+  description: Host interfaces, set for C(HostNIC).
+  returned: success
+  type: list
+  sample: [{"Id": "Host.1", "InterfaceEnabled": false}]
+license:
+  description: Licenses, set for C(License).
+  returned: success
+  type: list
+  sample: [{"Id": "FD00000011111111", "LicenseType": "Production"}]
+memory:
+  description: Memory devices, set for C(Memory).
+  returned: success
+  type: list
+  sample: [{"Id": "DIMM.Socket.A1", "CapacityMiB": 16384}]
+nic:
+  description: Ethernet interfaces, set for C(NIC).
+  returned: success
+  type: list
+  sample: [{"Id": "NIC.Integrated.1-1-1", "LinkStatus": "LinkUp"}]
+backplane:
+  description: PCIeSSD back planes, set for C(PCIeSSDBackPlane).
+  returned: success
+  type: list
+  sample: []
+power_supply:
+  description: Power supplies, set for C(PowerSupply).
+  returned: success
+  type: list
+  sample: [{"Id": "PSU.Slot.1", "Name": "PS1 Status"}]
+presence_and_status_sensor:
+  description: Presence and status sensors, set for C(PresenceAndStatusSensor).
+  returned: success
+  type: list
+  sample: []
+sensor_battery:
+  description: System board CMOS battery sensor, set for C(Sensors_Battery).
+  returned: success
+  type: dict
+  sample: {"Id": "iDRAC.Embedded.1_0x23_SystemBoardCMOSBattery", "HealthState": "OK"}
+intrusion_sensor:
+  description: Chassis intrusion sensor, set for C(Sensors_Intrusion).
+  returned: success
+  type: dict
+  sample: {"PhysicalSecurity": {"IntrusionSensor": "Normal"}}
+voltages:
+  description: Voltage sensors, set for C(Sensors_Voltage).
+  returned: success
+  type: list
+  sample: [{"Name": "CPU1 VCORE PG", "ReadingVolts": 1}]
+virtual_disk:
+  description: Volumes, set for C(VirtualDisk).
+  returned: success
+  type: list
+  sample: [{"Id": "Disk.Virtual.0:RAID.SL.3-1", "RAIDType": "RAID0"}]
+pcie_device:
+  description: PCIe devices, set for C(PCIeDevice).
+  returned: success
+  type: list
+  sample: [{"Id": "0-31", "Name": "C620 Series Chipset Family"}]
+physical_disk:
+  description: Drives, set for C(PhysicalDisk).
+  returned: success
+  type: list
+  sample: [{"Id": "Disk.Bay.0:Enclosure.Internal.0-1:RAID.SL.3-1", "MediaType": "SSD"}]
+power_metrics:
+  description: Power supply metrics, set for C(SystemMetrics).
+  returned: success
+  type: list
+  sample: [{"Id": "PowerSupplyMetrics", "InputPowerWatts": {"Reading": 102}}]
+thermal_metrics:
+  description: Thermal metrics, set for C(SystemMetrics).
+  returned: success
+  type: dict
+  sample: {"Id": "ThermalMetrics", "TemperatureReadingsCelsius": []}
+memory_metrics:
+  description: Memory metrics, set for C(SystemMetrics).
+  returned: success
+  type: list
+  sample: [{"Id": "Metrics", "BandwidthPercent": 0}]
+secure_boot:
+  description: Secure boot details with its databases and certificates, set for C(SecureBoot).
+  returned: success
+  type: dict
+  sample: {"SecureBootEnable": false, "SecureBootDatabases": []}
+error_info:
+  description: Details of the HTTP Error.
+  returned: on HTTP error
+  type: dict
+  sample: {
+    "error": {
+      "code": "Base.1.0.GeneralError",
+      "message": "A general error has occurred. See ExtendedInfo for more information.",
+      "@Message.ExtendedInfo": [
+        {
+          "MessageId": "GEN1234",
+          "RelatedProperties": [],
+          "Message": "Unable to process the request because an error occurred.",
+          "MessageArgs": [],
+          "Severity": "Critical",
+          "Resolution": "Retry the operation. If the issue persists, contact your system administrator."
+        }
+      ]
+    }
+  }
+'''
+
+
+import json
+import re
+from ssl import SSLError
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import ResourceFetcher, get_max_workers, \
+    SYSTEMS_URI, MANAGERS_URI, CHASSIS_URI, SYSTEM_ID, MANAGER_ID
+
+EXPAND = "?$expand=*($levels=1)"
+ODATA_KEYS = ["@odata.context", "@odata.id", "@odata.type"]
+ODATA_REGEX = r".*@odata"
+# Responses of resources that the iDRAC does not have, other errors fail the module.
+MISSING_CODES = (400, 404)
+SUCCESS_MSG = "Successfully gathered the facts."
+INVALID_SYSTEM_ID_MSG = "Invalid computer system id : {0}, valid values are {1}"
+INVALID_MANAGER_ID_MSG = "Invalid computer manager id : {0}, valid values are {1}"
+DEFAULT_FACTS = {
+    "idrac": {}, "system": {}, "bios": {}, "controller": [], "cpu": [], "enclosure": [], "enclosure_emm": [],
+    "fan": [], "firmware": [], "hostnic": [], "license": [], "memory": [], "nic": [], "backplane": [],
+    "power_supply": [], "presence_and_status_sensor": [], "sensor_battery": {}, "intrusion_sensor": {},
+    "voltages": [], "virtual_disk": [], "pcie_device": {}, "physical_disk": [], "power_metrics": [],
+    "thermal_metrics": [], "memory_metrics": [], "secure_boot": {}
+}
+
+
+def strip_keys(data, keys=(), regex=None):
+    """Returns a copy of data without the keys, at any depth, that are in keys or match regex."""
+    if isinstance(data, dict):
+        return dict((key, strip_keys(val, keys, regex)) for key, val in data.items()
+                    if key not in keys and not (regex and re.match(regex, key)))
+    if isinstance(data, list):
+        return [strip_keys(item, keys, regex) for item in data]
+    return data
+
+
+class IdracFacts(ResourceFetcher):
+    """Collects the facts of the iDRAC components, every resource is fetched once per run."""
+
+    def __init__(self, idrac, max_workers):
+        super(IdracFacts, self).__init__(idrac, max_workers, missing_codes=MISSING_CODES)
+        self.api_system = self.api_manager = self.api_chassis = None
+        self.system_id = None
+
+    def get_members(self, uri):
+        return (self.get(uri) or {}).get("Members", [])
+
+    def resolve_resources(self, module, system_id=None, manager_id=None):
+        systems, managers, chassis = self.map(self.get_members, [SYSTEMS_URI, MANAGERS_URI, CHASSIS_URI])
+        system_ids = [member["@odata.id"].split("/")[-1] for member in systems]
+        if system_id and system_id not in system_ids:
+            module.fail_json(msg=INVALID_SYSTEM_ID_MSG.format(system_id, ",".join(system_ids)))
+        manager_ids = [member["@odata.id"].split("/")[-1] for member in managers]
+        if manager_id and manager_id not in manager_ids:
+            module.fail_json(msg=INVALID_MANAGER_ID_MSG.format(manager_id, ",".join(manager_ids)))
+        self.system_id = system_id or (system_ids[0] if system_ids else SYSTEM_ID)
+        self.api_system = "{0}/{1}".format(SYSTEMS_URI, self.system_id)
+        manager_id = manager_id or (manager_ids[0] if manager_ids else MANAGER_ID)
+        self.api_manager = "{0}/{1}".format(MANAGERS_URI, manager_id)
+        self.api_chassis = chassis[0]["@odata.id"] if chassis else "{0}/{1}".format(CHASSIS_URI, SYSTEM_ID)
+
+    def get_idrac(self):
+        attr_ids = [self.system_id, MANAGER_ID, "LifecycleController.Embedded.1"]
+        attrs = self.map(self.get, ["{0}/Oem/Dell/DellAttributes/{1}".format(self.api_manager, attr_id)
+                                    for attr_id in attr_ids])
+        if not all(attrs):
+            return {}
+        return {"idrac": {"system_attributes": attrs[0].get("Attributes"),
+                          "manager_attributes": attrs[1].get("Attributes"),
+                          "lifecycle_controller_attributes": attrs[2].get("Attributes")}}
+
+    def get_system(self):
+        system, os_attr = self.map(self.get, [
+            self.api_system, "{0}/{1}/Attributes?$select=ServerOS.*".format(MANAGERS_URI, self.system_id)])
+        if system is None or os_attr is None:
+            return {}
+        system_facts = dict(system.get("Oem", {}).get("Dell", {}).get("DellSystem", {}))
+        system_facts.update(os_attr.get("Attributes", {}))
+        return {"system": strip_keys(system_facts, ODATA_KEYS)}
+
+    def get_bios(self):
+        bios = self.get(self.api_system + "/Bios")
+        if bios is None:
+            return {}
+        return {"bios": strip_keys(bios, ODATA_KEYS + ["SettingsObject", "Actions", "AttributeRegistry",
+                                                       "Description", "Id", "Links", "Name"])}
+
+    def get_controller(self):
+        storage = self.get_members(self.api_system + "/Storage/" + EXPAND)
+        controller_uris = [member["Controllers"]["@odata.id"] + EXPAND for member in storage
+                           if "Controllers" in member]
+        controllers = []
+        for members in self.map(self.get_members, controller_uris):
+            controllers.extend(members)
+        return {"controller": strip_keys(controllers, regex=ODATA_REGEX)}
+
+    def _get_storage_uris(self):
+        return [member["@odata.id"] for member in self.get_members(self.api_system + "/Storage")]
+
+    def get_physical_disk(self):
+        drives = []
+        for storage in self.map(self.get, [uri + EXPAND for uri in self._get_storage_uris()]):
+            drives.extend((storage or {}).get("Drives", []))
+        return {"physical_disk": strip_keys(drives, ODATA_KEYS + [
+            "Actions", "Assembly", "Links", "DellDriveSMARTAttributes", "DellNVMeSMARTAttributes",
+            "Operations@odata.count"])}
+
+    def get_virtual_disk(self):
+        volumes = []
+        for members in self.map(self.get_members, [uri + "/Volumes" + EXPAND for uri in self._get_storage_uris()]):
+            volumes.extend(members)
+        return {"virtual_disk": strip_keys(volumes, ODATA_KEYS + [
+            "Actions", "EncryptionTypes@odata.count", "Identifiers@odata.count", "Links", "Operations@odata.count",
+            "DellVirtualDisk", "DellVirtualDisk@Redfish.Deprecated"])}
+
+    def _get_members_fact(self, fact, uri, keys=()):
+        resp = self.get(uri)
+        if resp is None:
+            return {}
+        return {fact: strip_keys(resp.get("Members", []), ODATA_KEYS + list(keys))}
+
+    def get_cpu(self):
+        return self._get_members_fact("cpu", self.api_system + "/Processors" + EXPAND, ["Assembly", "Links"])
+
+    def get_enclosure(self):
+        return self._get_members_fact("enclosure", CHASSIS_URI + "/Oem/Dell/DellEnclosures", ["Links", "Description"])
+
+    def get_enclosure_emm(self):
+        return self._get_members_fact("enclosure_emm", CHASSIS_URI + "/Oem/Dell/DellEnclosureEMM",
+                                      ["Description", "Links"])
+
+    def get_fan(self):
+        return self._get_members_fact("fan", self.api_chassis + "/ThermalSubsystem/Fans" + EXPAND)
+
+    def get_firmware(self):
+        return self._get_members_fact("firmware", "/redfish/v1/UpdateService/FirmwareInventory" + EXPAND, [
+            "Classifications@odata.count", "IdentityInfoType@odata.count", "IdentityInfoValue@odata.count"])
+
+    def get_hostnic(self):
+        return self._get_members_fact("hostnic", self.api_manager + "/HostInterfaces" + EXPAND,
+                                      ["HostEthernetInterfaces", "ManagerEthernetInterface"])
+
+    def get_license(self):
+        return self._get_members_fact("license", "/redfish/v1/LicenseService/Licenses" + EXPAND)
+
+    def get_memory(self):
+        return self._get_members_fact("memory", self.api_system + "/Memory" + EXPAND, [
+            "AllowedSpeedsMHz@odata.count", "CPUAffinity@odata.count", "Processors@odata.count",
+            "MaxTDPMilliWatts@odata.count", "OperatingMemoryModes@odata.count"])
+
+    def get_nic(self):
+        return self._get_members_fact("nic", self.api_system + "/EthernetInterfaces" + EXPAND, [
+            "IPv4Addresses@odata.count", "IPv6AddressPolicyTable@odata.count", "IPv6Addresses@odata.count",
+            "IPv6StaticAddresses@odata.count", "NameServers@odata.count"])
+
+    def get_backplane(self):
+        return self._get_members_fact("backplane", CHASSIS_URI + "/Oem/Dell/DellPCIeSSDBackPlanes")
+
+    def get_power_supply(self):
+        return self._get_members_fact("power_supply", self.api_chassis + "/PowerSubsystem/PowerSupplies" + EXPAND, [
+            "ActiveInputVoltage@Redfish.Deprecated", "OperationalStatus@odata.count", "RedTypeOfSet@odata.count"])
+
+    def get_pas_sensor(self):
+        return self._get_members_fact("presence_and_status_sensor",
+                                      self.api_system + "/Oem/Dell/DellPresenceAndStatusSensors", ["Assembly", "Links"])
+
+    def get_pcie_device(self):
+        return self._get_members_fact("pcie_device", self.api_chassis + "/PCIeDevices" + EXPAND,
+                                      ["Links", "@odata.etag"])
+
+    def get_battery(self):
+        battery = self.get(self.api_system + "/Oem/Dell/DellSensors/iDRAC.Embedded.1_0x23_SystemBoardCMOSBattery")
+        return {"sensor_battery": strip_keys(battery, ODATA_KEYS)} if battery is not None else {}
+
+    def get_intrusion(self):
+        intrusion = self.get(self.api_chassis + "?$select=PhysicalSecurity/IntrusionSensor")
+        return {"intrusion_sensor": strip_keys(intrusion, ODATA_KEYS)} if intrusion is not None else {}
+
+    def get_voltage(self):
+        power = self.get(self.api_chassis + "/Power")
+        return {"voltages": strip_keys(power.get("Voltages", []), ODATA_KEYS)} if power is not None else {}
+
+    def _get_metrics(self, uri):
+        metric_uris = []
+        for member in self.get_members(uri):
+            metrics = member.get("Metrics")
+            if metrics is not None:
+                if not isinstance(metrics, list):
+                    metrics = [metrics]
+                metric_uris.extend(metric["@odata.id"] for metric in metrics)
+        return [metric for metric in self.map(self.get, metric_uris) if metric is not None]
+
+    def get_metrics(self):
+        power_metrics, thermal_metrics, memory_metrics = self.map(lambda func: func(), [
+            lambda: self._get_metrics(self.api_chassis + "/PowerSubsystem/PowerSupplies" + EXPAND),
+            lambda: self.get(self.api_chassis + "/ThermalSubsystem/ThermalMetrics"),
+            lambda: self._get_metrics(self.api_system + "/Memory" + EXPAND)])
+        facts = {"power_metrics": strip_keys(power_metrics, ODATA_KEYS + ["DataSourceUri"]),
+                 "memory_metrics": strip_keys(memory_metrics, ODATA_KEYS + ["DataSourceUri"])}
+        if thermal_metrics is not None:
+            facts["thermal_metrics"] = strip_keys(thermal_metrics, ODATA_KEYS + [
+                "DataSourceUri", "TemperatureReadingsCelsius@odata.count"])
+        return facts
+
+    def get_secure_boot(self):
+        secure_boot, databases = self.map(self.get, [self.api_system + "/SecureBoot/" + EXPAND,
+                                                     self.api_system + "/SecureBoot/SecureBootDatabases" + EXPAND])
+        if secure_boot is None or databases is None:
+            return {}
+        db_list = databases.get("Members", [])
+        certificates = self.map(self.get_members, [db["Certificates"]["@odata.id"] + EXPAND for db in db_list])
+        secure_boot = dict(secure_boot)
+        secure_boot["SecureBootDatabases"] = [dict(db, Certificates=certs) for db, certs in zip(db_list, certificates)]
+        return {"secure_boot": strip_keys(secure_boot, regex=r".*@odata\.")}
+
+
+TARGET_FACTS = {
+    "IDRAC": IdracFacts.get_idrac,
+    "System": IdracFacts.get_system,
+    "BIOS": IdracFacts.get_bios,
+    "Controller": IdracFacts.get_controller,
+    "CPU": IdracFacts.get_cpu,
+    "Enclosure": IdracFacts.get_enclosure,
+    "EnclosureEMM": IdracFacts.get_enclosure_emm,
+    "Fan": IdracFacts.get_fan,
+    "Firmware": IdracFacts.get_firmware,
+    "HostNIC": IdracFacts.get_hostnic,
+    "License": IdracFacts.get_license,
+    "Memory": IdracFacts.get_memory,
+    "NIC": IdracFacts.get_nic,
+    "PCIeSSDBackPlane": IdracFacts.get_backplane,
+    "PowerSupply": IdracFacts.get_power_supply,
+    "PresenceAndStatusSensor": IdracFacts.get_pas_sensor,
+    "Sensors_Battery": IdracFacts.get_battery,
+    "Sensors_Intrusion": IdracFacts.get_intrusion,
+    "Sensors_Voltage": IdracFacts.get_voltage,
+    "VirtualDisk": IdracFacts.get_virtual_disk,
+    "PCIeDevice": IdracFacts.get_pcie_device,
+    "PhysicalDisk": IdracFacts.get_physical_disk,
+    "SystemMetrics": IdracFacts.get_metrics,
+    "SecureBoot": IdracFacts.get_secure_boot,
+}
+
+
+def gather_facts(module, idrac):
+    idrac_facts = IdracFacts(idrac, get_max_workers(module.params))
+    idrac_facts.resolve_resources(module, module.params.get("computer_system_id"), module.params.get("manager_id"))
+    targets = list(dict.fromkeys(module.params.get("target")))
+    facts = dict(DEFAULT_FACTS)
+    for target_facts in idrac_facts.map(lambda target: TARGET_FACTS[target](idrac_facts), targets):
+        facts.update(target_facts)
+    return facts
+
+
+def main():
+    specs = {
+        "target": {"type": "list", "elements": "str", "default": ["System"], "choices": list(TARGET_FACTS)},
+        "computer_system_id": {"type": "str"},
+        "manager_id": {"type": "str"},
+    }
+    module = IdracAnsibleModule(
+        argument_spec=specs,
+        supports_check_mode=True
+    )
+    try:
+        with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+            facts = gather_facts(module, idrac)
+        module.exit_json(msg=SUCCESS_MSG, **facts)
+    except HTTPError as err:
+        module.fail_json(msg=str(err), error_info=json.load(err))
+    except URLError as err:
+        module.exit_json(msg=str(err), unreachable=True)
+    except (SSLValidationError, ConnectionError, TypeError, ValueError, OSError, SSLError) as err:
+        module.fail_json(msg=str(err))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -23,6 +23,7 @@ description:
   - This module allows you to configure the port and partition network attributes on the network interface cards.
 extends_documentation_fragment:
   - dellemc.openmanage.idrac_x_auth_options
+  - dellemc.openmanage.disk_cache_options
 options:
   network_adapter_id:
     type: str
@@ -114,6 +115,15 @@ options:
     description:
       - The maximum wait time of I(job_wait) in seconds. The job is tracked only for this duration.
       - This option is applicable when I(job_wait) is C(true).
+  registry_cache:
+    type: bool
+    default: false
+    description:
+      - Whether to cache the location of the network attribute registry of I(network_device_function_id) on the disk.
+      - If C(true), the registry location is read from the cache entry of the iDRAC and its firmware version, and is
+        looked up only when the entry is not found.
+      - This is applicable only to I(oem_network_attributes) on iDRAC with firmware version between 3.0 and 6.0.
+    version_added: 9.9.0
 requirements:
     - "python >= 3.9.6"
 author:
@@ -325,11 +335,13 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish i
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
     delete_job, get_current_time, get_dynamic_uri, get_idrac_firmware_version,
     get_scheduled_job_resp, remove_key, validate_and_get_first_resource_id_uri,
-    idrac_redfish_job_tracking, xml_data_conversion)
+    idrac_redfish_job_tracking, xml_data_conversion, get_cached_registry)
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 REGISTRY_URI = '/redfish/v1/Registries'
 SYSTEMS_URI = "/redfish/v1/Systems"
 iDRAC_JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{job_id}"
+MANAGER_VERSION_URI = "/redfish/v1/Managers/iDRAC.Embedded.1?$select=Model,FirmwareVersion"
 
 SUCCESS_MSG = "Successfully updated the network attributes."
 SUCCESS_CLEAR_PENDING_ATTR_MSG = "Successfully cleared the pending network attributes."
@@ -402,8 +414,7 @@ class IDRACNetworkAttributes:
                                                                          'network_device_function_id'))
         return network_device_function_id_uri
 
-    def __get_registry_fw_less_than_6_more_than_3(self):
-        reg = {}
+    def __get_registry_uri(self):
         network_device_function_id = self.module.params.get(
             'network_device_function_id')
         registry = get_dynamic_uri(self.idrac, REGISTRY_URI, 'Members')
@@ -412,13 +423,23 @@ class IDRACNetworkAttributes:
                 location = get_dynamic_uri(
                     self.idrac, each_member.get('@odata.id'), 'Location')
                 if location:
-                    uri = location[0].get('Uri')
-                    attr = get_dynamic_uri(
-                        self.idrac, uri, 'RegistryEntries').get('Attributes', {})
-                    for each_attr in attr:
-                        reg.update(
-                            {each_attr['AttributeName']: each_attr['CurrentValue']})
-                    break
+                    return location[0].get('Uri')
+        return None
+
+    def __get_registry_fw_less_than_6_more_than_3(self):
+        reg = {}
+        if self.module.params.get('registry_cache'):
+            uri = get_cached_registry(self.idrac, MANAGER_VERSION_URI, 'FirmwareVersion', self.__get_registry_uri,
+                                      self.module.params.get('idrac_ip'), 'NetworkAttributesRegistry',
+                                      self.module.params.get('network_device_function_id'))
+        else:
+            uri = self.__get_registry_uri()
+        if uri:
+            attr = get_dynamic_uri(
+                self.idrac, uri, 'RegistryEntries').get('Attributes', {})
+            for each_attr in attr:
+                reg.update(
+                    {each_attr['AttributeName']: each_attr['CurrentValue']})
         return reg
 
     def __validate_time(self, mtime):
@@ -568,6 +589,7 @@ class OEMNetworkAttributes(IDRACNetworkAttributes):
         if self.module.check_mode and not oem_network_attributes:
             self.module.exit_json(msg=CHANGES_FOUND_MSG, changed=True)
         time.sleep(5)
+        record_sleep(5)
         settings_uri_resp = get_dynamic_uri(self.idrac, settings_uri)
         pending_attributes = settings_uri_resp.get('Attributes')
         if pending_attributes and not self.module.check_mode:
@@ -708,7 +730,8 @@ def main():
                                    "options": {"start_time": {"type": 'str', "required": True},
                                                "duration": {"type": 'int', "required": True}}},
             "job_wait": {"type": "bool", "default": True},
-            "job_wait_timeout": {"type": "int", "default": 1200}
+            "job_wait_timeout": {"type": "int", "default": 1200},
+            "registry_cache": {"type": "bool", "default": False}
         }
 
         module = IdracAnsibleModule(argument_spec=specs,
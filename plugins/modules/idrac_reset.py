@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.4.0
-# Copyright (C) 2018-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2018-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -210,6 +210,7 @@ from ansible.module_utils.compat.version import LooseVersion
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
     get_idrac_firmware_version, remove_key, get_dynamic_uri, validate_and_get_first_resource_id_uri, idrac_redfish_job_tracking)
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 
 MANAGERS_URI = "/redfish/v1/Managers"
@@ -408,9 +409,11 @@ class FactoryReset():
                 if lc_status_dict.get('LCStatus') == 'Ready':
                     break
                 time.sleep(10)
+                record_sleep(10)
                 retry_count = retry_count + 1
             except URLError:
                 time.sleep(10)
+                record_sleep(10)
                 retry_count = retry_count + 1
                 if retry_count == IDRAC_RESET_RETRIES:
                     self.module.exit_json(msg=LC_STATUS_MSG.format(lc_status='unreachable', retries=IDRAC_RESET_RETRIES), unreachable=True)
@@ -477,6 +480,7 @@ class FactoryReset():
     def wait_for_port_open(self, interval=45):
         timeout_wait = self.module.params.get('job_wait_timeout')
         time.sleep(interval)
+        record_sleep(interval)
         msg = RESET_UNTRACK
         wait = timeout_wait
         track_failed = True
@@ -485,6 +489,7 @@ class FactoryReset():
             try:
                 self.idrac.invoke_request(MANAGERS_URI, 'GET')
                 time.sleep(interval)
+                record_sleep(interval)
                 msg = IDRAC_RESET_SUCCESS_MSG
                 track_failed = False
                 status_code = 200
@@ -493,11 +498,13 @@ class FactoryReset():
                 status_code = err.code
                 if status_code == 401:
                     time.sleep(interval // 2)
+                    record_sleep(interval // 2)
                     msg = IDRAC_RESET_SUCCESS_MSG
                     track_failed = False
                     break
             except Exception:
                 time.sleep(interval)
+                record_sleep(interval)
                 wait = wait - interval
         return track_failed, status_code, msg
 
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.4.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -194,6 +194,18 @@ options:
         and is supported only on iDRAC9.
     type: str
     version_added: 7.3.0
+  incremental:
+    description:
+      - Whether to import only the attributes that differ from the current configuration of the iDRAC.
+      - If C(true), the current SCP of the I(scp_components) is exported and compared with the SCP to be
+        imported for each component, and only the changed attributes are imported. The import job is not
+        created when there are no changes.
+      - This option is applicable when I(command) is C(import), and I(share_name) is a local path or
+        I(import_buffer) is provided.
+      - C(check_mode) is supported for all the I(scp_components) when this option is C(true).
+    type: bool
+    default: false
+    version_added: 9.9.0
 requirements:
   - "python >= 3.9.14"
 author:
@@ -208,7 +220,7 @@ notes:
     - This module supports C(check_mode).
     - To import Server Configuration Profile (SCP) on the iDRAC8-based servers,
       the servers must have iDRAC Enterprise license or later.
-    - For C(import) operation, C(check_mode) is supported only when I(target) is C(ALL).
+    - For C(import) operation, C(check_mode) is supported only when I(target) is C(ALL), unless I(incremental) is C(true).
     - This module supports IPv4 and IPv6 addresses.
 '''
 
@@ -482,6 +494,23 @@ EXAMPLES = r'''
     import_buffer: "{\"SystemConfiguration\": {\"Components\": [{\"FQDD\": \"iDRAC.Embedded.1\",\"Attributes\":
       [{\"Name\": \"SNMP.1#AgentCommunity\",\"Value\": \"public1\"}]}]}}"
 
+- name: Import only the changed BIOS and iDRAC attributes from a SCP file on the local path.
+  dellemc.openmanage.idrac_server_config_profile:
+    idrac_ip: "{{ idrac_ip }}"
+    idrac_user: "{{ idrac_user }}"
+    idrac_password: "{{ idrac_password }}"
+    ca_path: "/path/to/ca_cert.pem"
+    command: import
+    incremental: true
+    scp_components:
+      - IDRAC
+      - BIOS
+    share_name: "/scp_folder"
+    scp_file: scp_file.xml
+    shutdown_type: Graceful
+    end_host_power_state: "On"
+    job_wait: true
+
 - name: Export custom default
   dellemc.openmanage.idrac_server_config_profile:
     idrac_ip: "192.168.0.1"
@@ -573,7 +602,7 @@ import xml.etree.ElementTree as ET
 from ansible.module_utils.compat.version import LooseVersion
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, \
-    strip_substr_dict, get_idrac_firmware_version, get_dynamic_uri
+    strip_substr_dict, get_idrac_firmware_version, get_dynamic_uri, iter_scp_attributes
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.parse import urlparse
@@ -591,6 +620,8 @@ NO_CHANGES_FOUND = "No changes found to be applied."
 INVALID_FILE = "Invalid file path provided."
 INVALID_FILE_FORMAT = "An invalid export format is selected. File format '.xml' is supported. Select a valid file format and retry the operation."
 INVALID_XML_CONTENT = "An invalid XML content is provided. Provide custom default content in a valid XML format."
+INVALID_SCP_CONTENT = "An invalid SCP content is provided. Provide the SCP in a valid XML or JSON format."
+INCREMENTAL_SHARE_MSG = "incremental is supported only when share_name is a local path or import_buffer is provided."
 CUSTOM_ERROR = "{command} is not supported on this firmware version of iDRAC. \
 Enter the valid values and retry the operation."
 JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Oem/Dell/Jobs/{job_id}"
@@ -842,25 +873,26 @@ def exit_on_failure(module, scp_response, command):
         module.exit_json(msg=FAIL_MSG.format(command), scp_status=scp_response, failed=True)
 
 
+def get_local_file_path(module, share):
+    file_path = "{0}{1}{2}".format(share["share_name"], os.sep, share["file_name"])
+    if not exists(file_path):
+        module.fail_json(msg=INVALID_FILE)
+    return file_path
+
+
 def get_buffer_text(module, share):
     buffer_text = None
     if share["share_type"] == "LOCAL":
-        file_path = "{0}{1}{2}".format(share["share_name"], os.sep, share["file_name"])
-        if not exists(file_path):
-            module.fail_json(msg=INVALID_FILE)
-        with open(file_path, "r") as file_obj:
+        with open(get_local_file_path(module, share), "r") as file_obj:
             buffer_text = file_obj.read()
     return buffer_text
 
 
 def get_xml_content(module, xml_content):
-    idrac_content = None
     try:
-        root = ET.fromstring(xml_content)
-        component = next((c for c in root.iter('Component') if c.get('FQDD') == MANAGER_ID), None)
-        if component:
-            idrac_content = ET.tostring(component).decode('utf-8')
-        return idrac_content
+        idrac_content = [(name, clean_buffer_text(value).strip()) for _fqdd, name, value in
+                         iter_scp_attributes(xml_content, fqdds=[MANAGER_ID], scp_format="XML")]
+        return idrac_content or None
     except ET.ParseError:
         module.exit_json(msg=INVALID_XML_CONTENT, failed=True)
 
@@ -883,10 +915,6 @@ def compare_custom_default_configs(module, idrac):
         share, _scp_file_name_format = get_scp_share_details(module)
         share["file_name"] = module.params.get("scp_file")
         buffer_text = get_buffer_text(module, share)
-    buffer_text = clean_buffer_text(buffer_text)
-    if isinstance(idrac_cds, bytes):
-        idrac_cds = idrac_cds.decode('utf-8')
-    idrac_cds = clean_buffer_text(idrac_cds)
     imported_cds = get_xml_content(module, buffer_text)
     idrac_cds_data = get_xml_content(module, idrac_cds)
     if imported_cds == idrac_cds_data:
@@ -894,6 +922,85 @@ def compare_custom_default_configs(module, idrac):
     return diff
 
 
+def get_scp_attributes(module, scp_content):
+    """
+    Returns the attribute values of each component of an XML or JSON SCP keyed by FQDD, and the
+    parent FQDD of each nested component.
+    """
+    components, parents = {}, {}
+    try:
+        for fqdd, name, value in iter_scp_attributes(scp_content, parents=parents):
+            components.setdefault(fqdd, {})[name] = value
+    except (ET.ParseError, ValueError, KeyError, TypeError, AttributeError):
+        module.exit_json(msg=INVALID_SCP_CONTENT, failed=True)
+    return components, parents
+
+
+def get_scp_changes(module, scp_content, current_attributes):
+    """
+    Returns the attributes of the SCP to be imported that differ from the current attributes, keyed
+    by FQDD, and the parent FQDD of each component. The SCP is compared while it is parsed.
+    """
+    changes, parents = {}, {}
+    try:
+        for fqdd, name, value in iter_scp_attributes(scp_content, parents=parents):
+            if current_attributes.get(fqdd, {}).get(name) != value:
+                changes.setdefault(fqdd, {})[name] = value
+    except (ET.ParseError, ValueError, KeyError, TypeError, AttributeError):
+        module.exit_json(msg=INVALID_SCP_CONTENT, failed=True)
+    return changes, parents
+
+
+def get_scp_changes_buffer(changes, parents):
+    root = ET.Element("SystemConfiguration")
+    elements = {}
+
+    def get_component(fqdd):
+        if fqdd not in elements:
+            parent = parents.get(fqdd)
+            parent_element = get_component(parent) if parent else root
+            elements[fqdd] = ET.SubElement(parent_element, "Component", FQDD=fqdd)
+        return elements[fqdd]
+
+    for fqdd, attributes in changes.items():
+        component = get_component(fqdd)
+        for name, value in attributes.items():
+            ET.SubElement(component, "Attribute", Name=name).text = value
+    return ET.tostring(root).decode("utf-8")
+
+
+def import_scp_incremental(module, idrac):
+    command = module.params["command"]
+    scp_targets = ",".join(module.params["scp_components"])
+    import_buffer = module.params.get("import_buffer")
+    share = {}
+    if not import_buffer:
+        share, _scp_file_name_format = get_scp_share_details(module)
+        share["file_name"] = module.params.get("scp_file")
+        if share.get("share_type") != "LOCAL":
+            module.exit_json(msg=INCREMENTAL_SHARE_MSG, failed=True)
+        file_path = get_local_file_path(module, share)
+    export_resp = idrac.export_scp(export_format="JSON", export_use="Default", target=scp_targets, job_wait=True)
+    current_attributes, _parents = get_scp_attributes(module, export_resp.json_data)
+    if import_buffer:
+        changes, parents = get_scp_changes(module, import_buffer, current_attributes)
+    else:
+        with open(file_path, "rb") as file_obj:
+            changes, parents = get_scp_changes(module, file_obj, current_attributes)
+    if not changes:
+        module.exit_json(msg=NO_CHANGES_FOUND, changed=False)
+    if module.check_mode:
+        module.exit_json(msg=CHANGES_FOUND, changed=True)
+    scp_response = idrac.import_scp_share(
+        import_buffer=get_scp_changes_buffer(changes, parents), target=scp_targets, share={},
+        job_wait=module.params["job_wait"], host_powerstate=module.params["end_host_power_state"],
+        shutdown_type=module.params["shutdown_type"])
+    scp_response = wait_for_job_tracking_redfish(module, idrac, scp_response)
+    scp_response = response_format_change(scp_response, module.params, share.get("file_name"))
+    exit_on_failure(module, scp_response, command)
+    return scp_response
+
+
 def idrac_custom_option(idrac):
     url = None
     result = None
@@ -917,6 +1024,8 @@ def check_mode_custom_defaults(module, content_diff):
 
 
 def import_scp_redfish(module, idrac, http_share):
+    if module.params.get("incremental"):
+        return import_scp_incremental(module, idrac)
     import_buffer = module.params.get("import_buffer")
     command = module.params["command"]
     scp_targets = ",".join(module.params["scp_components"])
@@ -972,6 +1081,11 @@ def validate_input(module, scp_components):
                 module.fail_json(msg=MUTUALLY_EXCLUSIVE.format("scp_file"))
             if module.params.get("share_name") is not None:
                 module.fail_json(msg=MUTUALLY_EXCLUSIVE.format("share_name"))
+    if module.params["command"] == "import" and module.params.get("incremental"):
+        share_name = module.params.get("share_name")
+        if share_name is not None and (share_name.lower().startswith(("http://", "https://")) or
+                                       ":/" in share_name or "\\" in share_name):
+            module.fail_json(msg=INCREMENTAL_SHARE_MSG)
 
 
 def validate_customdefault_input(module, command):
@@ -1233,6 +1347,7 @@ def get_argument_spec():
         "proxy_port": {"type": "str", "required": False, "default": "80"},
         "proxy_username": {"type": "str", "required": False},
         "proxy_password": {"type": "str", "required": False, "no_log": True},
+        "incremental": {"type": "bool", "required": False, "default": False},
     }
 
 
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -290,7 +290,8 @@ from copy import deepcopy
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
-    get_dynamic_uri, validate_and_get_first_resource_id_uri, xml_data_conversion, idrac_redfish_job_tracking, remove_key, get_idrac_firmware_version)
+    get_dynamic_uri, validate_and_get_first_resource_id_uri, xml_data_conversion, idrac_redfish_job_tracking, remove_key, get_idrac_firmware_version,
+    concurrent_map, get_max_workers)
 
 
 SYSTEMS_URI = "/redfish/v1/Systems"
@@ -316,6 +317,8 @@ CHANGES_NOT_FOUND = "No changes found to commit!"
 CHANGES_FOUND = "Changes found to commit!"
 ODATA_ID = "@odata.id"
 ODATA_REGEX = "(.*?)@odata"
+EXPAND_QUERY = "?$expand=*($levels={0})"
+STORAGE_EXPAND_LEVELS = 2
 ATTRIBUTE = "</Attribute>"
 VIEW_OPERATION_FAILED = "Failed to fetch storage details."
 VIEW_CONTROLLER_DETAILS_NOT_FOUND = "Failed to find the controller {controller_id}."
@@ -468,6 +471,7 @@ class StorageData:
     def __init__(self, idrac, module):
         self.idrac = idrac
         self.module = module
+        self.resources = {}
 
     def fetch_controllers_uri(self):
         uri, err_msg = validate_and_get_first_resource_id_uri(
@@ -477,40 +481,89 @@ class StorageData:
         storage_controllers = get_dynamic_uri(self.idrac, uri, 'Storage')
         return storage_controllers
 
-    def fetch_api_data(self, uri, key_index_from_end):
-        key = uri.split("/")[key_index_from_end]
-        uri_data = self.idrac.invoke_request(uri, "GET")
-        return key, uri_data
+    def fetch_storage_snapshot(self):
+        """
+        Fetches the storage controllers with their drives, volumes and enclosures expanded
+        in one request, firmware which rejects the nested expand is read one level deep.
+        """
+        storage_uri = self.fetch_controllers_uri()[ODATA_ID]
+        try:
+            controllers_list = get_dynamic_uri(self.idrac, storage_uri + EXPAND_QUERY.format(STORAGE_EXPAND_LEVELS))
+        except HTTPError:
+            controllers_list = get_dynamic_uri(self.idrac, storage_uri + EXPAND_QUERY.format(1))
+        self.index_resources(controllers_list)
+        return controllers_list
+
+    def index_resources(self, data):
+        """Records every expanded resource of the response by its URI."""
+        if isinstance(data, dict):
+            if ODATA_ID in data and not self.is_link(data):
+                self.resources.setdefault(data[ODATA_ID], data)
+            for value in data.values():
+                self.index_resources(value)
+        elif isinstance(data, list):
+            for value in data:
+                self.index_resources(value)
+
+    @staticmethod
+    def is_link(data):
+        return isinstance(data, dict) and list(data.keys()) == [ODATA_ID]
+
+    def fetch_resource(self, uri):
+        return self.idrac.invoke_request(uri, "GET").json_data
+
+    def load_resources(self, uris):
+        """Fetches the resources missing from the snapshot concurrently."""
+        uris = [uri for uri in dict.fromkeys(uris) if uri not in self.resources]
+        max_workers = get_max_workers(self.module.params)
+        for uri, uri_data in zip(uris, concurrent_map(self.fetch_resource, uris, max_workers)):
+            self.resources[uri] = uri_data
+            self.index_resources(uri_data)
+
+    def resolve(self, link):
+        """Returns a copy of the resource data of a link from the snapshot."""
+        if self.is_link(link):
+            link = self.resources[link[ODATA_ID]]
+        return deepcopy(link)
 
     def all_storage_data(self):
         storage_info = {"Controllers": {}}
-        controllers_details_uri = self.fetch_controllers_uri()[ODATA_ID] + "?$expand=*($levels=1)"
-        controllers_list = get_dynamic_uri(self.idrac, controllers_details_uri)
-        for each_controller in controllers_list["Members"]:
+        controllers_list = self.fetch_storage_snapshot()
+        controllers = [each_controller for each_controller in controllers_list["Members"]
+                       if not each_controller.get("Id").startswith("CPU")]
+        leftovers = []
+        for each_controller in controllers:
+            leftovers.extend(link[ODATA_ID] for link in each_controller["Drives"] + each_controller["Links"]["Enclosures"]
+                             if self.is_link(link))
+            if self.is_link(each_controller["Volumes"]):
+                leftovers.append(each_controller["Volumes"][ODATA_ID] + EXPAND_QUERY.format(1))
+        self.load_resources(leftovers)
+        volumes_list = {}
+        for each_controller in controllers:
+            volumes = each_controller["Volumes"]
+            if self.is_link(volumes):
+                volumes = self.resources[volumes[ODATA_ID] + EXPAND_QUERY.format(1)]
+            volumes_list[each_controller["Id"]] = volumes.get("Members", [])
+        self.load_resources(link[ODATA_ID] for members in volumes_list.values() for link in members if self.is_link(link))
+        for each_controller in controllers:
             controller_id = each_controller.get("Id")
-            if controller_id.startswith("CPU"):
-                continue
             storage_info["Controllers"][controller_id] = deepcopy(each_controller)
             storage_info["Controllers"][controller_id]["Drives"] = {}
             storage_info["Controllers"][controller_id]["Volumes"] = {}
             storage_info["Controllers"][controller_id]["Links"]["Enclosures"] = {}
-            # To fetch drives data
-            for each_drive_uri in each_controller["Drives"]:
-                key, uri_data = self.fetch_api_data(each_drive_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Drives"][key] = uri_data.json_data
-
-            # To fetch volumes data
-            volume_uri = each_controller['Volumes'][ODATA_ID]
-            volumes_list = get_dynamic_uri(self.idrac, volume_uri, "Members")
-            for each_volume_uri in volumes_list:
-                key, uri_data = self.fetch_api_data(each_volume_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Volumes"][key] = uri_data.json_data
-            # To fetch enclosures
-            for each_enclosure_uri in each_controller["Links"]["Enclosures"]:
-                key, uri_data = self.fetch_api_data(each_enclosure_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Links"]["Enclosures"][key] = uri_data.json_data
+            for each_drive in each_controller["Drives"]:
+                storage_info["Controllers"][controller_id]["Drives"][self.link_key(each_drive)] = self.resolve(each_drive)
+            for each_volume in volumes_list[controller_id]:
+                storage_info["Controllers"][controller_id]["Volumes"][self.link_key(each_volume)] = self.resolve(each_volume)
+            for each_enclosure in each_controller["Links"]["Enclosures"]:
+                storage_info["Controllers"][controller_id]["Links"]["Enclosures"][self.link_key(each_enclosure)] = \
+                    self.resolve(each_enclosure)
         return storage_info
 
+    @staticmethod
+    def link_key(link):
+        return link[ODATA_ID].split("/")[-1]
+
     def fetch_storage_data(self):
         storage_info = {"Controller": {}}
         storage_data = self.all_storage_data()
@@ -531,7 +584,7 @@ class StorageData:
         if controller_data["Volumes"]:
             storage_info.setdefault("Controller", {}).setdefault(controller_id, {})["VirtualDisk"] = {}
             for volume_id, volume_data in controller_data["Volumes"].items():
-                physical_disk = [self.fetch_api_data(drive[ODATA_ID], -1)[0] for drive in volume_data["Links"]["Drives"]]
+                physical_disk = [self.link_key(drive) for drive in volume_data["Links"]["Drives"]]
                 storage_info["Controller"][controller_id]["VirtualDisk"][volume_id] = {"PhysicalDisk": physical_disk}
 
     def fetch_enclosures_and_physical_disk(self, controller_id, controller_data, storage_info):
@@ -542,7 +595,7 @@ class StorageData:
             storage_info["Controller"][controller_id].setdefault("Enclosure", {})
             for enclosure_id in enclosures:
                 storage_info["Controller"][controller_id]["Enclosure"][enclosure_id] = {"EnclosureSensor": {enclosure_id: {}}}
-                physical_disk = [self.fetch_api_data(drive[ODATA_ID], -1)[0] for drive in
+                physical_disk = [self.link_key(drive) for drive in
                                  controller_data["Links"]["Enclosures"][enclosure_id]["Links"]["Drives"]]
                 if physical_disk:
                     storage_info["Controller"][controller_id]["Enclosure"][enclosure_id]["PhysicalDisk"] = physical_disk
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.1.0
-# Copyright (C) 2021-2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -21,7 +21,29 @@ version_added: "3.0.0"
 description:
     - Get the PowerEdge Server System Inventory.
 extends_documentation_fragment:
+  - dellemc.openmanage.idrac_fanout_options
   - dellemc.openmanage.idrac_auth_options
+options:
+  backend:
+    description:
+      - Protocol used to collect the inventory.
+      - C(wsman) collects the inventory through OMSDK, which enumerates every WS-Man class of the server.
+      - C(redfish) collects the inventory from the Redfish collections of the requested I(components) only,
+        the collections are read with C($expand) and fetched concurrently.
+    type: str
+    choices: [wsman, redfish]
+    default: wsman
+    version_added: 9.9.0
+  components:
+    description:
+      - Components of the inventory to be returned.
+      - If not specified, all the components are returned.
+      - With I(backend=redfish), only the requested components are fetched from iDRAC.
+    type: list
+    elements: str
+    choices: [System, BIOS, iDRAC, CPU, Memory, Controller, PhysicalDisk, VirtualDisk, Enclosure, Fan,
+              PowerSupply, NIC, PCIeSSDBackPlane, PresenceAndStatusSensor, Video, PCIDevice, Firmware, License]
+    version_added: 9.9.0
 
 requirements:
     - "omsdk >= 1.2.488"
@@ -29,6 +51,12 @@ requirements:
 author: "Rajeev Arakkal (@rajeevarakkal)"
 notes:
     - Run this module from a system that has direct access to Dell iDRAC.
+    - omsdk is required to be installed only for I(backend=wsman).
+    - With I(backend=redfish), each component lists the standard Redfish properties merged with the Dell OEM
+      properties of the resource, C(FQDD), C(Key) and C(InstanceID) are set from the resource identifier.
+      The property names differ from the ones returned with I(backend=wsman).
+    - With I(backend=redfish), the requests are sent one after the other by default, set the
+      C(OMAM_MAX_WORKERS) environment variable to the number of concurrent requests to send them concurrently.
     - This module supports both IPv4 and IPv6 address for I(idrac_ip).
     - This module supports C(check_mode).
 """
@@ -41,6 +69,30 @@ EXAMPLES = """
     idrac_user: "user_name"
     idrac_password: "user_password"
     ca_path: "/path/to/ca_cert.pem"
+
+- name: Get the CPU, memory and firmware inventory through Redfish
+  dellemc.openmanage.idrac_system_info:
+    idrac_ip: "192.168.0.1"
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    backend: redfish
+    components:
+      - CPU
+      - Memory
+      - Firmware
+
+- name: Get System Inventory from several iDRACs concurrently
+  dellemc.openmanage.idrac_system_info:
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    backend: redfish
+    ca_path: "/path/to/ca_cert.pem"
+    max_workers: 16
+    targets:
+      - idrac_ip: "192.168.0.1"
+      - idrac_ip: "192.168.0.2"
+        timeout: 60
 """
 
 RETURN = r'''
@@ -52,7 +104,11 @@ msg:
   sample: "Successfully fetched the system inventory details."
 system_info:
   type: dict
-  description: Details of the PowerEdge Server System Inventory.
+  description:
+    - Details of the PowerEdge Server System Inventory.
+    - With I(backend=wsman), the components list the WS-Man properties, as in the sample.
+    - With I(backend=redfish), the components list the Redfish and Dell OEM properties of the resources instead,
+      for example C(BIOS) is the C(Bios) resource of the system with its C(Attributes).
   returned: success
   sample: {
             "BIOS": [
@@ -66,6 +122,20 @@ system_info:
                 }
             ]
   }
+results:
+  description: Result of each target keyed by its host, returned when I(targets) is specified.
+  returned: when targets is specified
+  type: dict
+  sample: {
+    "192.168.0.1": {
+      "msg": "Successfully fetched the system inventory details.",
+      "system_info": {"BIOS": []}
+    },
+    "192.168.0.2": {
+      "msg": "<urlopen error [Errno 113] No route to host>",
+      "unreachable": true
+    }
+  }
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -89,23 +159,189 @@ error_info:
 '''
 
 import json
+import re
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
+    SYSTEMS_URI, MANAGERS_URI, SYSTEM_ID, MANAGER_ID, ResourceFetcher, get_max_workers, fanout_argument_spec,
+    check_fanout_options, exit_fan_out)
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
+SYSTEM_URI = "{0}/{1}".format(SYSTEMS_URI, SYSTEM_ID)
+MANAGER_URI = "{0}/{1}".format(MANAGERS_URI, MANAGER_ID)
+CHASSIS_URI = "/redfish/v1/Chassis"
+SYSTEM_CHASSIS_URI = "{0}/{1}".format(CHASSIS_URI, SYSTEM_ID)
+EXPAND = "?$expand=*($levels={0})"
+ODATA_ID = "@odata.id"
+ODATA_REGEX = r".*@odata\."
+NOT_FOUND_CODES = (400, 404, 405)
+SKIP_KEYS = ("Links", "Actions", "Oem")
+# Components which are read from the members of a Redfish collection.
+COLLECTIONS = {
+    "CPU": SYSTEM_URI + "/Processors",
+    "Memory": SYSTEM_URI + "/Memory",
+    "Enclosure": CHASSIS_URI + "/Oem/Dell/DellEnclosures",
+    "Fan": SYSTEM_CHASSIS_URI + "/ThermalSubsystem/Fans",
+    "PowerSupply": SYSTEM_CHASSIS_URI + "/PowerSubsystem/PowerSupplies",
+    "NIC": SYSTEM_URI + "/EthernetInterfaces",
+    "PCIeSSDBackPlane": CHASSIS_URI + "/Oem/Dell/DellPCIeSSDBackPlanes",
+    "PresenceAndStatusSensor": SYSTEM_URI + "/Oem/Dell/DellPresenceAndStatusSensors",
+    "Video": SYSTEM_URI + "/Oem/Dell/DellVideo",
+    "PCIDevice": SYSTEM_CHASSIS_URI + "/PCIeDevices",
+    "Firmware": "/redfish/v1/UpdateService/FirmwareInventory",
+    "License": "/redfish/v1/LicenseService/Licenses",
+}
+COMPONENTS = ["System", "BIOS", "iDRAC", "CPU", "Memory", "Controller", "PhysicalDisk", "VirtualDisk", "Enclosure",
+              "Fan", "PowerSupply", "NIC", "PCIeSSDBackPlane", "PresenceAndStatusSensor", "Video", "PCIDevice",
+              "Firmware", "License"]
 
-# Main
-def main():
-    specs = {}
-    specs.update(idrac_auth_params)
-    module = AnsibleModule(
-        argument_spec=specs,
-        supports_check_mode=True)
+
+def is_link(data):
+    return isinstance(data, dict) and list(data.keys()) == [ODATA_ID]
+
+
+def is_resource(data):
+    """Links and expanded resources or collections, which are listed by their own component."""
+    if isinstance(data, list):
+        return bool(data) and all(is_resource(item) for item in data)
+    return isinstance(data, dict) and ODATA_ID in data
+
+
+def flatten_resource(resource):
+    """
+    Converts a Redfish resource to an inventory entry, the standard properties are merged
+    with the Dell OEM properties and the links to other resources are dropped.
+    """
+    entry = {}
+    for key, value in resource.items():
+        if key in SKIP_KEYS or re.match(ODATA_REGEX, key) or is_resource(value):
+            continue
+        entry[key] = value
+    for key, value in resource.get("Oem", {}).get("Dell", {}).items():
+        if key.startswith("Dell") and isinstance(value, dict):
+            entry.update((oem_key, oem_val) for oem_key, oem_val in value.items()
+                         if not re.match(ODATA_REGEX, oem_key) and not is_resource(oem_val))
+    fqdd = entry.get("FQDD") or resource.get("Id")
+    if fqdd:
+        entry["FQDD"] = fqdd
+        entry.setdefault("Key", fqdd)
+        entry.setdefault("InstanceID", fqdd)
+    return entry
+
+
+class RedfishInventory(ResourceFetcher):
+    """Builds the system inventory from Redfish, every resource is fetched once per run."""
+
+    def __init__(self, idrac, max_workers):
+        super(RedfishInventory, self).__init__(idrac, max_workers, missing_codes=NOT_FOUND_CODES)
+
+    def resolve(self, links):
+        """Returns the resources of the links, fetching the ones that are not expanded concurrently."""
+        resources = self.map(lambda link: self.get(link[ODATA_ID]) if is_link(link) else link, links)
+        return [resource for resource in resources if resource is not None]
+
+    def get_members(self, uri, levels=1):
+        collection = self.get(uri + EXPAND.format(levels))
+        if collection is None:
+            return None
+        return self.resolve(collection.get("Members", []))
+
+    def get_system(self):
+        system = self.get(SYSTEM_URI)
+        return [flatten_resource(system)] if system is not None else None
+
+    def get_bios(self):
+        bios = self.get(SYSTEM_URI + "/Bios")
+        return [flatten_resource(bios)] if bios is not None else None
+
+    def get_idrac(self):
+        manager = self.get(MANAGER_URI)
+        return [flatten_resource(manager)] if manager is not None else None
+
+    def _get_storage(self):
+        # Two levels return the drives of every controller with the controllers.
+        storage = self.get_members(SYSTEM_URI + "/Storage", levels=2)
+        if storage is None:
+            return None
+        return [member for member in storage if not member.get("Id", "").startswith("CPU")]
+
+    def get_controller(self):
+        storage = self._get_storage()
+        return [flatten_resource(member) for member in storage] if storage is not None else None
+
+    def get_physical_disk(self):
+        storage = self._get_storage()
+        if storage is None:
+            return None
+        drives = self.resolve([drive for member in storage for drive in member.get("Drives", [])])
+        return [flatten_resource(drive) for drive in drives]
+
+    def get_virtual_disk(self):
+        storage = self._get_storage()
+        if storage is None:
+            return None
+        volumes = []
+        for members in self.map(self.get_members, [member["Volumes"][ODATA_ID] for member in storage
+                                                   if "Volumes" in member]):
+            volumes.extend(members or [])
+        return [flatten_resource(volume) for volume in volumes]
+
+    def get_collection(self, component):
+        members = self.get_members(COLLECTIONS[component])
+        if members is None:
+            return None
+        if component == "CPU":
+            members = [member for member in members if member.get("ProcessorType", "CPU") == "CPU"]
+        return [flatten_resource(member) for member in members]
+
+    def get_component(self, component):
+        getter = COMPONENT_GETTERS.get(component)
+        if getter is None:
+            return self.get_collection(component)
+        return getter(self)
+
+    def get_inventory(self, components):
+        inventory = {}
+        for component, entries in zip(components, self.map(self.get_component, components)):
+            if entries is not None:
+                inventory[component] = entries
+        return inventory
+
+
+COMPONENT_GETTERS = {
+    "System": RedfishInventory.get_system,
+    "BIOS": RedfishInventory.get_bios,
+    "iDRAC": RedfishInventory.get_idrac,
+    "Controller": RedfishInventory.get_controller,
+    "PhysicalDisk": RedfishInventory.get_physical_disk,
+    "VirtualDisk": RedfishInventory.get_virtual_disk,
+}
+
+
+def get_redfish_inventory(module):
+    components = list(dict.fromkeys(module.params.get("components") or COMPONENTS))
+    with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+        return RedfishInventory(idrac, get_max_workers(module.params)).get_inventory(components)
+
+
+def get_wsman_inventory(module):
+    with iDRACConnection(module.params) as idrac:
+        idrac.get_entityjson()
+        system_info = idrac.get_json_device()
+    components = module.params.get("components")
+    if components and isinstance(system_info, dict):
+        system_info = dict((key, value) for key, value in system_info.items() if key in components)
+    return system_info
+
+
+def run_module(module):
     try:
-        with iDRACConnection(module.params) as idrac:
-            idrac.get_entityjson()
-            msg = idrac.get_json_device()
+        if module.params["backend"] == "redfish":
+            msg = get_redfish_inventory(module)
+        else:
+            msg = get_wsman_inventory(module)
     except HTTPError as err:
         module.fail_json(msg=str(err), error_info=json.load(err))
     except URLError as err:
@@ -117,5 +353,24 @@ def main():
                      system_info=msg)
 
 
+# Main
+def main():
+    specs = {
+        "backend": {"type": "str", "choices": ["wsman", "redfish"], "default": "wsman"},
+        "components": {"type": "list", "elements": "str", "choices": COMPONENTS},
+    }
+    specs.update(idrac_auth_params)
+    specs.update(fanout_argument_spec(idrac_auth_params, "idrac_ip"))
+    module = AnsibleModule(
+        argument_spec=specs,
+        mutually_exclusive=[("idrac_ip", "targets")],
+        required_one_of=[("idrac_ip", "targets")],
+        supports_check_mode=True)
+    check_fanout_options(module, [("idrac_user",), ("idrac_password",)])
+    if module.params.get("targets"):
+        exit_fan_out(run_module, module, "idrac_ip")
+    run_module(module)
+
+
 if __name__ == '__main__':
     main()
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2018-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2018-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -23,6 +23,7 @@ description:
   - Add a new user account.
   - Edit a user account.
   - Enable or Disable a user account.
+  - Add, edit or remove several user accounts in one run with I(users).
 extends_documentation_fragment:
   - dellemc.openmanage.idrac_x_auth_options
 options:
@@ -35,8 +36,9 @@ options:
     default: present
   user_name:
     type: str
-    required: true
-    description: Provide the I(user_name) of the account to be created, deleted or modified.
+    description:
+      - Provide the I(user_name) of the account to be created, deleted or modified.
+      - I(user_name) is mutually exclusive with I(users), one of them is required.
   user_password:
     type: str
     description:
@@ -100,11 +102,74 @@ options:
       - Advanced Encryption Standard C(AES).
       - A privacy protocol is not configured if C(None) is selected.
     choices: [None, DES, AES]
+  users:
+    type: list
+    elements: dict
+    version_added: 9.9.0
+    description:
+      - List of user accounts to be created, modified or deleted in one run.
+      - The user slots are read once and the changes of all the user accounts are applied together,
+        the options of the module other than the connection options do not apply to the user accounts.
+      - I(users) is mutually exclusive with I(user_name).
+    suboptions:
+      state:
+        type: str
+        description:
+          - Select C(present) to create or modify the user account.
+          - Select C(absent) to remove the user account.
+        choices: [present, absent]
+        default: present
+      user_name:
+        type: str
+        required: true
+        description: The I(user_name) of the account to be created, deleted or modified.
+      user_password:
+        type: str
+        description: The password for the user account.
+      new_user_name:
+        type: str
+        description: The new I(user_name) of the account to be modified.
+      privilege:
+        type: str
+        description:
+          - The role-based privilege assigned to the user.
+          - Will be ignored, if I(custom_privilege) is provided.
+        choices: [Administrator, ReadOnly, Operator, None]
+      custom_privilege:
+        type: int
+        description: The privilege level assigned to the user.
+      ipmi_lan_privilege:
+        type: str
+        description: The Intelligent Platform Management Interface LAN privilege level assigned to the user.
+        choices: [Administrator, Operator, User, No Access]
+      ipmi_serial_privilege:
+        type: str
+        description: The Intelligent Platform Management Interface Serial Port privilege level assigned to the user.
+        choices: [Administrator, Operator, User, No Access]
+      enable:
+        type: bool
+        description: Enables the user to log in to iDRAC.
+      sol_enable:
+        type: bool
+        description: Enables Serial Over Lan (SOL) for the user.
+      protocol_enable:
+        type: bool
+        description: Enables protocol for the user.
+      authentication_protocol:
+        type: str
+        description: The authentication protocol of the user.
+        choices: [None, SHA, MD5]
+      privacy_protocol:
+        type: str
+        description: The privacy encryption protocol of the user.
+        choices: [None, DES, AES]
 requirements:
   - "python >= 3.9.6"
 author: "Felix Stephen (@felixs88)"
 notes:
     - Run this module from a system that has direct access to Dell iDRAC.
+    - The user slots are read from the iDRAC Accounts collection, the server configuration profile is exported
+      only when the iDRAC does not support the expanded query of the collection.
     - This module supports C(check_mode).
 """
 
@@ -147,6 +212,21 @@ EXAMPLES = """
     ca_path: "/path/to/ca_cert.pem"
     state: absent
     user_name: user_name
+
+- name: Rotate the passwords of several iDRAC users and remove a user
+  dellemc.openmanage.idrac_user:
+    idrac_ip: 198.162.0.1
+    idrac_user: idrac_user
+    idrac_password: idrac_password
+    ca_path: "/path/to/ca_cert.pem"
+    users:
+      - user_name: svc_backup
+        user_password: user_password_1
+      - user_name: svc_monitor
+        user_password: user_password_2
+        privilege: ReadOnly
+      - user_name: svc_legacy
+        state: absent
 """
 
 RETURN = r'''
@@ -180,6 +260,27 @@ status:
       "Resolution": "No response action is required.",
       "Severity": "Informational"}
       ]}
+users:
+  description: Outcome of each user account of I(users).
+  returned: when users is specified
+  type: list
+  elements: dict
+  sample: [
+    {
+      "user_name": "svc_backup",
+      "state": "present",
+      "slot_id": 3,
+      "changed": true,
+      "msg": "Successfully updated user account."
+    },
+    {
+      "user_name": "svc_legacy",
+      "state": "absent",
+      "slot_id": null,
+      "changed": false,
+      "msg": "The user account is absent."
+    }
+  ]
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -210,14 +311,28 @@ from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import TargetModule, TargetExit
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 ACCOUNT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/"
+ACCOUNTS_EXPAND_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Accounts?$expand=*($levels=1)"
 ATTRIBUTE_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Attributes/"
 USER_ROLES = {"Administrator": 511, "Operator": 499, "ReadOnly": 1, "None": 0}
 ACCESS = {0: "Disabled", 1: "Enabled"}
 INVALID_PRIVILAGE_MSG = "custom_privilege value should be from 0 to 511."
 INVALID_PRIVILAGE_MIN = 0
 INVALID_PRIVILAGE_MAX = 511
+USER_SLOTS = tuple(range(2, 17))
+CREATED_MSG = "Successfully created user account."
+UPDATED_MSG = "Successfully updated user account."
+DELETED_MSG = "Successfully deleted user account."
+NO_CHANGE_MSG = "Requested changes are already present in the user slot."
+ABSENT_MSG = "The user account is absent."
+MAX_USERS_MSG = "Maximum number of users reached. Delete a user account and retry the operation."
+BATCH_SUCCESS_MSG = "Successfully applied the changes to the user accounts."
+BATCH_NO_CHANGE_MSG = "Requested changes are already present in the user slots."
+CHANGES_FOUND_MSG = "Changes found to commit!"
+NO_CHANGES_FOUND_MSG = "No changes found to commit!"
 
 
 def compare_payload(json_payload, idrac_attr):
@@ -242,28 +357,93 @@ def compare_payload(json_payload, idrac_attr):
     return is_change_required
 
 
-def get_user_account(module, idrac):
+def get_user_slots(idrac):
+    """
+    Returns the user name of each user slot, read with one expanded query of the Accounts collection.
+    :param idrac: idrac object
+    :return: dict of user name by slot id, None if the iDRAC does not support the expanded query
+    """
+    try:
+        resp = idrac.invoke_request(ACCOUNTS_EXPAND_URI, "GET")
+    except HTTPError:
+        return None
+    user_names = {}
+    for member in resp.json_data.get("Members", []):
+        if not isinstance(member, dict) or "UserName" not in member:
+            return None
+        if str(member.get("Id")).isdigit():
+            user_names[int(member["Id"])] = member["UserName"] or ""
+    return user_names or None
+
+
+def get_user_attributes(idrac):
+    """
+    Returns the user attributes of the iDRAC in the format of the exported server configuration profile.
+    :param idrac: idrac object
+    :return: dict of user attributes
+    """
+    resp = idrac.invoke_request(ATTRIBUTE_URI, "GET")
+    attributes = resp.json_data.get("Attributes", {})
+    return dict((re.sub(r"(?<=\d)\.", "#", key), "" if val is None else str(val))
+                for key, val in attributes.items() if key.startswith("Users."))
+
+
+class AccountSnapshot(object):
+    """
+    User slots of the iDRAC read once and shared by the user account operations of a run.
+    The server configuration profile is exported only if the Accounts collection cannot be expanded.
+    """
+
+    def __init__(self, idrac):
+        self.idrac = idrac
+        self.user_attributes = None
+        self.user_names = get_user_slots(idrac)
+        if self.user_names is None:
+            response = idrac.export_scp(export_format="JSON", export_use="Default", target="IDRAC", job_wait=True)
+            self.user_attributes = idrac.get_idrac_local_account_attr(response.json_data, fqdd="iDRAC.Embedded.1")
+            self.user_names = dict((num, self.user_attributes.get("Users.{0}#UserName".format(num)) or "")
+                                   for num in USER_SLOTS)
+
+    def get_user_attributes(self):
+        """Returns the user attributes of all the slots, they are only needed to compare a modified account."""
+        if self.user_attributes is None:
+            self.user_attributes = get_user_attributes(self.idrac)
+        return self.user_attributes
+
+    def find_slot(self, user_name):
+        for num in USER_SLOTS:
+            if self.user_names.get(num) == user_name:
+                return num
+        return None
+
+    def find_empty_slot(self):
+        for num in USER_SLOTS:
+            if self.user_names.get(num) == "":
+                return num
+        return None
+
+
+def get_user_account(module, idrac, snapshot=None):
     """
     This function gets the slot id and slot uri for create and modify.
     :param module: ansible module arguments
     :param idrac: idrac objects
+    :param snapshot: (optional) account snapshot already read in this run
     :return: user_attr, slot_uri, slot_id, empty_slot, empty_slot_uri
     """
     slot_uri, slot_id, empty_slot, empty_slot_uri = None, None, None, None
     if not module.params["user_name"]:
         module.fail_json(msg="User name is not valid.")
-    response = idrac.export_scp(export_format="JSON", export_use="Default", target="IDRAC", job_wait=True)
-    user_attributes = idrac.get_idrac_local_account_attr(response.json_data, fqdd="iDRAC.Embedded.1")
-    slot_num = tuple(range(2, 17))
-    for num in slot_num:
-        user_name = "Users.{0}#UserName".format(num)
-        if user_attributes.get(user_name) == module.params["user_name"]:
-            slot_id = num
-            slot_uri = ACCOUNT_URI + str(num)
-            break
-        if not user_attributes.get(user_name) and (empty_slot_uri and empty_slot) is None:
-            empty_slot = num
-            empty_slot_uri = ACCOUNT_URI + str(num)
+    snapshot = snapshot or AccountSnapshot(idrac)
+    slot_id = snapshot.find_slot(module.params["user_name"])
+    if slot_id is not None:
+        slot_uri = ACCOUNT_URI + str(slot_id)
+        user_attributes = snapshot.get_user_attributes()
+    else:
+        user_attributes = snapshot.user_attributes or {}
+        empty_slot = snapshot.find_empty_slot()
+        if empty_slot is not None:
+            empty_slot_uri = ACCOUNT_URI + str(empty_slot)
     return user_attributes, slot_uri, slot_id, empty_slot, empty_slot_uri
 
 
@@ -331,34 +511,36 @@ def create_or_modify_account(module, idrac, slot_uri, slot_id, empty_slot_id, em
     generation, firmware_version = idrac.get_server_generation
     msg, response = "Unable to retrieve the user details.", {}
     if (slot_id and slot_uri) is None and (empty_slot_id and empty_slot_uri) is not None:
-        msg = "Successfully created user account."
+        msg = CREATED_MSG
         payload = get_payload(module, empty_slot_id, action="create")
         if module.check_mode:
-            module.exit_json(msg="Changes found to commit!", changed=True)
+            module.exit_json(msg=CHANGES_FOUND_MSG, changed=True)
         if generation >= 14:
             response = idrac.invoke_request(ATTRIBUTE_URI, "PATCH", data={"Attributes": payload})
         elif generation < 14:
             xml_payload, json_payload = convert_payload_xml(payload)
             time.sleep(10)
+            record_sleep(10)
             response = idrac.import_scp(import_buffer=xml_payload, target="ALL", job_wait=True)
     elif (slot_id and slot_uri) is not None:
-        msg = "Successfully updated user account."
+        msg = UPDATED_MSG
         payload = get_payload(module, slot_id, action="update")
         xml_payload, json_payload = convert_payload_xml(payload)
         value = compare_payload(json_payload, user_attr)
         if module.check_mode:
             if value:
-                module.exit_json(msg="Changes found to commit!", changed=True)
-            module.exit_json(msg="No changes found to commit!")
+                module.exit_json(msg=CHANGES_FOUND_MSG, changed=True)
+            module.exit_json(msg=NO_CHANGES_FOUND_MSG)
         if not value:
-            module.exit_json(msg="Requested changes are already present in the user slot.")
+            module.exit_json(msg=NO_CHANGE_MSG)
         if generation >= 14:
             response = idrac.invoke_request(ATTRIBUTE_URI, "PATCH", data={"Attributes": payload})
         elif generation < 14:
             time.sleep(10)
+            record_sleep(10)
             response = idrac.import_scp(import_buffer=xml_payload, target="ALL", job_wait=True)
     elif (slot_id and slot_uri and empty_slot_id and empty_slot_uri) is None:
-        module.fail_json(msg="Maximum number of users reached. Delete a user account and retry the operation.")
+        module.fail_json(msg=MAX_USERS_MSG)
     return response, msg
 
 
@@ -371,18 +553,19 @@ def remove_user_account(module, idrac, slot_uri, slot_id):
     :param slot_id: user slot id.
     :return: json.
     """
-    response, msg = {}, "Successfully deleted user account."
+    response, msg = {}, DELETED_MSG
     payload = get_payload(module, slot_id, action="delete")
     xml_payload, json_payload = convert_payload_xml(payload)
     if module.check_mode and (slot_id and slot_uri) is not None:
-        module.exit_json(msg="Changes found to commit!", changed=True)
+        module.exit_json(msg=CHANGES_FOUND_MSG, changed=True)
     elif module.check_mode and (slot_uri and slot_id) is None:
-        module.exit_json(msg="No changes found to commit!")
+        module.exit_json(msg=NO_CHANGES_FOUND_MSG)
     elif not module.check_mode and (slot_uri and slot_id) is not None:
         time.sleep(10)
+        record_sleep(10)
         response = idrac.import_scp(import_buffer=xml_payload, target="ALL", job_wait=True)
     else:
-        module.exit_json(msg="The user account is absent.")
+        module.exit_json(msg=ABSENT_MSG)
     return response, msg
 
 
@@ -394,11 +577,97 @@ def validate_input(module):
             module.fail_json(msg=INVALID_PRIVILAGE_MSG)
 
 
+def get_batch_payload(module, snapshot):
+    """
+    This function plans the change of each user account of I(users) against one account snapshot.
+    :param module: ansible module arguments
+    :param snapshot: account snapshot of the iDRAC
+    :return: payload of the created and modified accounts, payload of the deleted accounts, result of each user
+    """
+    present_payload, absent_payload, results = {}, {}, []
+    for user in module.params["users"]:
+        user_module = TargetModule(module, user)
+        try:
+            validate_input(user_module)
+        except TargetExit as exit_result:
+            module.fail_json(users=results, **exit_result.result)
+        slot_id = snapshot.find_slot(user["user_name"])
+        result = {"user_name": user["user_name"], "state": user["state"], "slot_id": slot_id, "changed": False}
+        if user["state"] == "absent":
+            result["msg"] = ABSENT_MSG
+            if slot_id is not None:
+                absent_payload.update(get_payload(user_module, slot_id, action="delete"))
+                snapshot.user_names[slot_id] = None
+                result.update(changed=True, msg=DELETED_MSG)
+        elif slot_id is None:
+            slot_id = snapshot.find_empty_slot()
+            if slot_id is None:
+                module.fail_json(msg=MAX_USERS_MSG, users=results)
+            present_payload.update(get_payload(user_module, slot_id, action="create"))
+            snapshot.user_names[slot_id] = user["user_name"]
+            result.update(slot_id=slot_id, changed=True, msg=CREATED_MSG)
+        else:
+            payload = get_payload(user_module, slot_id, action="update")
+            xml_payload, json_payload = convert_payload_xml(payload)
+            result["msg"] = NO_CHANGE_MSG
+            if compare_payload(json_payload, snapshot.get_user_attributes()):
+                present_payload.update(payload)
+                result.update(changed=True, msg=UPDATED_MSG)
+            if user["new_user_name"] is not None:
+                snapshot.user_names[slot_id] = user["new_user_name"]
+        results.append(result)
+    return present_payload, absent_payload, results
+
+
+def apply_user_accounts(module, idrac):
+    """
+    Creates, modifies and deletes the user accounts of I(users) with one account snapshot,
+    one attribute update and one server configuration profile import at most.
+    :param module: ansible module arguments
+    :param idrac: idrac object
+    """
+    snapshot = AccountSnapshot(idrac)
+    present_payload, absent_payload, results = get_batch_payload(module, snapshot)
+    changed = bool(present_payload or absent_payload)
+    if module.check_mode:
+        module.exit_json(msg=CHANGES_FOUND_MSG if changed else NO_CHANGES_FOUND_MSG, changed=changed, users=results)
+    if not changed:
+        module.exit_json(msg=BATCH_NO_CHANGE_MSG, users=results)
+    generation, firmware_version = idrac.get_server_generation
+    scp_payload = dict(absent_payload)
+    if present_payload and generation >= 14:
+        response = idrac.invoke_request(ATTRIBUTE_URI, "PATCH", data={"Attributes": present_payload})
+        check_response(module, response)
+    else:
+        scp_payload.update(present_payload)
+    if scp_payload:
+        xml_payload, json_payload = convert_payload_xml(scp_payload)
+        time.sleep(10)
+        record_sleep(10)
+        response = idrac.import_scp(import_buffer=xml_payload, target="ALL", job_wait=True)
+        check_response(module, response)
+    module.exit_json(msg=BATCH_SUCCESS_MSG, users=results, changed=True)
+
+
+def check_response(module, response):
+    """Fails the module if the iDRAC reported an error while applying the user configuration."""
+    error = response.json_data.get("error")
+    oem = response.json_data.get("Oem")
+    if oem:
+        oem_msg = oem.get("Dell").get("Message")
+        error_msg = ["Unable to complete application of configuration profile values.",
+                     "Import of Server Configuration Profile operation completed with errors."]
+        if oem_msg in error_msg:
+            module.fail_json(msg=oem_msg, error_info=response.json_data)
+    if error:
+        module.fail_json(msg=error.get("message"), error_info=response.json_data)
+
+
 def main():
     specs = {
         "state": {"required": False, "choices": ['present', 'absent'], "default": "present"},
         "new_user_name": {"required": False},
-        "user_name": {"required": True},
+        "user_name": {"required": False},
         "user_password": {"required": False, "no_log": True},
         "privilege": {"required": False, "choices": ['Administrator', 'ReadOnly', 'Operator', 'None']},
         "custom_privilege": {"required": False, "type": "int"},
@@ -409,29 +678,42 @@ def main():
         "protocol_enable": {"required": False, "type": "bool"},
         "authentication_protocol": {"required": False, "choices": ['SHA', 'MD5', 'None']},
         "privacy_protocol": {"required": False, "choices": ['AES', 'DES', 'None']},
+        "users": {
+            "type": "list", "elements": "dict",
+            "options": {
+                "state": {"choices": ['present', 'absent'], "default": "present"},
+                "user_name": {"required": True},
+                "user_password": {"no_log": True},
+                "new_user_name": {},
+                "privilege": {"choices": ['Administrator', 'ReadOnly', 'Operator', 'None']},
+                "custom_privilege": {"type": "int"},
+                "ipmi_lan_privilege": {"choices": ['Administrator', 'Operator', 'User', 'No Access']},
+                "ipmi_serial_privilege": {"choices": ['Administrator', 'Operator', 'User', 'No Access']},
+                "enable": {"type": "bool"},
+                "sol_enable": {"type": "bool"},
+                "protocol_enable": {"type": "bool"},
+                "authentication_protocol": {"choices": ['SHA', 'MD5', 'None']},
+                "privacy_protocol": {"choices": ['AES', 'DES', 'None']},
+            },
+        },
     }
     module = IdracAnsibleModule(
         argument_spec=specs,
+        mutually_exclusive=[("user_name", "users")],
+        required_one_of=[("user_name", "users")],
         supports_check_mode=True)
     try:
         validate_input(module)
         with iDRACRedfishAPI(module.params, req_session=True) as idrac:
+            if module.params["users"]:
+                apply_user_accounts(module, idrac)
             user_attr, slot_uri, slot_id, empty_slot_id, empty_slot_uri = get_user_account(module, idrac)
             if module.params["state"] == "present":
                 response, message = create_or_modify_account(module, idrac, slot_uri, slot_id, empty_slot_id,
                                                              empty_slot_uri, user_attr)
             elif module.params["state"] == "absent":
                 response, message = remove_user_account(module, idrac, slot_uri, slot_id)
-            error = response.json_data.get("error")
-            oem = response.json_data.get("Oem")
-            if oem:
-                oem_msg = oem.get("Dell").get("Message")
-                error_msg = ["Unable to complete application of configuration profile values.",
-                             "Import of Server Configuration Profile operation completed with errors."]
-                if oem_msg in error_msg:
-                    module.fail_json(msg=oem_msg, error_info=response.json_data)
-            if error:
-                module.fail_json(msg=error.get("message"), error_info=response.json_data)
+            check_response(module, response)
             module.exit_json(msg=message, status=response.json_data, changed=True)
     except HTTPError as err:
         module.fail_json(msg=str(err), error_info=json.load(err))
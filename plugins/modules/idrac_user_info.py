@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2022-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -22,6 +22,7 @@ description:
    - "This module retrieves the list and basic details of all users or details of a specific user on
    iDRAC"
 extends_documentation_fragment:
+  - dellemc.openmanage.idrac_fanout_options
   - dellemc.openmanage.idrac_x_auth_options
 options:
   user_id:
@@ -66,6 +67,17 @@ EXAMPLES = """
     idrac_password: idrac_password
     ca_path: "/path/to/ca_cert.pem"
     username: user_name
+
+- name: Retrieve basic details of all user accounts from several iDRACs concurrently
+  dellemc.openmanage.idrac_user_info:
+    idrac_user: idrac_user
+    idrac_password: idrac_password
+    ca_path: "/path/to/ca_cert.pem"
+    max_workers: 16
+    targets:
+      - idrac_ip: 198.162.0.1
+      - idrac_ip: 198.162.0.2
+        timeout: 60
 """
 
 RETURN = r'''
@@ -89,6 +101,20 @@ user_info:
     "RoleId": "None",
     "UserName": ""
   }]
+results:
+  description: Result of each target keyed by its host, returned when I(targets) is specified.
+  returned: when targets is specified
+  type: dict
+  sample: {
+    "192.168.0.1": {
+      "msg": "Successfully retrieved the information of 2 user(s).",
+      "user_info": []
+    },
+    "192.168.0.2": {
+      "msg": "<urlopen error [Errno 113] No route to host>",
+      "unreachable": true
+    }
+  }
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -116,8 +142,10 @@ import json
 from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule, \
+    idrac_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict, fanout_argument_spec, \
+    exit_fan_out
 
 
 ACCOUNT = "/redfish/v1"
@@ -187,19 +215,7 @@ def get_all_accounts(idrac, account_uri):
     return idrac_list
 
 
-def main():
-    specs = {
-        "user_id": {"type": 'int'},
-        "username": {"type": 'str'}
-    }
-
-    module = IdracAnsibleModule(
-        argument_spec=specs,
-        mutually_exclusive=[
-            ('user_id', 'username')
-        ],
-        supports_check_mode=True
-    )
+def run_module(module):
     try:
         with iDRACRedfishAPI(module.params, req_session=True) as idrac:
             resp = []
@@ -227,5 +243,24 @@ def main():
         module.fail_json(msg=str(err))
 
 
+def main():
+    specs = {
+        "user_id": {"type": 'int'},
+        "username": {"type": 'str'}
+    }
+    specs.update(fanout_argument_spec(idrac_auth_params, "idrac_ip"))
+
+    module = IdracAnsibleModule(
+        argument_spec=specs,
+        mutually_exclusive=[
+            ('user_id', 'username')
+        ],
+        supports_check_mode=True
+    )
+    if module.params.get("targets"):
+        exit_fan_out(run_module, module, "idrac_ip")
+    run_module(module)
+
+
 if __name__ == '__main__':
     main()
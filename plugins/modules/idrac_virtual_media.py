@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2022-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2022-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -218,6 +218,7 @@ import time
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 
 MANAGER_BASE = "/redfish/v1/Managers/iDRAC.Embedded.1/VirtualMedia"
@@ -239,7 +240,7 @@ UNSUPPORTED_MSG_HTTPS = "The system does not support the HTTPS network share fea
 
 
 def get_virtual_media_info(idrac):
-    resp = idrac.invoke_request("/redfish/v1/", "GET")
+    resp = idrac.invoke_request("/redfish/v1/", "GET", cache=True)
     redfish_version = resp.json_data["RedfishVersion"]
     rd_version = redfish_version.replace(".", "")
     if 1131 <= int(rd_version):
@@ -322,12 +323,14 @@ def virtual_media_operation(idrac, module, payload, vr_id):
                 idrac.invoke_request(i["vr_mem"]["Actions"]["#VirtualMedia.EjectMedia"]["target"],
                                      "POST", data="{}", dump=False)
                 time.sleep(5)
+                record_sleep(5)
                 idrac.invoke_request(i["vr_mem"]["Actions"]["#VirtualMedia.InsertMedia"]["target"],
                                      "POST", data=i["payload"])
             elif not force and i["vr_mem"]["Inserted"] and i["payload"]["Inserted"]:
                 idrac.invoke_request(i["vr_mem"]["Actions"]["#VirtualMedia.EjectMedia"]["target"],
                                      "POST", data="{}", dump=False)
                 time.sleep(5)
+                record_sleep(5)
                 idrac.invoke_request(i["vr_mem"]["Actions"]["#VirtualMedia.InsertMedia"]["target"],
                                      "POST", data=i["payload"])
             elif not i["vr_mem"]["Inserted"] and i["payload"]["Inserted"]:
@@ -337,6 +340,7 @@ def virtual_media_operation(idrac, module, payload, vr_id):
                 idrac.invoke_request(i["vr_mem"]["Actions"]["#VirtualMedia.EjectMedia"]["target"],
                                      "POST", data="{}", dump=False)
             time.sleep(5)
+            record_sleep(5)
         except Exception as err:
             error = json.load(err).get("error")
             if vr_id == "manager":
@@ -349,6 +353,7 @@ def virtual_media_operation(idrac, module, payload, vr_id):
                         uri = uri.replace("CD", "RemovableDisk")
                     idrac.invoke_request(uri, "POST", data="{}", dump=False)
                     time.sleep(5)
+                    record_sleep(5)
                     idrac.invoke_request(i["vr_mem"]["Actions"]["#VirtualMedia.InsertMedia"]["target"],
                                          "POST", data=i["payload"])
                 else:
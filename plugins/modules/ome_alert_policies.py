@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -618,7 +618,7 @@ def get_target_payload(module, rest_obj):
 
 
 def get_category_data_tree(rest_obj):
-    resp = rest_obj.invoke_request("GET", CATEGORY_URI)
+    resp = rest_obj.invoke_request("GET", CATEGORY_URI, cache=True)
     cat_raw = resp.json_data.get("value", [])
     cat_dict = dict(
         (category.get("Name"),
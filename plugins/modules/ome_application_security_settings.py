@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -203,6 +203,7 @@ import json
 import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -288,6 +289,7 @@ def get_execution_details(rest_obj, job_id, job_message):
 def exit_settings(module, rest_obj, job_id):
     msg = SEC_JOB_TRIGGERED
     time.sleep(SETTLING_TIME)
+    record_sleep(SETTLING_TIME)
     if module.params.get("job_wait"):
         job_failed, job_message = rest_obj.job_tracking(
             job_id=job_id, job_wait_sec=module.params["job_wait_timeout"], sleep_time=JOB_POLL_INTERVAL)
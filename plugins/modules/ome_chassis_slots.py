@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -257,6 +257,7 @@ from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.common.dict_transformations import recursive_diff
 
 DEVICE_URI = "DeviceService/Devices"
@@ -371,6 +372,7 @@ def start_slot_name_jobs(rest_obj, slot_data):
                                                job_params, job_type)
             slot['JobId'] = job_resp.json_data.get('Id', 0)
             time.sleep(SETTLING_TIME)
+            record_sleep(SETTLING_TIME)
         except HTTPError as err:
             slot['JobId'] = 0
             slot['JobStatus'] = str(err)
@@ -381,7 +383,7 @@ def start_slot_name_jobs(rest_obj, slot_data):
 
 def get_job_states(module, rest_obj, slot_data):
     job_dict = dict([(slot['JobId'], k) for k, slot in slot_data.items() if slot['JobId']])
-    query_params = {"$filter": "JobType/Id eq 3"}  # optimize this
+    query_params = {"$filter": "Id in ({0})".format(",".join(str(job_id) for job_id in job_dict))}
     count = JOB_TIMEOUT // SETTLING_TIME
     job_incomplete = [2050, 2030, 2040, 2080]  # Running, Queued, Starting, New
     while count > 0 and job_dict:
@@ -391,6 +393,7 @@ def get_job_states(module, rest_obj, slot_data):
         except HTTPError:
             count = count - 50  # 3 times retry for HTTP error
             time.sleep(SETTLING_TIME)
+            record_sleep(SETTLING_TIME)
             continue
         job_over = []
         for job in jobs:
@@ -411,6 +414,7 @@ def get_job_states(module, rest_obj, slot_data):
             break
         count = count - 1
         time.sleep(SETTLING_TIME)
+        record_sleep(SETTLING_TIME)
     failed_jobs = dict([(k, slot_data.pop(k)) for k in job_dict.values()])
     return failed_jobs
 
@@ -428,6 +432,7 @@ def trigger_refresh_inventory(rest_obj, slot_data):
         job_id = job_resp.json_data.get('Id')
         jobs.append(int(job_id))
         time.sleep(SETTLING_TIME)
+        record_sleep(SETTLING_TIME)
     return jobs
 
 
@@ -467,9 +472,8 @@ def exit_slot_config(module, rest_obj, failed_jobs, invalid_jobs, slot_data):
         job_failed_list = []
         try:
             rfrsh_job_list = trigger_refresh_inventory(rest_obj, slot_data)
-            for job in rfrsh_job_list:
-                job_failed, job_message = rest_obj.job_tracking(
-                    job, job_wait_sec=JOB_TIMEOUT, sleep_time=JOB_INTERVAL)
+            for job, job_failed, job_message in rest_obj.iter_jobs_tracking(
+                    rfrsh_job_list, job_wait_sec=JOB_TIMEOUT, sleep_time=JOB_INTERVAL):
                 job_failed_list.append(job_failed)
             all_dv_rfrsh = trigger_all_inventory_task(rest_obj)
             job_failed, job_message = rest_obj.job_tracking(
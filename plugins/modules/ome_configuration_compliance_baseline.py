@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.4.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -361,6 +361,7 @@ import re
 import datetime
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.compat.version import LooseVersion
@@ -592,6 +593,7 @@ def track_compliance_task_completion(rest_obj, baseline_identifier_val, module):
         retries_count_limit = module.params["job_wait_timeout"] / wait_time
         retries_count = 0
         time.sleep(wait_time)
+        record_sleep(wait_time)
         if command == "create":
             msg = CREATE_MSG
         else:
@@ -601,6 +603,7 @@ def track_compliance_task_completion(rest_obj, baseline_identifier_val, module):
                 break
             retries_count += 1
             time.sleep(wait_time)
+            record_sleep(wait_time)
             baseline_info = get_baseline_compliance_info(rest_obj, baseline_identifier_val)
         if baseline_info["PercentageComplete"] != "100":
             msg = TASK_PROGRESS_MSG
@@ -883,6 +886,7 @@ def remediate_baseline(module, rest_obj):
 
 def schedule_job(module, rest_obj, job_id):
     time.sleep(5)
+    record_sleep(5)
     job_url = JOB_URI.format(job_id=job_id)
     job_resp = rest_obj.invoke_request('GET', job_url)
     job_dict = job_resp.json_data
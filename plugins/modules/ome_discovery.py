@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -646,6 +646,7 @@ import json
 import time
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.common.dict_transformations import snake_dict_to_camel_dict
@@ -778,6 +779,7 @@ def discovery_job_tracking(rest_obj, job_id, job_wait_sec):
     job_url = (DISCOVERY_JOBS_URI + "({job_id})").format(job_id=job_id)
     loop_ctr = 0
     time.sleep(SETTLING_TIME)
+    record_sleep(SETTLING_TIME)
     while loop_ctr < max_retries:
         loop_ctr += 1
         try:
@@ -789,6 +791,7 @@ def discovery_job_tracking(rest_obj, job_id, job_wait_sec):
             elif job_status in failed_job_status:
                 return JOB_TRACK_FAIL.format(JOB_STATUS_MAP[job_status])
             time.sleep(sleep_interval)
+            record_sleep(sleep_interval)
         except HTTPError:
             return JOB_TRACK_UNABLE.format(job_id)
         except Exception as err:
@@ -900,6 +903,7 @@ def get_discovery_job(rest_obj, job_id):
 def exit_discovery(module, rest_obj, job_id):
     msg = DISCOVERY_SCHEDULED
     time.sleep(SETTLING_TIME)
+    record_sleep(SETTLING_TIME)
     djob = get_discovery_job(rest_obj, job_id)
     detailed_job = []
     if module.params.get("job_wait") and module.params.get('schedule') == 'RunNow':
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -21,6 +21,7 @@ version_added: "2.0.0"
 description: This module updates the firmware of PowerEdge devices and all its components through OpenManage Enterprise.
 extends_documentation_fragment:
   - dellemc.openmanage.ome_auth_options
+  - dellemc.openmanage.disk_cache_options
 options:
   device_service_tag:
     description:
@@ -109,6 +110,17 @@ options:
       - GracefulRebootForce
       - PowerCycle
     default: GracefulRebootForce
+  dup_token_cache_ttl:
+    version_added: '9.9.0'
+    type: int
+    description:
+      - Number of seconds for which the file token of an uploaded I(dup_file) is cached on the local system.
+      - The cache is keyed by the SHA-256 digest of I(dup_file) and by I(hostname), a later run that applies the
+        same file on the same appliance within this time reuses the file token and skips the upload.
+      - If the appliance rejects the cached token or reports no applicable components of the targets for it,
+        the cache entry is dropped and the file is uploaded again.
+      - C(0) disables the cache.
+    default: 0
 requirements:
     - "python >= 3.9.6"
 author:
@@ -154,6 +166,17 @@ EXAMPLES = r'''
       - servers
     dup_file: "/path/BIOS_87V69_WN64_2.4.7.EXE"
 
+- name: Update firmware from a DUP file and reuse the uploaded file for an hour
+  dellemc.openmanage.ome_firmware:
+    hostname: "192.168.0.1"
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    device_group_names:
+      - servers
+    dup_file: "/path/BIOS_87V69_WN64_2.4.7.EXE"
+    dup_token_cache_ttl: 3600
+
 - name: Update firmware using baseline name
   dellemc.openmanage.ome_firmware:
     hostname: "192.168.0.1"
@@ -350,8 +373,12 @@ error_info:
 
 
 import json
+import os
+import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import file_sha256, get_cache_file, \
+    read_cache_file, write_cache_file, remove_cache_file
 from ansible.module_utils.urls import ConnectionError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -365,6 +392,7 @@ COMPLIANCE_READ_FAIL = "Failed to read compliance report."
 DUP_REQ_MSG = "Parameter 'dup_file' to be provided along with 'device_id'|'device_service_tag'|'device_group_names'"
 APPLICABLE_DUP = "Unable to get applicable components DUP."
 CHANGES_FOUND = "Changes found to be applied."
+DUP_TOKEN_CACHE = "ome_dup_tokens"
 
 
 def spawn_update_job(rest_obj, job_payload):
@@ -450,14 +478,44 @@ def get_dup_applicability_payload(file_token, device_ids=None, group_ids=None, b
     return dup_applicability_payload
 
 
-def upload_dup_file(rest_obj, module):
+def get_dup_cache_file(module):
+    """Returns the cache entry of the DUP file token on the appliance, None when the cache is disabled."""
+    if not module.params.get("dup_token_cache_ttl"):
+        return None
+    return get_cache_file(DUP_TOKEN_CACHE, module.params["hostname"], module.params.get("port"),
+                          file_sha256(module.params["dup_file"]))
+
+
+def get_cached_dup_token(cache_file):
+    """Returns the file token cached for the DUP file if it has not expired."""
+    cached = read_cache_file(cache_file) if cache_file else None
+    if isinstance(cached, dict) and cached.get("token") and cached.get("expires", 0) > time.time():
+        return cached["token"]
+    return None
+
+
+def is_dup_report_valid(target_data, device_ids=None):
+    """
+    Returns whether the applicability report of a cached file token can be trusted, that is it lists
+    components and, for a device target, only components of the target devices. A stale or foreign
+    token is answered with an empty or mismatched report instead of an error.
+    """
+    if not target_data:
+        return False
+    if device_ids is None:
+        return True
+    target_ids = set(str(device_id) for device_id in device_ids)
+    return all(str(target.get("Id")) in target_ids for target in target_data)
+
+
+def upload_dup_file(rest_obj, module, cache_file=None):
     """Upload DUP file to OME and get a file token."""
     upload_uri = "UpdateService/Actions/UpdateService.UploadFile"
     headers = {"Content-Type": "application/octet-stream", "Accept": "application/octet-stream"}
     upload_success, token = False, None
     dup_file = module.params['dup_file']
     with open(dup_file, 'rb') as payload:
-        payload = payload.read()
+        headers["Content-Length"] = str(os.fstat(payload.fileno()).st_size)
         response = rest_obj.invoke_request("POST", upload_uri, data=payload, headers=headers,
                                            api_timeout=100, dump=False)
         if response.status_code == 200:
@@ -465,6 +523,8 @@ def upload_dup_file(rest_obj, module):
             token = str(response.json_data)
         else:
             module.fail_json(msg="Unable to upload {0} to {1}".format(dup_file, module.params['hostname']))
+    if upload_success and cache_file is not None:
+        write_cache_file(cache_file, {"token": token, "expires": time.time() + module.params["dup_token_cache_ttl"]})
     return upload_success, token
 
 
@@ -535,7 +595,19 @@ def single_dup_update(rest_obj, module):
         device_ids, id_tag_map = get_device_ids(rest_obj, module, device_id_tags)
     if module.check_mode:
         module.exit_json(msg=CHANGES_FOUND, changed=True)
-    upload_status, token = upload_dup_file(rest_obj, module)
+    cache_file = get_dup_cache_file(module)
+    token = get_cached_dup_token(cache_file)
+    if token is not None:
+        report_payload = get_dup_applicability_payload(token, device_ids=device_ids, group_ids=group_ids,
+                                                       baseline_ids=baseline_ids)
+        try:
+            target_data = get_applicable_components(rest_obj, report_payload, module)
+        except (HTTPError, KeyError, TypeError, ValueError):
+            target_data = None
+        if is_dup_report_valid(target_data, device_ids):
+            return target_data
+        remove_cache_file(cache_file)
+    upload_status, token = upload_dup_file(rest_obj, module, cache_file=cache_file)
     if upload_status:
         report_payload = get_dup_applicability_payload(token, device_ids=device_ids, group_ids=group_ids,
                                                        baseline_ids=baseline_ids)
@@ -638,6 +710,7 @@ def main():
         "reboot_type": {"type": 'str',
                         "choices": ['PowerCycle', 'GracefulReboot', 'GracefulRebootForce'],
                         "default": 'GracefulRebootForce'},
+        "dup_token_cache_ttl": {"type": "int", "default": 0},
         "devices": {
             "type": 'list', "elements": 'dict',
             "options": {
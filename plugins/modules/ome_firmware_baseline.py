@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -316,16 +316,15 @@ GROUP_ID = 6000
 import json
 import time
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.dict_transformations import recursive_diff
 
 
 def get_baseline_from_name(rest_obj, baseline):
-    resp = rest_obj.get_all_items_with_pagination(BASELINE_URI)
-    baselines_list = resp.get("value")
     bsln = baseline
-    for d in baselines_list:
+    for d in rest_obj.iter_items_with_pagination(BASELINE_URI):
         if d['Name'] == baseline.get('Name'):
             bsln = d
             break
@@ -344,9 +343,7 @@ def check_existing_baseline(module, rest_obj):
         srch_key = "Id"
         srch_val = module.params.get("baseline_id")
     baseline_cfgs = []
-    resp = rest_obj.get_all_items_with_pagination(BASELINE_URI)
-    baselines = resp.get("value")
-    for d in baselines:
+    for d in rest_obj.iter_items_with_pagination(BASELINE_URI):
         if d[srch_key] == srch_val:
             baseline_cfgs.append(d)
             if baseline_id:
@@ -356,15 +353,12 @@ def check_existing_baseline(module, rest_obj):
 
 def get_catrepo_ids(module, cat_name, rest_obj):
     if cat_name is not None:
-        resp_data = rest_obj.get_all_items_with_pagination(CATALOG_URI)
-        values = resp_data["value"]
-        if values:
-            for catalog in values:
-                repo = catalog.get("Repository")
-                if repo.get("Name") == cat_name:
-                    if catalog.get('Status') != 'Completed':
-                        module.fail_json(msg=CATALOG_STATUS_MESSAGE.format(status=catalog.get('Status')))
-                    return catalog.get("Id"), repo.get("Id")
+        for catalog in rest_obj.iter_items_with_pagination(CATALOG_URI):
+            repo = catalog.get("Repository")
+            if repo.get("Name") == cat_name:
+                if catalog.get('Status') != 'Completed':
+                    module.fail_json(msg=CATALOG_STATUS_MESSAGE.format(status=catalog.get('Status')))
+                return catalog.get("Id"), repo.get("Id")
     return None, None
 
 
@@ -430,6 +424,7 @@ def get_target_list(module, rest_obj):
 def exit_baseline(module, rest_obj, baseline, op):
     msg = BASELINE_TRIGGERED
     time.sleep(SETTLING_TIME)
+    record_sleep(SETTLING_TIME)
     try:
         bsln = get_baseline_from_name(rest_obj, baseline)
     except Exception:
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -197,6 +197,7 @@ from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 GROUP_URI = "GroupService/Groups"
 OP_URI = "GroupService/Actions/GroupService.{op}Group"
@@ -289,6 +290,7 @@ def get_parent_id(rest_obj, module, parent, static_root):
             else:
                 prtid = create_parent(rest_obj, module, static_root)
                 time.sleep(SETTLING_TIME)
+                record_sleep(SETTLING_TIME)
                 return prtid
     return static_root['Id']
 
@@ -319,6 +321,7 @@ def exit_group_operation(module, rest_obj, payload, operation):
     group_resp = rest_obj.invoke_request('POST', OP_URI.format(op=operation), data={"GroupModel": payload})
     cid = int(group_resp.json_data)
     time.sleep(SETTLING_TIME)
+    record_sleep(SETTLING_TIME)
     try:
         grp = get_ome_group_by_id(rest_obj, cid)
         group = rest_obj.strip_substr_dict(grp)
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2021-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -398,6 +398,7 @@ import json
 import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.dict_transformations import recursive_diff
@@ -609,6 +610,7 @@ def assign_profile(module, rest_obj):
         try:
             res_prof = get_profile(rest_obj, module)
             time.sleep(5)
+            record_sleep(5)
             if res_prof.get('DeploymentTaskId'):
                 res_dict['job_id'] = res_prof.get('DeploymentTaskId')
                 res_dict['msg'] = "Successfully triggered the job for the assign operation."
@@ -648,6 +650,7 @@ def unassign_profile(module, rest_obj):
     try:
         res_prof = get_profile(rest_obj, module)
         time.sleep(3)
+        record_sleep(3)
         if res_prof.get('DeploymentTaskId'):
             res_dict['job_id'] = res_prof.get('DeploymentTaskId')
             res_dict['msg'] = "Successfully triggered a job for the unassign operation."
@@ -763,6 +766,7 @@ def migrate_profile(module, rest_obj):
             res_dict = {'msg': msg, 'changed': True}
             try:
                 time.sleep(5)
+                record_sleep(5)
                 res_prof = get_profile(rest_obj, module)
                 if res_prof.get('DeploymentTaskId'):
                     res_dict['job_id'] = res_prof.get('DeploymentTaskId')
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -550,6 +550,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import Rest
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import apply_diff_key, job_tracking
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 
 
 TEMPLATES_URI = "TemplateService/Templates"
@@ -646,7 +647,7 @@ def get_device_ids(module, rest_obj):
 
 
 def get_view_id(rest_obj, viewstr):
-    resp = rest_obj.invoke_request('GET', "TemplateService/TemplateViewTypes")
+    resp = rest_obj.invoke_request('GET', "TemplateService/TemplateViewTypes", cache=True)
     if resp.success and resp.json_data.get('value'):
         tlist = resp.json_data.get('value', [])
         for xtype in tlist:
@@ -985,6 +986,7 @@ def exit_module(rest_obj, module, response, time_out=False):
                 command = 'create_when_job_wait_true'
             else:
                 time.sleep(5)
+                record_sleep(5)
                 resp = get_job_id(rest_obj, resp)
                 command = 'create_when_job_wait_false'
     if command == 'export':
@@ -1050,9 +1052,11 @@ def main():
                             if job_id:
                                 break
                             time.sleep(sleep_time)
+                            record_sleep(sleep_time)
                             count = count - sleep_time
                         except HTTPError:
                             time.sleep(sleep_time)
+                            record_sleep(sleep_time)
                             count = count - sleep_time
                             continue
                 elif module.params["command"] == "deploy":
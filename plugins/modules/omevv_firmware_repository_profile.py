@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.8.0
-# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2024-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -145,6 +145,7 @@ from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.omevv import RestOMEVV, OMEVVAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.omevv_utils.omevv_firmware_utils import OMEVVFirmwareProfile
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.common.dict_transformations import recursive_diff
 
 ODATA_REGEX = "(.*?)@odata"
@@ -252,6 +253,7 @@ class CreateFirmwareRepositoryProfile(FirmwareRepositoryProfile):
                 profile_resp = self.omevv_profile_obj.get_firmware_repository_profile_by_id(resp.json_data)
                 while profile_resp.json_data["status"] != "Success" and profile_resp.json_data["status"] != "Failed":
                     time.sleep(3)
+                    record_sleep(3)
                     profile_resp = self.omevv_profile_obj.get_firmware_repository_profile(resp.json_data["profileName"])
                 if self.module._diff and profile_resp.json_data["status"] == "Success":
                     self.module.exit_json(msg=SUCCESS_CREATION_MSG, profile_info=profile_resp.json_data, diff=diff, changed=True)
@@ -361,6 +363,7 @@ class ModifyFirmwareRepositoryProfile(FirmwareRepositoryProfile):
         profile_resp = self.omevv_profile_obj.get_firmware_repository_profile_by_id(api_response["id"])
         while profile_resp.json_data["status"] != "Success" and profile_resp.json_data["status"] != "Failed":
             time.sleep(3)
+            record_sleep(3)
             profile_resp = self.omevv_profile_obj.get_firmware_repository_profile_by_id(api_response["id"])
         if self.module._diff and profile_resp.json_data["status"] == "Success":
             self.module.exit_json(msg=SUCCESS_MODIFY_MSG, profile_info=profile_resp.json_data, diff=diff, changed=True)
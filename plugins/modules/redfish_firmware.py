@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2019-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2019-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -145,13 +145,14 @@ import os
 import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, RedfishAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
 try:
     from urllib3.fields import RequestField
-    from urllib3.filepost import encode_multipart_formdata
+    from urllib3.filepost import choose_boundary
     HAS_LIB = True
 except ImportError:
     HAS_LIB = False
@@ -169,16 +170,67 @@ JOBSTATUS_SCHEDULED = "scheduled"
 JOBSTATUS_ERRORED = "errored"
 
 
+class MultipartFileBody(object):
+    """
+    File-like multipart/form-data body with a single file part. The part headers and
+    the closing boundary are held in memory and the file content is read from disk
+    as the body is sent, so the memory used does not depend on the image size.
+    """
+
+    def __init__(self, name, file_obj, filename, content_type, boundary=None):
+        self.boundary = boundary or choose_boundary()
+        req_field = RequestField(name=name, data=b"", filename=filename)
+        req_field.make_multipart(content_type=content_type)
+        self._parts = [
+            "--{0}\r\n{1}".format(self.boundary, req_field.render_headers()).encode("utf-8"),
+            file_obj,
+            "\r\n--{0}--\r\n".format(self.boundary).encode("utf-8"),
+        ]
+        self._file_start = file_obj.tell()
+        file_size = os.fstat(file_obj.fileno()).st_size - self._file_start
+        self.length = len(self._parts[0]) + file_size + len(self._parts[2])
+        self.content_type = "multipart/form-data; boundary={0}".format(self.boundary)
+        self.seek(0)
+
+    def __len__(self):
+        return self.length
+
+    def seek(self, offset, whence=0):
+        """Rewinds the body so that it can be sent again, only the start of the body is supported."""
+        if offset != 0 or whence != 0:
+            raise ValueError("MultipartFileBody can only be rewound to the start.")
+        self._index, self._offset = 0, 0
+        self._parts[1].seek(self._file_start)
+        return 0
+
+    def read(self, amt=None):
+        chunks, remaining = [], -1 if amt is None or amt < 0 else amt
+        while remaining and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                end = len(part) if remaining < 0 else min(len(part), self._offset + remaining)
+                chunk = part[self._offset:end]
+                self._offset = end
+                exhausted = end == len(part)
+            else:
+                chunk = part.read() if remaining < 0 else part.read(remaining)
+                exhausted = not chunk or remaining < 0
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+            if exhausted:
+                self._index, self._offset = self._index + 1, 0
+        return b"".join(chunks)
+
+
 def _encode_form_data(payload_file):
-    """Encode multipart/form-data for file upload."""
-    fields = []
+    """
+    Returns the streamed multipart/form-data body for the file upload, its content type and length.
+    The file object must stay open until the body is sent.
+    """
     f_name, f_data, f_type = payload_file.get("file")
-    f_binary = f_data.read()
-    req_field = RequestField(name="file", data=f_binary, filename=f_name)
-    req_field.make_multipart(content_type=f_type)
-    fields.append(req_field)
-    data, content_type = encode_multipart_formdata(fields)
-    return data, content_type
+    body = MultipartFileBody("file", f_data, f_name, f_type)
+    return body, body.content_type, body.length
 
 
 def _get_update_service_target(obj, module):
@@ -213,10 +265,11 @@ def firmware_update(obj, module):
         resp_inv = obj.invoke_request("GET", inventory_uri)
         with open(os.path.join(image_path), "rb") as img_file:
             binary_payload = {"file": (image_path.split(os.sep)[-1], img_file, "multipart/form-data")}
-            data, ctype = _encode_form_data(binary_payload)
-        headers = {"If-Match": resp_inv.headers.get("etag")}
-        headers.update({"Content-Type": ctype})
-        upload_status = obj.invoke_request("POST", push_uri, data=data, headers=headers, dump=False, api_timeout=module.params["timeout"])
+            data, ctype, length = _encode_form_data(binary_payload)
+            headers = {"If-Match": resp_inv.headers.get("etag")}
+            headers.update({"Content-Type": ctype, "Content-Length": str(length)})
+            upload_status = obj.invoke_request("POST", push_uri, data=data, headers=headers, dump=False,
+                                               api_timeout=module.params["timeout"])
         if upload_status.status_code == 201:
             payload = {"ImageURI": upload_status.headers.get("location")}
             update_status = obj.invoke_request("POST", update_uri, data=payload)
@@ -244,9 +297,11 @@ def wait_for_job_completion(module, job_uri, job_wait_timeout=900, interval=30):
                         break
                     track_counter += interval
                     time.sleep(interval)
+                    record_sleep(interval)
                 except (HTTPError, URLError):
                     track_counter += interval
                     time.sleep(interval)
+                    record_sleep(interval)
             # TIMED OUT
             # when job is scheduled
             if not final_jobstatus:
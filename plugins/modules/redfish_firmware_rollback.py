@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.3.0
-# Copyright (C) 2023-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2023-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -148,6 +148,7 @@ from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import
     SESSION_RESOURCE_COLLECTION
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import wait_for_redfish_reboot_job, \
     wait_for_redfish_job_complete, strip_substr_dict, MANAGER_JOB_ID_URI, RESET_UNTRACK, MANAGERS_URI, RESET_SUCCESS
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import record_sleep
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -237,6 +238,7 @@ def require_session(idrac, module):
 
 def wait_for_redfish_idrac_reset(module, redfish_obj, wait_time_sec, interval=30):
     time.sleep(interval // 2)
+    record_sleep(interval // 2)
     msg = RESET_UNTRACK
     wait = wait_time_sec
     track_failed = True
@@ -258,15 +260,18 @@ def wait_for_redfish_idrac_reset(module, redfish_obj, wait_time_sec, interval=30
                     resetting = True
                 break
             time.sleep(interval)
+            record_sleep(interval)
             wait -= interval
             resetting = True
         except URLError:
             time.sleep(interval)
+            record_sleep(interval)
             wait -= interval
             if not resetting:
                 resetting = True
         except Exception:
             time.sleep(interval)
+            record_sleep(interval)
             wait -= interval
             resetting = True
     return track_failed, resetting, msg
@@ -277,6 +282,7 @@ def simple_update(redfish_obj, preview_uri, update_uri):
     for uri in preview_uri:
         resp = redfish_obj.invoke_request("POST", update_uri, data={"ImageURI": uri})
         time.sleep(30)
+        record_sleep(30)
         task_uri = resp.headers.get("Location")
         task_id = task_uri.split("/")[-1]
         job_ids.append(task_id)
@@ -0,0 +1,219 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: redfish_info
+short_description: Retrieve Redfish resources from one or more out-of-band controllers
+version_added: "9.9.0"
+description:
+  - This module retrieves the Redfish resources at the specified URIs.
+  - The resources of one controller are fetched concurrently over one session, and several controllers
+    are queried concurrently with I(targets).
+extends_documentation_fragment:
+  - dellemc.openmanage.redfish_auth_options
+options:
+  baseuri:
+    description:
+      - "IP address of the target out-of-band controller. For example- <ipaddress>:<port>."
+      - I(baseuri) is mutually exclusive with I(targets), one of them is required.
+    type: str
+    required: false
+  resource_uris:
+    description:
+      - URIs of the Redfish resources to be retrieved, for example C(/redfish/v1/Systems/System.Embedded.1).
+      - A URI can carry query options such as C($expand) or C($select).
+    type: list
+    elements: str
+    required: true
+  targets:
+    description:
+      - List of out-of-band controllers to be queried concurrently from this module run.
+      - Each target takes the connection options of the module unless it overrides them.
+      - The results are returned in I(results) keyed by the I(baseuri) of each target.
+      - I(targets) is mutually exclusive with I(baseuri).
+    type: list
+    elements: dict
+    suboptions:
+      baseuri:
+        description: "IP address of the target out-of-band controller. For example- <ipaddress>:<port>."
+        type: str
+        required: true
+      username:
+        description: Username of the target out-of-band controller.
+        type: str
+      password:
+        description: Password of the target out-of-band controller.
+        type: str
+      validate_certs:
+        description: If C(false), the SSL certificates will not be validated.
+        type: bool
+      ca_path:
+        description: The Privacy Enhanced Mail (PEM) file that contains a CA certificate to be used for the validation.
+        type: path
+      timeout:
+        description: The socket level timeout in seconds for the requests to this target.
+        type: int
+  max_workers:
+    description:
+      - Maximum number of I(targets) queried concurrently.
+      - If not specified, up to C(8) targets are queried concurrently.
+      - While several targets are queried concurrently, the requests of each target are sent one at a time.
+    type: int
+  target_timeout:
+    description:
+      - Time in seconds within which each of the I(targets) is to complete.
+      - A target that does not complete within this time is reported as failed in I(results), while
+        I(timeout) applies to each request of a target.
+      - If not specified, the targets are not limited in time.
+    type: int
+requirements:
+  - "python >= 3.9.6"
+author:
+  - "Felix Stephen (@felixs88)"
+notes:
+  - Run this module from a system that has direct access to Redfish APIs.
+  - I(username) and I(password) are not required when each of the I(targets) sets its own.
+  - The resources of one controller are fetched one after the other by default, set the C(OMAM_MAX_WORKERS)
+    environment variable to the number of concurrent requests to fetch them concurrently.
+  - This module supports C(check_mode).
+'''
+
+EXAMPLES = r'''
+---
+- name: Retrieve the system and manager resources
+  dellemc.openmanage.redfish_info:
+    baseuri: "192.168.0.1"
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    resource_uris:
+      - /redfish/v1/Systems/System.Embedded.1
+      - /redfish/v1/Managers/iDRAC.Embedded.1
+
+- name: Retrieve the firmware inventory from several controllers concurrently
+  dellemc.openmanage.redfish_info:
+    username: "username"
+    password: "password"
+    ca_path: "/path/to/ca_cert.pem"
+    max_workers: 32
+    resource_uris:
+      - /redfish/v1/UpdateService/FirmwareInventory?$expand=*($levels=1)
+    targets:
+      - baseuri: "192.168.0.1"
+      - baseuri: "192.168.0.2"
+        timeout: 60
+'''
+
+RETURN = r'''
+---
+msg:
+  description: Status of the Redfish resource retrieval.
+  returned: always
+  type: str
+  sample: "Successfully retrieved the Redfish resources."
+redfish_info:
+  description: Redfish resources keyed by their URI.
+  returned: success
+  type: dict
+  sample: {
+    "/redfish/v1/Systems/System.Embedded.1": {
+      "@odata.id": "/redfish/v1/Systems/System.Embedded.1",
+      "Id": "System.Embedded.1",
+      "PowerState": "On"
+    }
+  }
+results:
+  description: Result of each target keyed by its host, returned when I(targets) is specified.
+  returned: when targets is specified
+  type: dict
+  sample: {
+    "192.168.0.1": {
+      "msg": "Successfully retrieved the Redfish resources.",
+      "redfish_info": {}
+    },
+    "192.168.0.2": {
+      "msg": "<urlopen error [Errno 113] No route to host>",
+      "unreachable": true
+    }
+  }
+error_info:
+  description: Details of the HTTP Error.
+  returned: on HTTP error
+  type: dict
+  sample: {
+    "error": {
+      "code": "Base.1.0.GeneralError",
+      "message": "A general error has occurred. See ExtendedInfo for more information.",
+      "@Message.ExtendedInfo": [
+        {
+          "MessageId": "GEN1234",
+          "RelatedProperties": [],
+          "Message": "Unable to process the request because an error occurred.",
+          "MessageArgs": [],
+          "Severity": "Critical",
+          "Resolution": "Retry the operation. If the issue persists, contact your system administrator."
+        }
+      ]
+    }
+  }
+'''
+
+import json
+from ssl import SSLError
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.urls import ConnectionError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, RedfishAnsibleModule, \
+    redfish_auth_params
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import concurrent_map, get_max_workers, \
+    fanout_argument_spec, exit_fan_out
+
+SUCCESS_MSG = "Successfully retrieved the Redfish resources."
+
+
+def get_resources(redfish_obj, resource_uris, max_workers):
+    uris = list(dict.fromkeys(resource_uris))
+    resources = concurrent_map(lambda uri: redfish_obj.invoke_request("GET", uri).json_data, uris, max_workers)
+    return dict(zip(uris, resources))
+
+
+def run_module(module):
+    try:
+        with Redfish(module.params, req_session=True) as redfish_obj:
+            resources = get_resources(redfish_obj, module.params["resource_uris"], get_max_workers(module.params))
+        module.exit_json(msg=SUCCESS_MSG, redfish_info=resources)
+    except HTTPError as err:
+        module.exit_json(msg=str(err), error_info=json.load(err), failed=True)
+    except URLError as err:
+        module.exit_json(msg=str(err), unreachable=True)
+    except (IOError, ValueError, SSLError, TypeError, ConnectionError, OSError) as err:
+        module.exit_json(msg=str(err), failed=True)
+
+
+def main():
+    specs = {
+        "resource_uris": {"required": True, "type": "list", "elements": "str"},
+    }
+    specs.update(fanout_argument_spec(redfish_auth_params, "baseuri"))
+    module = RedfishAnsibleModule(
+        argument_spec=specs,
+        supports_check_mode=True)
+    if module.params.get("targets"):
+        exit_fan_out(run_module, module, "baseuri")
+    run_module(module)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 9.5.0
-# Copyright (C) 2020-2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2020-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -299,7 +299,7 @@ def is_valid_final_pwr_state(final_pwr_state, allowed_final_pwr_state, module):
 
 
 def is_valid_vendor(redfish_session_obj, module, vendor):
-    system_resp = redfish_session_obj.invoke_request("GET", "/redfish/v1/")
+    system_resp = redfish_session_obj.invoke_request("GET", "/redfish/v1/", cache=True)
     system_vendor = system_resp.json_data.get("Vendor")
     if system_vendor.lower() != vendor.lower():
         module.exit_json(msg=VENDOR_NOT_SUPPORTED.format(supported_vendors=system_vendor), skipped=True)
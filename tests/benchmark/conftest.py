@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import time
+import pytest
+from ansible_collections.dellemc.openmanage.tests.benchmark.simulator import Simulator, make_self_signed_cert
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+UPDATE_ENV = "OMAM_BENCH_UPDATE"
+TOLERANCE_ENV = "OMAM_BENCH_TOLERANCE"
+REPEAT_ENV = "OMAM_BENCH_REPEAT"
+LATENCY_ENV = "OMAM_BENCH_LATENCY"
+
+
+class Benchmark(object):
+    """
+    Runs a scenario against the simulator and compares the request count and the best wall time
+    with the stored baseline. With OMAM_BENCH_UPDATE set, the baselines are rewritten instead.
+    """
+
+    def __init__(self):
+        with open(BASELINE_FILE) as baseline_fp:
+            self.baselines = json.load(baseline_fp)
+        self.update = bool(os.environ.get(UPDATE_ENV))
+        self.tolerance = float(os.environ.get(TOLERANCE_ENV, 3.0))
+        self.repeat = int(os.environ.get(REPEAT_ENV, 3))
+        self.updated = False
+
+    def __call__(self, name, simulator, func):
+        seconds = []
+        result = None
+        for dummy in range(self.repeat):
+            simulator.reset()
+            start = time.time()
+            result = func()
+            seconds.append(time.time() - start)
+        measured = {"requests": len(simulator.requests), "seconds": round(min(seconds), 4)}
+        if self.update:
+            self.baselines[name] = measured
+            self.updated = True
+            return result
+        baseline = self.baselines.get(name)
+        assert baseline is not None, "No baseline for {0}, run with {1}=1 to record it.".format(name, UPDATE_ENV)
+        assert measured["requests"] <= baseline["requests"], \
+            "{0} sent {1} requests, the baseline is {2}.".format(name, measured["requests"], baseline["requests"])
+        assert measured["seconds"] <= baseline["seconds"] * self.tolerance, \
+            "{0} took {1}s, the baseline is {2}s.".format(name, measured["seconds"], baseline["seconds"])
+        return result
+
+    def save(self):
+        if self.updated:
+            with open(BASELINE_FILE, "w") as baseline_fp:
+                json.dump(self.baselines, baseline_fp, indent=2, sort_keys=True)
+                baseline_fp.write("\n")
+
+
+@pytest.fixture(scope="session")
+def benchmark():
+    runner = Benchmark()
+    yield runner
+    runner.save()
+
+
+@pytest.fixture(scope="session")
+def certificate(tmp_path_factory):
+    cert = make_self_signed_cert(str(tmp_path_factory.mktemp("simulator")))
+    if cert is None:
+        pytest.skip("The benchmarks require the cryptography package to serve HTTPS.")
+    return cert
+
+
+@pytest.fixture
+def simulator(certificate):
+    """Factory of started simulators, they are stopped at the end of the test."""
+    started = []
+
+    def start(**kwargs):
+        kwargs.setdefault("latency", float(os.environ.get(LATENCY_ENV, 0.002)))
+        sim = Simulator(certfile=certificate[0], keyfile=certificate[1], **kwargs).start()
+        started.append(sim)
+        return sim
+    yield start
+    for sim in started:
+        sim.stop()
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+"""
+Local stand-in server for OpenManage Enterprise and iDRAC Redfish, serving synthetic resource trees of a
+configurable size with an injectable per-request latency, so that the request pattern of the clients
+can be measured without hardware.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import datetime
+import json
+import os
+import re
+import ssl
+import threading
+import uuid
+from copy import deepcopy
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+ODATA_ID = "@odata.id"
+OME_RUNNING, OME_COMPLETED = 2050, 2060
+SYSTEM_URI = "/redfish/v1/Systems/System.Embedded.1"
+MANAGER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1"
+EXPAND_REGEX = r"\*\(\$levels=(\d+)\)"
+FILTER_REGEX = r"^(\w+) eq '?([^']*)'?$"
+SESSION_URIS = ("/api/SessionService/Sessions", "/redfish/v1/SessionService/Sessions", "/redfish/v1/Sessions")
+SESSION_ID_REGEX = r"^(/api/SessionService/Sessions\('[^']+'\)|/redfish/v1(/SessionService)?/Sessions/[^/]+)$"
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, data=None, headers=None):
+        body = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = self.rfile.read(length) if length else b""
+        simulator = self.server.simulator
+        simulator.record(method, self.path)
+        if simulator.latency:
+            simulator.stopped.wait(simulator.latency)
+        status, data, headers = simulator.dispatch(method, self.path, payload)
+        self._reply(status, data, headers)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class Simulator(object):
+    """
+    Serves the OME ``/api`` resources of devices, static groups and jobs, and an iDRAC Redfish tree
+    with storage controllers, drives, volumes and enclosures.
+    :param devices: number of OME devices.
+    :param groups: number of static groups under "All Devices", the devices are spread over them.
+    :param group_depth: number of levels of static groups, every group below the first level is the only
+     child of the group above it and holds the same devices, so that a device belongs to several groups.
+    :param page_size: OME page size when ``$top`` is not given.
+    :param controllers: number of iDRAC storage controllers.
+    :param drives: number of drives of each controller.
+    :param volumes: number of volumes of each controller.
+    :param job_polls: number of GETs of a job before it completes.
+    :param latency: seconds added to every response.
+    :param certfile: certificate chain served over TLS, plain HTTP when not given.
+    :param keyfile: private key of the certificate.
+    """
+
+    def __init__(self, devices=100, groups=4, page_size=100, controllers=1, drives=8, volumes=2, job_polls=3,
+                 latency=0.0, certfile=None, keyfile=None, group_depth=1):
+        self.page_size = page_size
+        self.job_polls = job_polls
+        self.latency = latency
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.stopped = threading.Event()
+        self.requests = []
+        self._lock = threading.Lock()
+        self._job_polls = {}
+        self._server = None
+        self.devices = [self._device(index) for index in range(devices)]
+        self.groups = self._groups(groups, group_depth)
+        self.resources = {}
+        self._build_redfish(controllers, drives, volumes)
+
+    @property
+    def protocol(self):
+        return "https" if self.certfile else "http"
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), SimulatorHandler)
+        self._server.daemon_threads = True
+        self._server.simulator = self
+        if self.certfile:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.certfile, self.keyfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def record(self, method, path):
+        with self._lock:
+            self.requests.append((method, path))
+
+    def reset(self):
+        with self._lock:
+            self.requests = []
+            self._job_polls = {}
+
+    def ome_params(self, **kwargs):
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password", "port": self.port,
+                  "validate_certs": False, "timeout": 30}
+        params.update(kwargs)
+        return params
+
+    def idrac_params(self, **kwargs):
+        params = {"idrac_ip": "127.0.0.1", "idrac_user": "root", "idrac_password": "password",
+                  "idrac_port": self.port, "validate_certs": False, "timeout": 30}
+        params.update(kwargs)
+        return params
+
+    # OpenManage Enterprise
+
+    @staticmethod
+    def _device(index):
+        address = "10.{0}.{1}.{2}".format(index >> 16 & 255, index >> 8 & 255, index & 255)
+        return {"Id": 10000 + index, "Type": 1000, "DeviceServiceTag": "SVC{0:05d}".format(index),
+                "DeviceName": "server-{0}".format(index), "Model": "PowerEdge R760",
+                "DeviceManagement": [{"NetworkAddress": address}]}
+
+    def _groups(self, count, depth):
+        root = {"Id": 500, "Name": "All Devices", "Visible": True, "TypeId": 2000, "MembershipTypeId": 24,
+                "devices": self.devices, "children": []}
+        groups = {500: root}
+        for index in range(count):
+            parent = root
+            for level in range(depth):
+                name = "group-{0}-{1}".format(index, level) if level else "group-{0}".format(index)
+                group = {"Id": 1000 + level * count + index, "Name": name, "Visible": True, "TypeId": 3000,
+                         "MembershipTypeId": 12, "devices": self.devices[index::count], "children": []}
+                parent["children"].append(group)
+                groups[group["Id"]] = group
+                parent = group
+        return groups
+
+    @staticmethod
+    def _group_data(group):
+        data = dict((key, value) for key, value in group.items() if key not in ("devices", "children"))
+        data["SubGroups@odata.navigationLink"] = "/api/GroupService/Groups({0})/SubGroups".format(group["Id"])
+        data["AllLeafDevices@odata.navigationLink"] = "/api/GroupService/Groups({0})/AllLeafDevices".format(
+            group["Id"])
+        return data
+
+    def _collection(self, path, items, query):
+        item_filter = re.match(FILTER_REGEX, query.get("$filter", ""))
+        if item_filter:
+            key, value = item_filter.groups()
+            items = [item for item in items if str(item.get(key)) == value]
+        skip = int(query.get("$skip", 0))
+        top = int(query.get("$top", self.page_size))
+        page = items[skip:skip + top]
+        if "$select" in query:
+            keys = query["$select"].split(",")
+            page = [dict((key, item[key]) for key in keys if key in item) for item in page]
+        data = {"@odata.context": "/api/$metadata", "@odata.count": len(items), "value": page}
+        if skip + top < len(items):
+            data["@odata.nextLink"] = "{0}?$skip={1}&$top={2}".format(path, skip + top, top)
+        return data
+
+    def _ome_get(self, path, query):
+        group_match = re.match(r"^/api/GroupService/Groups\((\d+)\)(?:/(\w+))?$", path)
+        job_match = re.match(r"^/api/JobService/Jobs\((\d+)\)$", path)
+        if path == "/api/DeviceService/Devices":
+            return 200, self._collection(path, self.devices, query)
+        if path == "/api/GroupService/Groups":
+            groups = [self._group_data(group) for group in self.groups.values()]
+            return 200, self._collection(path, groups, query)
+        if group_match and int(group_match.group(1)) in self.groups:
+            group = self.groups[int(group_match.group(1))]
+            if group_match.group(2) is None:
+                return 200, self._group_data(group)
+            if group_match.group(2) in ("AllLeafDevices", "Devices"):
+                return 200, self._collection(path, group["devices"], query)
+            if group_match.group(2) == "SubGroups":
+                return 200, self._collection(path, [self._group_data(child) for child in group["children"]], query)
+        if job_match:
+            status = OME_COMPLETED if self._poll_job(job_match.group(1)) else OME_RUNNING
+            return 200, {"Id": int(job_match.group(1)), "JobName": "Simulated job",
+                         "LastRunStatus": {"Id": status, "Name": "Completed" if status == OME_COMPLETED else "Running"}}
+        return 404, {"error": {"code": "Base.1.0.GeneralError", "message": "{0} not found.".format(path)}}
+
+    def _poll_job(self, job_id):
+        """:return: True when the job has been polled job_polls times."""
+        with self._lock:
+            self._job_polls[job_id] = self._job_polls.get(job_id, 0) + 1
+            return self._job_polls[job_id] >= self.job_polls
+
+    # iDRAC Redfish
+
+    def _add(self, uri, data):
+        data = dict(data)
+        data[ODATA_ID] = uri
+        self.resources[uri] = data
+        return {ODATA_ID: uri}
+
+    def _build_redfish(self, controllers, drives, volumes):
+        self._add("/redfish/v1", {"Systems": {ODATA_ID: "/redfish/v1/Systems"},
+                                  "Managers": {ODATA_ID: "/redfish/v1/Managers"}})
+        self._add("/redfish/v1/Systems", {"Members": [{ODATA_ID: SYSTEM_URI}]})
+        self._add("/redfish/v1/Managers", {"Members": [{ODATA_ID: MANAGER_URI}]})
+        self._add(MANAGER_URI, {"Id": "iDRAC.Embedded.1", "Model": "17G Monolithic",
+                                "FirmwareVersion": "7.10.30.00"})
+        self._add(SYSTEM_URI, {"Id": "System.Embedded.1", "Model": "PowerEdge R760", "BiosVersion": "2.3.5",
+                               "Storage": {ODATA_ID: SYSTEM_URI + "/Storage"}})
+        members = []
+        for ctrl in range(1, controllers + 1):
+            ctrl_id = "RAID.Slot.{0}-1".format(ctrl)
+            ctrl_uri = "{0}/Storage/{1}".format(SYSTEM_URI, ctrl_id)
+            enclosure_id = "Enclosure.Internal.0-1:{0}".format(ctrl_id)
+            drive_links = [self._add("{0}/Drives/Disk.Bay.{1}:{2}".format(ctrl_uri, bay, enclosure_id),
+                                     {"Id": "Disk.Bay.{0}:{1}".format(bay, enclosure_id), "CapacityBytes": 1 << 40,
+                                      "MediaType": "SSD", "Protocol": "SAS", "Status": {"Health": "OK"}})
+                           for bay in range(drives)]
+            enclosure = self._add("/redfish/v1/Chassis/" + enclosure_id,
+                                  {"Id": enclosure_id, "Links": {"Drives": drive_links}})
+            volume_links = [self._add("{0}/Volumes/Disk.Virtual.{1}:{2}".format(ctrl_uri, vd, ctrl_id),
+                                      {"Id": "Disk.Virtual.{0}:{1}".format(vd, ctrl_id), "RAIDType": "RAID1",
+                                       "Links": {"Drives": drive_links[2 * vd:2 * vd + 2]}})
+                            for vd in range(volumes)]
+            self._add(ctrl_uri + "/Volumes", {"Members": volume_links})
+            members.append(self._add(ctrl_uri, {
+                "Id": ctrl_id, "Drives": drive_links, "Volumes": {ODATA_ID: ctrl_uri + "/Volumes"},
+                "Links": {"Enclosures": [enclosure]},
+                "Oem": {"Dell": {"DellControllerBattery": {"Id": "Battery.Integrated.1:" + ctrl_id}}}}))
+        self._add(SYSTEM_URI + "/Storage", {"Members": members})
+
+    def _expand(self, data, levels):
+        if levels <= 0:
+            return data
+        if isinstance(data, list):
+            return [self._expand(value, levels) for value in data]
+        if not isinstance(data, dict):
+            return data
+        if list(data.keys()) == [ODATA_ID] and data[ODATA_ID] in self.resources:
+            return self._expand(deepcopy(self.resources[data[ODATA_ID]]), levels - 1)
+        return dict((key, self._expand(value, levels)) for key, value in data.items())
+
+    def _redfish_get(self, path, query):
+        job_match = re.match(r"^{0}/Jobs/(JID_\d+)$".format(MANAGER_URI), path)
+        if job_match:
+            done = self._poll_job(job_match.group(1))
+            return 200, {ODATA_ID: path, "Id": job_match.group(1), "JobState": "Completed" if done else "Running",
+                         "PercentComplete": 100 if done else 50, "Message": "Simulated job."}
+        if path not in self.resources:
+            return 404, {"error": {"code": "Base.1.0.GeneralError", "message": "{0} not found.".format(path)}}
+        data = deepcopy(self.resources[path])
+        expand = re.match(EXPAND_REGEX, query.get("$expand", ""))
+        if expand:
+            data = dict((key, self._expand(value, int(expand.group(1)))) for key, value in data.items())
+        if "$select" in query:
+            keys = query["$select"].split(",")
+            data = dict((key, value) for key, value in data.items() if key in keys or key.startswith("@odata"))
+        return 200, data
+
+    # Dispatch
+
+    def dispatch(self, method, raw_path, payload):
+        parsed = urlparse(raw_path)
+        path = parsed.path.rstrip("/") or "/"
+        query = dict((key, values[-1]) for key, values in parse_qs(parsed.query).items())
+        if method == "POST" and path in SESSION_URIS:
+            session_id = str(uuid.uuid4())
+            headers = {"X-Auth-Token": uuid.uuid4().hex, "Location": "{0}/{1}".format(path, session_id)}
+            return 201, {"Id": session_id, "UserName": "admin"}, headers
+        if method == "DELETE" and re.match(SESSION_ID_REGEX, path):
+            return 204, None, {}
+        if method != "GET":
+            return 405, {"error": {"code": "Base.1.0.GeneralError", "message": "Method not allowed."}}, {}
+        if path.startswith("/api/"):
+            status, data = self._ome_get(path, query)
+        else:
+            status, data = self._redfish_get(path, query)
+        return status, data, {"Date": formatdate(usegmt=True)}
+
+
+def make_self_signed_cert(directory):
+    """
+    Writes a self-signed certificate for 127.0.0.1 and its key into the directory.
+    :returns: tuple of the certificate and key file paths, or None when cryptography is not installed.
+    """
+    try:
+        from cryptography import x509
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.x509.oid import NameOID
+    except ImportError:
+        return None
+    import ipaddress
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u"127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+            .serial_number(x509.random_serial_number()).not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address(u"127.0.0.1"))]),
+                           critical=False)
+            .sign(key, hashes.SHA256()))
+    certfile = os.path.join(directory, "simulator.pem")
+    keyfile = os.path.join(directory, "simulator.key")
+    with open(certfile, "wb") as cert_fp:
+        cert_fp.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(keyfile, "wb") as key_fp:
+        key_fp.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                       serialization.NoEncryption()))
+    return certfile, keyfile
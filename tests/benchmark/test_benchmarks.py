@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import time
+import pytest
+from ansible.inventory.data import InventoryData
+from ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory import InventoryModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils import utils
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_connection_pool
+from ansible_collections.dellemc.openmanage.plugins.modules.idrac_storage_volume import StorageData
+
+
+class FakeModule(object):
+    def __init__(self, params=None):
+        self.params = params or {}
+
+    def exit_json(self, **kwargs):
+        raise AssertionError(kwargs)
+
+
+class NoSleep(object):
+    """Stands in for the time module of utils so that the job trackers poll without sleeping."""
+    monotonic = staticmethod(time.monotonic)
+    time = staticmethod(time.time)
+
+    @staticmethod
+    def sleep(secs):
+        pass
+
+
+@pytest.fixture
+def no_poll_sleep(monkeypatch):
+    monkeypatch.setattr(utils, "time", NoSleep)
+
+
+@pytest.fixture(autouse=True)
+def clear_pool():
+    yield
+    get_connection_pool().clear()
+
+
+class TestOmeBenchmarks(object):
+
+    @pytest.mark.parametrize("max_workers,keep_alive", [(1, False), (4, False), (4, True)])
+    def test_get_all_report_details(self, benchmark, simulator, max_workers, keep_alive):
+        sim = simulator(devices=2000, page_size=100)
+
+        def run():
+            params = sim.ome_params(max_workers=max_workers, keep_alive=keep_alive)
+            with RestOME(params, req_session=True) as ome:
+                return ome.get_all_report_details("DeviceService/Devices")["report_list"]
+        name = "ome_get_all_report_details[workers={0},keep_alive={1}]".format(max_workers, keep_alive)
+        report_list = benchmark(name, sim, run)
+        assert len(report_list) == 2000
+
+    @pytest.mark.parametrize("group_depth", [1, 3])
+    @pytest.mark.parametrize("fetch_devices_once", [False, True])
+    def test_ome_inventory_parse(self, benchmark, simulator, fetch_devices_once, group_depth):
+        sim = simulator(devices=2000, groups=8, page_size=100, group_depth=group_depth)
+        options = {"hostname": "127.0.0.1", "username": "admin", "password": "password", "port": sim.port,
+                   "validate_certs": False, "max_workers": 4, "fetch_devices_once": fetch_devices_once}
+
+        def run():
+            plugin = InventoryModule()
+            plugin.config = options
+            plugin.get_option = options.get
+            plugin.inventory = InventoryData()
+            plugin._add_group_data(plugin._fetch_group_tree())
+            return plugin.inventory
+        name = "ome_inventory_parse[fetch_devices_once={0}]".format(fetch_devices_once)
+        if group_depth > 1:
+            name = "ome_inventory_parse[fetch_devices_once={0},group_depth={1}]".format(fetch_devices_once, group_depth)
+        inventory = benchmark(name, sim, run)
+        assert len(inventory.hosts) == 2000
+        assert len(inventory.groups["group-0"].hosts) == 250
+        if group_depth > 1:
+            leaf = inventory.groups["group-0-{0}".format(group_depth - 1)]
+            assert len(leaf.hosts) == 250
+            assert [parent.name for parent in leaf.parent_groups] == ["group-0-{0}".format(group_depth - 2)]
+
+    def test_job_tracking(self, benchmark, simulator, no_poll_sleep):
+        sim = simulator(job_polls=5)
+
+        def run():
+            with RestOME(sim.ome_params(), req_session=True) as ome:
+                return utils.job_tracking(ome, "JobService/Jobs(12345)", max_job_wait_sec=60,
+                                          sleep_interval_secs=1, initial_wait=0)
+        job_failed, msg, job_dict, wait_time = benchmark("ome_job_tracking", sim, run)
+        assert job_failed is False
+        assert job_dict["LastRunStatus"]["Id"] == 2060
+
+
+class TestIdracBenchmarks(object):
+
+    def test_all_storage_data(self, benchmark, simulator):
+        sim = simulator(controllers=2, drives=24, volumes=4)
+
+        def run():
+            with iDRACRedfishAPI(sim.idrac_params(), req_session=True) as idrac:
+                return StorageData(idrac, FakeModule()).all_storage_data()
+        storage = benchmark("idrac_all_storage_data", sim, run)
+        controller = storage["Controllers"]["RAID.Slot.1-1"]
+        assert len(controller["Drives"]) == 24
+        assert len(controller["Volumes"]) == 4
+        assert len(controller["Links"]["Enclosures"]) == 1
+
+    def test_idrac_redfish_job_tracking(self, benchmark, simulator, no_poll_sleep):
+        sim = simulator(job_polls=5)
+
+        def run():
+            with iDRACRedfishAPI(sim.idrac_params(), req_session=True) as idrac:
+                return utils.idrac_redfish_job_tracking(
+                    idrac, "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789012", max_job_wait_sec=60,
+                    sleep_interval_secs=1, initial_wait=0)
+        job_failed, msg, job_dict, wait_time = benchmark("idrac_redfish_job_tracking", sim, run)
+        assert job_failed is False
+        assert job_dict["JobState"] == "Completed"
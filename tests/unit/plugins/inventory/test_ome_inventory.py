@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible.inventory.data import InventoryData
+from ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory import InventoryModule, DEVICE_API
+
+INVENTORY_PATH = 'ansible_collections.dellemc.openmanage.plugins.inventory.ome_inventory.'
+# All Devices(1) has the children Servers(2) and Chassis(3), Servers has the child Racks(4).
+GROUPS = {1: ("All Devices", [2, 3], [10, 11, 12]), 2: ("Servers", [4], [10, 11]), 3: ("Chassis", [], [12]),
+          4: ("Racks", [], [10])}
+GROUP_TREE = [{"Name": "All Devices", "hosts": ["192.168.0.10", "192.168.0.11", "192.168.0.12"], "children": [
+    {"Name": "Servers", "hosts": ["192.168.0.10", "192.168.0.11"], "children": [
+        {"Name": "Racks", "hosts": ["192.168.0.10"], "children": []}]},
+    {"Name": "Chassis", "hosts": ["192.168.0.12"], "children": []}]}]
+
+
+def group(group_id):
+    return {"Id": group_id, "Name": GROUPS[group_id][0],
+            "SubGroups@odata.navigationLink": "/api/GroupService/Groups({0})/SubGroups".format(group_id),
+            "AllLeafDevices@odata.navigationLink": "/api/GroupService/Groups({0})/AllLeafDevices".format(group_id)}
+
+
+def device(device_id):
+    return {"Id": device_id, "DeviceManagement": [{"NetworkAddress": "192.168.0.{0}".format(device_id)}]}
+
+
+class TestOmeInventory(object):
+
+    @pytest.fixture
+    def ome_session(self, mocker):
+        return mocker.patch(INVENTORY_PATH + 'RestOME')
+
+    @pytest.fixture
+    def ome_requests(self, mocker):
+        requests = []
+
+        def get_all_data(ome, uri, query_param=None):
+            requests.append((ome, uri, query_param))
+            if uri == "GroupService/Groups":
+                report = [group(group_id) for group_id in GROUPS]
+            elif uri == DEVICE_API:
+                report = [device(device_id) for device_id in (10, 11, 12)]
+            else:
+                group_id, resource = int(uri.split("(")[1].split(")")[0]), uri.split("/")[-1]
+                if resource == "SubGroups":
+                    report = [group(sub_group) for sub_group in GROUPS[group_id][1]]
+                elif query_param == {"$select": "Id"}:
+                    report = [{"Id": device_id} for device_id in GROUPS[group_id][2]]
+                else:
+                    report = [device(device_id) for device_id in GROUPS[group_id][2]]
+            return {"report_list": report}
+        mocker.patch(INVENTORY_PATH + 'get_all_data_with_pagination', side_effect=get_all_data)
+        return requests
+
+    def get_plugin(self, mocker, **options):
+        plugin = InventoryModule()
+        plugin.config = dict({"hostname": "192.168.0.1", "username": "user", "password": "password",
+                              "max_workers": 1, "fetch_devices_once": False, "cache": False,
+                              "refresh_cache": False}, **options)
+        mocker.patch.object(plugin, "get_option", side_effect=lambda option: plugin.config.get(option))
+        mocker.patch.object(plugin, "_read_config_data", side_effect=lambda path: plugin.config)
+        plugin._cache = {}
+        return plugin
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_fetch_group_tree_single_session(self, mocker, ome_session, ome_requests, max_workers):
+        plugin = self.get_plugin(mocker, max_workers=max_workers)
+        assert plugin._fetch_group_tree() == GROUP_TREE
+        assert ome_session.call_count == 1
+        assert ome_session.call_args[1] == {"req_session": True}
+        session = ome_session.return_value.__enter__.return_value
+        assert all(request[0] is session for request in ome_requests)
+        assert plugin.ome is None
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_fetch_group_tree_devices_once(self, mocker, ome_session, ome_requests, max_workers):
+        plugin = self.get_plugin(mocker, max_workers=max_workers, fetch_devices_once=True)
+        assert plugin._fetch_group_tree() == GROUP_TREE
+        device_requests = [request for request in ome_requests if request[1] == DEVICE_API]
+        assert len(device_requests) == 1
+        assert device_requests[0][2] == {"$select": "Id,DeviceManagement"}
+        leaf_requests = [request for request in ome_requests if request[1].endswith("AllLeafDevices")]
+        assert len(leaf_requests) == len(GROUPS)
+        assert all(request[2] == {"$select": "Id"} for request in leaf_requests)
+        assert plugin.device_index is None
+
+    def test_parse_without_cache(self, mocker, ome_session, ome_requests):
+        plugin = self.get_plugin(mocker)
+        inventory = InventoryData()
+        plugin.parse(inventory, mocker.MagicMock(), "ome_inventory.yml")
+        assert plugin._cache == {}
+        assert [child.name for child in inventory.groups["Servers"].child_groups] == ["Racks"]
+        assert inventory.get_host("192.168.0.10").vars["idrac_ip"] == "192.168.0.10"
+        assert sorted(host.name for host in inventory.groups["Chassis"].get_hosts()) == ["192.168.0.12"]
+
+    def test_parse_with_cache(self, mocker, ome_session, ome_requests):
+        plugin = self.get_plugin(mocker, cache=True)
+        plugin.parse(InventoryData(), mocker.MagicMock(), "ome_inventory.yml")
+        assert ome_session.call_count == 1
+        cache_key = plugin.get_cache_key("ome_inventory.yml")
+        assert plugin._cache == {cache_key: GROUP_TREE}
+        inventory = InventoryData()
+        plugin.parse(inventory, mocker.MagicMock(), "ome_inventory.yml")
+        assert ome_session.call_count == 1
+        assert "Racks" in inventory.groups
+        plugin.parse(InventoryData(), mocker.MagicMock(), "ome_inventory.yml", cache=False)
+        assert ome_session.call_count == 2
+
+    def test_parse_refresh_cache(self, mocker, ome_session, ome_requests):
+        plugin = self.get_plugin(mocker, cache=True, refresh_cache=True)
+        cache_key = plugin.get_cache_key("ome_inventory.yml")
+        plugin._cache[cache_key] = [{"Name": "Stale", "hosts": ["192.168.0.99"], "children": []}]
+        inventory = InventoryData()
+        plugin.parse(inventory, mocker.MagicMock(), "ome_inventory.yml")
+        assert ome_session.call_count == 1
+        assert plugin._cache[cache_key] == GROUP_TREE
+        assert "Stale" not in inventory.groups
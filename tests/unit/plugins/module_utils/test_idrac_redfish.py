@@ -18,6 +18,8 @@ import pytest
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import get_request_stats, \
+    reset_request_stats, PERF_STATS_ENV, PERF_TRACE_ENV
 from mock import MagicMock
 import json
 import os
@@ -219,6 +221,18 @@ class TestIdracRedfishRest(object):
             "job_wait"), inp_data.get("reboot"), inp_data.get("apply_update"))
         assert ret_resp.json_data is mock_response.json_data
 
+    def test_wait_for_job_completion_records_sleep(self, mocker, idrac_redfish_object):
+        mocker.patch.dict('os.environ', {PERF_STATS_ENV: "true", PERF_TRACE_ENV: ""})
+        reset_request_stats()
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.get_job_event_listener', return_value=None)
+        mocker.patch(MODULE_UTIL_PATH + SLEEP_TIME, return_value=None)
+        running, completed = MagicMock(json_data={"JobState": "Running"}), \
+            MagicMock(json_data={"PercentComplete": 100, "JobState": "Completed"})
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=[running, running, completed])
+        idrac_redfish_object.wait_for_job_completion(API_TASK, job_wait=True)
+        assert get_request_stats().summary()["sleep_time"] == 35
+        reset_request_stats()
+
     @pytest.mark.parametrize("share_inp", [
         {"share_ip": "share_ip", "share_name": "share_name", "share_type": "share_type",
          "file_name": "file_name", "username": "username", "password": "password",
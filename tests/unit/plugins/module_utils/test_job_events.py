@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import threading
+import time
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from ansible.module_utils.urls import open_url
+from ansible.module_utils.six.moves.urllib.error import URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import JobEventListener, \
+    parse_sse_events, event_job_ids, get_job_event_listener, JOB_EVENTS_ENV
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking, job_tracking
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+JOB_ID = "JID_123456789012"
+JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/" + JOB_ID
+
+
+def job_event(job_id, message_id="IDRAC.2.9.JCP037"):
+    return {"Events": [{"EventType": "Alert", "MessageId": message_id, "MessageArgs": [job_id],
+                        "OriginOfCondition": {"@odata.id": JOB_URI}}]}
+
+
+class SSEHandler(BaseHTTPRequestHandler):
+    """Stand-in for the iDRAC /redfish/v1/SSE stream, emits the events queued on the server."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for delay, payload in self.server.events:
+            time.sleep(delay)
+            self.wfile.write("id: 1\ndata: {0}\n\n".format(json.dumps(payload)).encode())
+            self.wfile.flush()
+        time.sleep(self.server.hold)
+
+
+@pytest.fixture
+def sse_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SSEHandler)
+    server.daemon_threads = True
+    server.events = []
+    server.hold = 2
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def open_stream(server):
+    return lambda: open_url("http://127.0.0.1:{0}/redfish/v1/SSE".format(server.server_address[1]),
+                            use_proxy=False, timeout=5)
+
+
+class FakeIdrac(object):
+    def __init__(self, states):
+        self.states = list(states)
+        self.calls = 0
+
+    def invoke_request(self, uri, method):
+        self.calls += 1
+        resp = type("Resp", (object,), {})()
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        resp.json_data = {"Id": JOB_ID, "JobState": state, "LastRunStatus": state}
+        return resp
+
+
+class TestJobEvents(object):
+
+    def test_parse_sse_events(self):
+        stream = [b": keep-alive\n", b"id: 1\n", b'data: {"Events": \n', b'data: []}\n', b"\n",
+                  b"data: not json\n", b"\n", b'data: {"a": 1}\r\n', b"\r\n"]
+        assert list(parse_sse_events(stream)) == [{"Events": []}, {"a": 1}]
+
+    def test_event_job_ids(self):
+        assert event_job_ids(job_event(JOB_ID)) == {JOB_ID}
+        assert event_job_ids({"MessageArgs": ["JID_1"]}) == {"JID_1"}
+        assert event_job_ids({"Events": [{"OriginOfCondition": "/redfish/v1/Jobs/JID_2/"}]}) == {"JID_2"}
+
+    def test_listener_wakes_on_job_event(self, sse_server):
+        sse_server.events = [(0.1, job_event("JID_OTHER")), (0.3, job_event(JOB_ID))]
+        with JobEventListener(open_stream(sse_server), JOB_ID) as listener:
+            assert listener.available
+            start = time.time()
+            assert listener.wait(10) is True
+            assert time.time() - start < 5
+        assert listener.event_count == 1
+
+    def test_listener_unavailable_falls_back_to_sleep(self):
+        def refuse():
+            raise IOError("SSE not supported")
+        listener = JobEventListener(refuse, JOB_ID).start()
+        assert listener.available is False
+        assert listener.wait(0.1) is False
+
+    def test_job_tracking_with_listener(self, sse_server):
+        sse_server.events = [(0.2, job_event(JOB_ID))]
+        idrac = FakeIdrac(["Running", "Completed"])
+        with JobEventListener(open_stream(sse_server), JOB_ID) as listener:
+            start = time.time()
+            job_failed, msg, job_dict, wait_time = idrac_redfish_job_tracking(
+                idrac, JOB_URI, max_job_wait_sec=60, sleep_interval_secs=30, initial_wait=0,
+                job_event_listener=listener)
+        assert time.time() - start < 10
+        assert job_failed is False
+        assert msg == "Job tracking completed."
+        assert wait_time < 30
+        assert idrac.calls == 2
+
+    @pytest.mark.parametrize("tracker, states", [
+        (idrac_redfish_job_tracking, ["Running"]),
+        (job_tracking, [{"Id": 2050}])])
+    def test_job_tracking_times_out_on_event_storm(self, mocker, tracker, states):
+        listener = mocker.MagicMock()
+        listener.wait.side_effect = lambda timeout: time.sleep(0.01) or True
+        idrac = FakeIdrac(states)
+        start = time.monotonic()
+        job_failed, msg, job_dict, wait_time = tracker(
+            idrac, JOB_URI, max_job_wait_sec=2, sleep_interval_secs=1, initial_wait=0,
+            job_event_listener=listener)
+        assert time.monotonic() - start < 5
+        assert job_failed is True
+        assert idrac.calls > 2
+        assert 1.5 < wait_time < 3
+        assert listener.close.call_count == 0
+
+    @pytest.mark.parametrize("tracker, states", [
+        (idrac_redfish_job_tracking, ["Starting"]),
+        (job_tracking, [{"Id": 2080}])])
+    def test_job_tracking_with_listener_waits_on_other_states(self, mocker, tracker, states):
+        listener = mocker.MagicMock()
+        listener.wait.side_effect = lambda timeout: time.sleep(0.1) or False
+        idrac = FakeIdrac(states)
+        job_failed, msg, job_dict, wait_time = tracker(
+            idrac, JOB_URI, max_job_wait_sec=1, sleep_interval_secs=1, initial_wait=0,
+            job_event_listener=listener)
+        assert job_failed is True
+        assert idrac.calls <= 11
+        assert listener.wait.call_count == idrac.calls
+
+    def test_listener_closed_on_error(self, mocker):
+        listener = mocker.MagicMock()
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.get_job_event_listener', return_value=listener)
+        mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.time.sleep')
+        idrac = iDRACRedfishAPI({"idrac_ip": "192.168.0.1", "idrac_user": "user", "idrac_password": "pwd",
+                                 "idrac_port": 443})
+        mocker.patch.object(idrac, "invoke_request", side_effect=[mocker.MagicMock(), URLError("down")])
+        with pytest.raises(URLError):
+            idrac.wait_for_job_completion(JOB_URI, job_wait=True)
+        assert listener.close.call_count == 1
+
+    def test_get_job_event_listener(self, mocker):
+        mocker.patch.dict('os.environ', {JOB_EVENTS_ENV: ""})
+        rest_obj = mocker.MagicMock()
+        assert get_job_event_listener(rest_obj, JOB_URI) is None
+        mocker.patch.dict('os.environ', {JOB_EVENTS_ENV: "sse"})
+        listener = get_job_event_listener(rest_obj, JOB_URI, timeout=60)
+        assert listener.job_id == JOB_ID
+        assert rest_obj.open_stream.call_args_list[0] == mocker.call(
+            "/redfish/v1/SSE", query_param={"$filter": "EventFormatType eq Event"}, api_timeout=60)
+        listener.close()
@@ -18,6 +18,8 @@ import pytest
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import get_request_stats, \
+    reset_request_stats, PERF_STATS_ENV, PERF_TRACE_ENV
 from mock import MagicMock
 import json
 
@@ -133,6 +135,36 @@ class TestOMERest(object):
         assert reports == {"resp_obj": mock_response,
                            "report_list": list(range(50)) + (list(range(50)))}
 
+    def test_get_all_report_details_concurrent(self, mocker, module_params):
+        def invoke_request(method, uri, query_param=None):
+            skip = (query_param or {}).get("$skip", 0)
+            resp = MagicMock()
+            resp.json_data = {ODATA_COUNT: 23, "value": list(range(skip, min(skip + 5, 23)))}
+            return resp
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=invoke_request)
+        obj = RestOME(module_params)
+        reports = obj.get_all_report_details(DEVICE_API, max_workers=3)
+        assert reports["report_list"] == list(range(23))
+        assert reports["resp_obj"].json_data["value"] == [20, 21, 22]
+        assert invoke_mock.call_count == 5
+
+    def test_get_all_report_details_concurrent_fallback(self, mocker, module_params):
+        calls = []
+
+        def invoke_request(method, uri, query_param=None):
+            skip = (query_param or {}).get("$skip", 0)
+            calls.append(skip)
+            if skip == 10 and calls.count(10) == 1:
+                raise HTTPError(TEST_HOST, 503, "Service Unavailable", {}, None)
+            resp = MagicMock()
+            resp.json_data = {ODATA_COUNT: 15, "value": list(range(skip, min(skip + 5, 15)))}
+            return resp
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=invoke_request)
+        obj = RestOME(module_params)
+        reports = obj.get_all_report_details(DEVICE_API, max_workers=2)
+        assert reports["report_list"] == list(range(15))
+        assert calls.count(5) == 2
+
     def test_get_report_list_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -226,6 +258,20 @@ class TestOMERest(object):
         reports = ome_object.get_all_items_with_pagination(DEVICE_API)
         assert reports == {"total_count": 100, "value": list(range(100))}
 
+    def test_iter_items_with_pagination(self, mock_response, mocker, ome_object):
+        mock_response.json_data = {ODATA_COUNT: 100, "value": list(
+            range(50)), '@odata.nextLink': '/api/DeviceService/Devices2'}
+        mock_response_page2 = MagicMock()
+        mock_response_page2.json_data = {ODATA_COUNT: 100, "value": list(range(50, 100))}
+        invoke_mock = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
+                                   side_effect=[mock_response, mock_response_page2])
+        items = ome_object.iter_items_with_pagination(DEVICE_API, query_param={"$filter": "Type eq 1000"})
+        assert next(items) == 0
+        assert invoke_mock.call_count == 1
+        assert list(items) == list(range(1, 100))
+        assert invoke_mock.call_args_list[1][0] == ('GET', '/DeviceService/Devices2')
+        assert invoke_mock.call_args_list[1][1] == {"query_param": None}
+
     def test_get_all_items_with_pagination_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -330,6 +376,48 @@ class TestOMERest(object):
         assert job_failed is ret_val[1]
         assert message == ret_val[2]
 
+    def test_job_tracking_records_sleep(self, mocker, ome_object):
+        mocker.patch.dict('os.environ', {PERF_STATS_ENV: "true", PERF_TRACE_ENV: ""})
+        reset_request_stats()
+        mocker.patch(MODULE_UTIL_PATH + 'ome.time.sleep', return_value=())
+        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.get_job_info',
+                     side_effect=[(False, False, "Running"), (True, False, "My Message")])
+        ome_object.job_tracking(12345, 20, 5)
+        assert get_request_stats().summary()["sleep_time"] == 10
+        reset_request_stats()
+
+    def test_get_jobs_status(self, mocker, ome_object):
+        mocker.patch(MODULE_UTIL_PATH + 'ome.JOB_BATCH_SIZE', 2)
+        iter_items = mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.iter_items_with_pagination',
+                                  side_effect=[iter([{"Id": 1, "LastRunStatus": {"Id": 2060}},
+                                                     {"Id": 2, "LastRunStatus": {"Id": 2050}}]),
+                                               iter([{"Id": 3, "LastRunStatus": {"Id": 2070}}])])
+        assert ome_object.get_jobs_status([1, 2, 3]) == {1: 2060, 2: 2050, 3: 2070}
+        assert iter_items.call_args_list[0][1]["query_param"] == {"$filter": "Id in (1,2)"}
+        assert iter_items.call_args_list[1][1]["query_param"] == {"$filter": "Id in (3)"}
+
+    def test_iter_jobs_tracking(self, mocker, ome_object):
+        mocker.patch(MODULE_UTIL_PATH + 'ome.time.sleep', return_value=())
+        jobs_status = mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.get_jobs_status',
+                                   side_effect=[{1: 2050, 2: 2060, 3: 2050, 4: 2050},
+                                                HTTPError(TEST_HOST, 503, BAD_REQUEST, {}, None),
+                                                {1: 2070, 3: 2050, 4: 2050},
+                                                {3: 2020, 4: 2050}])
+        results = list(ome_object.iter_jobs_tracking([1, 2, 3, 4], job_wait_sec=4, sleep_time=1))
+        assert results == [(2, False, "Job Completed successfully."),
+                           (1, True, "Job is in Failed state, and is not completed."),
+                           (3, False, "Job Scheduled successfully."),
+                           (4, True, "The job is not complete after 4 seconds.")]
+        assert jobs_status.call_count == 4
+
+    def test_jobs_tracking_unresponsive(self, mocker, ome_object):
+        mocker.patch(MODULE_UTIL_PATH + 'ome.time.sleep', return_value=())
+        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.get_jobs_status',
+                     side_effect=HTTPError(TEST_HOST, 503, BAD_REQUEST, {}, None))
+        results = ome_object.jobs_tracking([1, 2], job_wait_sec=10, sleep_time=1)
+        assert results == {1: (True, "Unable to track the job status of 1."),
+                           2: (True, "Unable to track the job status of 2.")}
+
     def test_strip_substr_dict(self, mocker, mock_response, ome_object):
         data_dict = {"@odata.context": "/api/$metadata#Collection(DeviceService.DeviceType)",
                      ODATA_COUNT: 5,
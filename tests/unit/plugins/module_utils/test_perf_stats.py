@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+from io import StringIO
+import pytest
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import perf_stats
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import get_path_template, \
+    get_request_stats, track_request, note_retry, record_sleep, record_job_polls, PerfStatsMixin, PERF_STATS_ENV, PERF_TRACE_ENV
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+@pytest.fixture
+def stats_env(mocker):
+    mocker.patch.dict('os.environ', {PERF_STATS_ENV: "true", PERF_TRACE_ENV: ""})
+    perf_stats.reset_request_stats()
+    yield
+    perf_stats.reset_request_stats()
+
+
+class TestPerfStats(object):
+
+    @pytest.mark.parametrize("url,template", [
+        ("https://192.168.0.1:443/api/JobService/Jobs(10074)/ExecutionHistories?$top=1",
+         "/api/JobService/Jobs({id})/ExecutionHistories"),
+        ("https://192.168.0.1:443/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789012",
+         "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{id}"),
+        ("https://192.168.0.1:443/redfish/v1/AccountService/Accounts/2", "/redfish/v1/AccountService/Accounts/{id}"),
+        ("https://[fe80::1]:443/api/SessionService/Sessions('d1c0e7f2-1b2c-4d5e-8f90-a1b2c3d4e5f6')",
+         "/api/SessionService/Sessions({id})"),
+    ])
+    def test_get_path_template(self, url, template):
+        assert get_path_template(url) == template
+
+    def test_disabled(self, mocker):
+        mocker.patch.dict('os.environ', {PERF_STATS_ENV: "", PERF_TRACE_ENV: ""})
+        perf_stats.reset_request_stats()
+        assert get_request_stats() is None
+        with track_request("GET", "https://192.168.0.1/redfish/v1") as trace:
+            trace.done(None)
+        record_sleep(10)
+        assert get_request_stats() is None
+
+    def test_track_request(self, stats_env, mocker):
+        response = mocker.MagicMock(body=b'{"Id": "JID_1"}')
+        response.resp.status = 200
+        with track_request("get", "https://192.168.0.1/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_1") as trace:
+            note_retry()
+            trace.done(response)
+        with pytest.raises(HTTPError):
+            with track_request("GET", "https://192.168.0.1/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_2"):
+                raise HTTPError("https://192.168.0.1", 404, "Not Found", {}, StringIO("{}"))
+        note_retry()
+        record_sleep(12.5)
+        record_job_polls(3)
+        summary = get_request_stats().summary()
+        assert summary["requests"] == 2
+        assert summary["errors"] == 1
+        assert summary["retries"] == 1
+        assert summary["bytes"] == 15
+        assert summary["sleep_time"] == 12.5
+        assert summary["job_polls"] == 3
+        assert len(summary["endpoints"]) == 1
+        endpoint = summary["endpoints"][0]
+        assert (endpoint["method"], endpoint["path"], endpoint["count"]) == \
+            ("GET", "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{id}", 2)
+
+    def test_trace_file(self, mocker, tmp_path):
+        trace_file = tmp_path / "trace.jsonl"
+        mocker.patch.dict('os.environ', {PERF_STATS_ENV: "", PERF_TRACE_ENV: str(trace_file)})
+        perf_stats.reset_request_stats()
+        open_url = mocker.patch(MODULE_UTIL_PATH + 'idrac_redfish.open_url')
+        open_url.return_value.read.return_value = b'{}'
+        open_url.return_value.status = 200
+        obj = iDRACRedfishAPI({"idrac_ip": "192.168.0.1", "idrac_user": "username", "idrac_password": "password",
+                               "idrac_port": 443})
+        obj.invoke_request("/redfish/v1/Systems/System.Embedded.1?$select=Model", "GET")
+        obj.invoke_request("/redfish/v1/AccountService/Accounts/3", "PATCH", data={"UserName": "user"})
+        records = [json.loads(line) for line in trace_file.read_text().splitlines()]
+        perf_stats.reset_request_stats()
+        assert [(rec["method"], rec["path"], rec["status"], rec["bytes"]) for rec in records] == [
+            ("GET", "/redfish/v1/Systems/System.Embedded.1", 200, 2),
+            ("PATCH", "/redfish/v1/AccountService/Accounts/{id}", 200, 2)]
+
+    def test_perf_stats_mixin(self, stats_env):
+        class BaseModule(object):
+            def exit_json(self, **kwargs):
+                self.result = kwargs
+
+            def fail_json(self, msg, **kwargs):
+                self.result = dict(kwargs, msg=msg, failed=True)
+
+        class Module(PerfStatsMixin, BaseModule):
+            pass
+
+        module = Module()
+        module.exit_json(msg="done", changed=False)
+        assert module.result["perf_stats"]["requests"] == 0
+        module.fail_json("failed")
+        assert module.result["failed"] is True
+        assert "endpoints" in module.result["perf_stats"]
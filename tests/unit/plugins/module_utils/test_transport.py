@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+from io import BytesIO
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import transport
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import ConnectionPool, \
+    OpenURLResponse, PooledResponse, CassetteTransport, keep_alive_pool, get_connection_pool, get_transport, \
+    redact_secrets, redact_text_secrets, conditional_get, KEEP_ALIVE_ENV, CASSETTE_ENV, CASSETTE_MODE_ENV, REPLAY_LATENCY_ENV, REDACTED
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import CACHE_DIR_ENV
+from ansible.module_utils.urls import open_url
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.path == "/redirect":
+            self._reply(302, b"", {"Location": "/api/echo"})
+        elif self.path == "/drop":
+            self._reply(200, b"{}")
+            self.close_connection = True
+        elif self.path == "/secret":
+            self._reply(200, b'{"UserName": "root", "Password": "calvin", "Snmp": [{"Community": "public"}]}',
+                        {"X-Auth-Token": "abc123"})
+        elif self.path == "/scp":
+            self._reply(200, b'<Component><Attribute Name="Users.2#UserName">root</Attribute>'
+                             b'<Attribute Name="Users.2#SHA256Password">0A1B2C</Attribute>'
+                             b'<Password>calvin</Password><Snmp community="public"/></Component>')
+        elif self.path == "/binary":
+            self._reply(200, b"\xff\xfecalvin")
+        elif self.path == "/etag":
+            if self.headers.get("If-None-Match") == self.server.etag:
+                self._reply(304, b"")
+            else:
+                self._reply(200, b'{"value": [1000]}', {"ETag": self.server.etag})
+        elif self.path == "/missing":
+            self._reply(404, b'{"error": "not found"}')
+        else:
+            body = json.dumps({"path": self.path, "auth": self.headers.get("Authorization")})
+            self._reply(200, body.encode())
+
+    def do_POST(self):
+        self.server.connections.add(self.client_address)
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(201, self.rfile.read(length))
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    server.connections = set()
+    server.etag = '"v1"'
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def server_url(server, path):
+    return "http://127.0.0.1:{0}{1}".format(server.server_address[1], path)
+
+
+class TestConnectionPool(object):
+
+    def test_connection_reused_for_host(self, http_server):
+        pool = ConnectionPool(maxsize=2)
+        for dummy in range(5):
+            resp = pool.open_url(server_url(http_server, "/api/echo"), method="GET", use_proxy=False)
+            assert resp.getcode() == 200
+            assert json.loads(resp.read())["path"] == "/api/echo"
+        assert len(http_server.connections) == 1
+        assert pool.idle_count("127.0.0.1") == 1
+        pool.clear()
+        assert pool.idle_count() == 0
+
+    def test_basic_auth_and_post(self, http_server):
+        pool = ConnectionPool()
+        resp = pool.open_url(server_url(http_server, "/api/echo"), method="GET", use_proxy=False,
+                             url_username="user", url_password="pass", force_basic_auth=True)
+        assert json.loads(resp.read())["auth"].startswith("Basic ")
+        resp = pool.open_url(server_url(http_server, "/api/items"), data=json.dumps({"a": 1}),
+                             method="POST", use_proxy=False, headers={"Content-Type": "application/json"})
+        assert resp.getcode() == 201
+        assert json.loads(resp.read()) == {"a": 1}
+
+    def test_redirect_followed(self, http_server):
+        pool = ConnectionPool()
+        resp = pool.open_url(server_url(http_server, "/redirect"), method="GET", use_proxy=False,
+                             follow_redirects="all")
+        assert json.loads(resp.read())["path"] == "/api/echo"
+
+    def test_http_error(self, http_server):
+        pool = ConnectionPool()
+        with pytest.raises(HTTPError) as exc:
+            pool.open_url(server_url(http_server, "/missing"), method="GET", use_proxy=False)
+        assert exc.value.code == 404
+        assert json.load(exc.value) == {"error": "not found"}
+        assert pool.idle_count() == 1
+
+    def test_stale_connection_retried(self, http_server):
+        pool = ConnectionPool()
+        pool.open_url(server_url(http_server, "/drop"), method="GET", use_proxy=False).read()
+        assert pool.idle_count() == 1
+        resp = pool.open_url(server_url(http_server, "/api/echo"), method="GET", use_proxy=False)
+        assert resp.getcode() == 200
+        assert len(http_server.connections) == 2
+
+    def test_keep_alive_pool(self, mocker):
+        mocker.patch.dict('os.environ', {KEEP_ALIVE_ENV: ""})
+        assert keep_alive_pool({}) is None
+        assert keep_alive_pool({"keep_alive": True}) is get_connection_pool()
+        mocker.patch.dict('os.environ', {KEEP_ALIVE_ENV: "true"})
+        assert keep_alive_pool(None) is get_connection_pool()
+        assert keep_alive_pool({"keep_alive": False}) is None
+
+    def test_rest_ome_uses_pool(self, mocker):
+        pool = mocker.MagicMock()
+        open_url = mocker.patch(MODULE_UTIL_PATH + 'ome.open_url')
+        module_params = {'hostname': '192.168.0.1', 'username': 'username', 'password': 'password',
+                         "port": 443, "keep_alive": True}
+        obj = RestOME(module_params)
+        obj.connection_pool = pool
+        pool.open_url.return_value.read.return_value = b'{"value": []}'
+        resp = obj.invoke_request("GET", "DeviceService/Devices")
+        assert resp.json_data == {"value": []}
+        assert pool.open_url.call_count == 1
+        assert open_url.call_count == 0
+
+
+class TestCassetteTransport(object):
+
+    def test_record_and_replay(self, http_server, tmpdir):
+        cassette = str(tmpdir.join("cassette.jsonl"))
+        recorder = CassetteTransport(cassette, "record", ConnectionPool())
+        for path in ("/api/echo?$skip=0", "/api/echo?$skip=0", "/secret", "/scp", "/binary"):
+            resp = recorder.open_url(server_url(http_server, path), method="GET", use_proxy=False)
+            assert resp.getcode() == 200
+        with pytest.raises(HTTPError) as exc:
+            recorder.open_url(server_url(http_server, "/missing"), method="GET", use_proxy=False)
+        assert json.load(exc.value) == {"error": "not found"}
+        with open(cassette) as recorded:
+            lines = recorded.read()
+        assert "calvin" not in lines and "public" not in lines and "abc123" not in lines and "0A1B2C" not in lines
+        http_server.shutdown()
+        player = CassetteTransport(cassette, "replay", latency_scale=0)
+        resp = player.open_url("https://192.168.0.1/api/echo?$skip=0", method="GET")
+        assert json.loads(resp.read())["path"] == "/api/echo?$skip=0"
+        resp = player.open_url("https://192.168.0.1/secret")
+        assert json.loads(resp.read())["Password"] == REDACTED
+        assert resp.headers["X-Auth-Token"] == REDACTED
+        assert resp.headers["Content-Type"] == "application/json"
+        assert player.open_url("https://192.168.0.1/scp").read() == (
+            b'<Component><Attribute Name="Users.2#UserName">root</Attribute>'
+            b'<Attribute Name="Users.2#SHA256Password">********</Attribute>'
+            b'<Password>********</Password><Snmp community="********"/></Component>')
+        assert player.open_url("https://192.168.0.1/binary").read() == b""
+        with pytest.raises(HTTPError) as exc:
+            player.open_url("https://192.168.0.1/missing", method="GET")
+        assert exc.value.code == 404
+        assert json.load(exc.value) == {"error": "not found"}
+        with pytest.raises(URLError):
+            player.open_url("https://192.168.0.1/api/echo", method="DELETE")
+
+    def test_replay_latency(self, tmpdir, mocker):
+        cassette = tmpdir.join("cassette.jsonl")
+        cassette.write(json.dumps({"method": "GET", "path": "/api", "status": 200, "reason": "OK",
+                                   "elapsed": 0.5, "headers": [], "body_base64": "AAE="}) + "\n")
+        sleep = mocker.patch(MODULE_UTIL_PATH + 'transport.time.sleep')
+        resp = CassetteTransport(str(cassette), "replay", latency_scale=0.1).open_url("https://host/api")
+        assert resp.read() == b"\x00\x01"
+        sleep.assert_called_once_with(pytest.approx(0.05))
+        with pytest.raises(ValueError):
+            CassetteTransport(str(cassette), "rewind")
+
+    def test_redact_secrets(self):
+        data = {"Password": "x", "Token": "1", "Users": [{"passwd": "y", "Name": "z"}], "SecretList": ["a"]}
+        assert redact_secrets(data) == {"Password": REDACTED, "Token": REDACTED,
+                                        "Users": [{"passwd": REDACTED, "Name": "z"}], "SecretList": ["a"]}
+
+    def test_redact_text_secrets(self):
+        text = "Password=abc123 user=root passphrase='p q' <Token>t0</Token>"
+        assert redact_text_secrets(text) == "Password=******** user=root passphrase='********' <Token>********</Token>"
+
+    def test_redact_secrets_keeps_flags_and_counters(self):
+        data = {"PasswordChangeRequired": False, "TokenCount": 0, "SNMPCommunityEnabled": True,
+                "CommunityString": "public", "PasswordExpiry": None}
+        assert redact_secrets(data) == {"PasswordChangeRequired": False, "TokenCount": 0, "SNMPCommunityEnabled": True,
+                                        "CommunityString": REDACTED, "PasswordExpiry": None}
+
+    def test_get_transport(self, tmpdir, mocker):
+        cassette = tmpdir.join("cassette.jsonl")
+        cassette.write("")
+        mocker.patch.dict('os.environ', {KEEP_ALIVE_ENV: "", CASSETTE_ENV: ""})
+        assert get_transport({}) is None
+        assert get_transport({"keep_alive": True}) is get_connection_pool()
+        mocker.patch.dict(transport._cassettes, clear=True)
+        mocker.patch.dict('os.environ', {CASSETTE_ENV: str(cassette), CASSETTE_MODE_ENV: "record",
+                                         REPLAY_LATENCY_ENV: "0"})
+        recorder = get_transport({"keep_alive": True})
+        assert isinstance(recorder, CassetteTransport) and recorder.mode == "record"
+        assert recorder.connection_pool is get_connection_pool()
+        assert get_transport({}) is recorder
+        mocker.patch.dict('os.environ', {CASSETTE_MODE_ENV: "replay"})
+        assert get_transport({}).latency_scale == 0
+
+
+class TestOpenURLResponse(object):
+
+    def test_json_data_parsed_once(self, mocker):
+        loads = mocker.spy(transport.json, "loads")
+        resp = OpenURLResponse(PooledResponse("https://host/api", 200, "OK", {}, b'{"value": [1, 2]}'))
+        assert resp.json_data["value"] == [1, 2]
+        assert resp.json_data is resp.json_data
+        assert loads.call_count == 1
+        resp.body = b'{"value": []}'
+        assert resp.json_data == {"value": []}
+        assert loads.call_count == 2
+        assert resp.success is True
+
+    def test_raw_is_not_a_copy(self):
+        body = b'{"value": []}'
+        resp = OpenURLResponse(PooledResponse("https://host/api", 200, "OK", {}, body))
+        assert resp.body is body
+        assert resp.raw.obj is body
+        assert resp.raw.readonly
+
+    def test_write_to_streams_body(self):
+        pooled = PooledResponse("https://host/file", 200, "OK", {}, b"x" * 10)
+        resp = OpenURLResponse(pooled, stream=True)
+        assert resp.body is None
+        sink = BytesIO()
+        assert resp.write_to(sink, chunk_size=4) == 10
+        assert sink.getvalue() == b"x" * 10
+        sink = BytesIO()
+        resp = OpenURLResponse(PooledResponse("https://host/file", 200, "OK", {}, b"abc"))
+        assert resp.write_to(sink) == 3
+        assert sink.getvalue() == b"abc"
+
+    def test_pooled_response_partial_read(self):
+        pooled = PooledResponse("https://host/file", 200, "OK", {}, b"abcdef")
+        assert pooled.read(4) == b"abcd"
+        assert pooled.read() == b"ef"
+        assert pooled.read() == b""
+
+
+class TestConditionalGet(object):
+
+    @pytest.mark.parametrize("pooled", [True, False])
+    def test_not_modified_served_from_cache(self, http_server, tmpdir, mocker, pooled):
+        mocker.patch.dict('os.environ', {CACHE_DIR_ENV: str(tmpdir)})
+        sender = ConnectionPool().open_url if pooled else open_url
+        url = server_url(http_server, "/etag")
+        sent = []
+
+        def send(url, headers=None, **kwargs):
+            sent.append(dict(headers))
+            return sender(url, headers=headers, **kwargs)
+        resp = conditional_get(send, url, headers={"Accept": "application/json"}, method="GET", use_proxy=False)
+        assert json.loads(resp.read()) == {"value": [1000]}
+        assert "If-None-Match" not in sent[0]
+        resp = conditional_get(send, url, method="GET", use_proxy=False)
+        assert sent[1]["If-None-Match"] == '"v1"'
+        assert resp.getcode() == 200
+        assert resp.headers["ETag"] == '"v1"'
+        assert json.loads(resp.read()) == {"value": [1000]}
+        http_server.etag = '"v2"'
+        resp = conditional_get(send, url, method="GET", use_proxy=False)
+        assert resp.headers["ETag"] == '"v2"'
+        assert len(tmpdir.join("http_responses").listdir()) == 1
+
+    def test_cache_kept_per_user(self, http_server, tmpdir, mocker):
+        mocker.patch.dict('os.environ', {CACHE_DIR_ENV: str(tmpdir)})
+        url = server_url(http_server, "/etag")
+        sent = []
+
+        def send(url, headers=None, **kwargs):
+            sent.append(dict(headers))
+            return open_url(url, headers=headers, **kwargs)
+        conditional_get(send, url, user="admin", use_proxy=False)
+        conditional_get(send, url, user="operator", use_proxy=False)
+        conditional_get(send, url, headers={"X-Auth-Token": "token1"}, use_proxy=False)
+        conditional_get(send, url, headers={"X-Auth-Token": "token2"}, use_proxy=False)
+        assert all("If-None-Match" not in headers for headers in sent)
+        conditional_get(send, url, user="admin", use_proxy=False)
+        conditional_get(send, url, headers={"X-Auth-Token": "token2"}, use_proxy=False)
+        assert sent[4]["If-None-Match"] == sent[5]["If-None-Match"] == '"v1"'
+        assert len(tmpdir.join("http_responses").listdir()) == 4
+
+    def test_without_etag_not_cached(self, http_server, tmpdir, mocker):
+        mocker.patch.dict('os.environ', {CACHE_DIR_ENV: str(tmpdir)})
+        resp = conditional_get(ConnectionPool().open_url, server_url(http_server, "/api/echo"), use_proxy=False)
+        assert json.loads(resp.read())["path"] == "/api/echo"
+        assert not tmpdir.join("http_responses").check()
+        with pytest.raises(HTTPError):
+            conditional_get(ConnectionPool().open_url, server_url(http_server, "/missing"), use_proxy=False)
+
+    def test_rest_ome_cache_opt_in(self, mocker):
+        conditional = mocker.patch(MODULE_UTIL_PATH + 'ome.conditional_get')
+        conditional.return_value.read.return_value = b'{"value": []}'
+        open_url = mocker.patch(MODULE_UTIL_PATH + 'ome.open_url')
+        open_url.return_value.read.return_value = b'{"value": []}'
+        module_params = {'hostname': '192.168.0.1', 'username': 'username', 'password': 'password', "port": 443}
+        obj = RestOME(module_params)
+        mocker.patch.dict('os.environ', {transport.HTTP_CACHE_ENV: ""})
+        obj.invoke_request("GET", "DeviceService/DeviceType", cache=True)
+        assert conditional.call_count == 0
+        mocker.patch.dict('os.environ', {transport.HTTP_CACHE_ENV: "true"})
+        obj.invoke_request("GET", "DeviceService/Devices")
+        assert conditional.call_count == 0
+        resp = obj.invoke_request("GET", "DeviceService/DeviceType", cache=True)
+        assert conditional.call_count == 1
+        assert resp.json_data == {"value": []}
+        assert conditional.call_args[1]["user"] == "username"
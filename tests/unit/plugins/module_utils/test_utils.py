@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import ipaddress
+import json
+import threading
+import time
+import pytest
+from email.utils import formatdate
+from io import BytesIO, StringIO
+import xml.etree.ElementTree as ET
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import AdaptivePollInterval, \
+    get_job_poll_interval, estimate_job_remaining_secs, parse_iso_duration, get_retry_after, \
+    job_tracking, idrac_redfish_job_tracking, JOB_POLL_ENV, fanout_argument_spec, fan_out, exit_fan_out, \
+    check_fanout_options, get_max_workers, concurrent_map, MAX_WORKERS_ENV, ResourceFetcher, \
+    file_sha256, get_cache_file, read_cache_file, write_cache_file, remove_cache_file, CACHE_DIR_ENV, \
+    iter_scp_attributes, get_registry_index, get_cached_registry, IPIntervalIndex, get_api_path, \
+    get_all_data_with_pagination, iter_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.perf_stats import get_request_stats, \
+    reset_request_stats, PERF_STATS_ENV, PERF_TRACE_ENV
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789012"
+
+
+def job_response(mocker, job_dict, headers=None):
+    resp = mocker.MagicMock()
+    resp.json_data = job_dict
+    resp.resp.headers = headers or {}
+    return resp
+
+
+class TestAdaptivePolling(object):
+
+    @pytest.fixture
+    def sleep_mock(self, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'utils.get_job_event_listener', return_value=None)
+        return mocker.patch(MODULE_UTIL_PATH + 'utils.time.sleep')
+
+    @pytest.fixture
+    def job_polls(self, mocker):
+        mocker.patch.dict('os.environ', {PERF_STATS_ENV: "true", PERF_TRACE_ENV: ""})
+        reset_request_stats()
+        yield lambda: get_request_stats().summary()["job_polls"]
+        reset_request_stats()
+
+    def test_interval_grows_to_cap(self):
+        poll = AdaptivePollInterval(initial_secs=2, factor=2, max_secs=10)
+        assert [poll.next_interval() for dummy in range(5)] == [2, 4, 8, 10, 10]
+
+    def test_interval_follows_job_progress(self):
+        poll = AdaptivePollInterval(initial_secs=2, factor=2, max_secs=120)
+        assert poll.next_interval({"PercentComplete": 50}, elapsed=20) == 20
+        assert poll.next_interval({"PercentComplete": 95}, elapsed=190) == 10
+        assert poll.next_interval({"PercentComplete": 10}, elapsed=60) == 120
+        assert poll.next_interval({"EstimatedDuration": "PT1M"}, elapsed=55) == 5
+        assert poll.next_interval({}) == 32
+        assert AdaptivePollInterval(initial_secs=2).next_interval({}, retry_after=30) == 30
+
+    @pytest.mark.parametrize("job_dict, elapsed, remaining", [
+        ({"PercentComplete": 25}, 30, 90),
+        ({"PercentComplete": 0, "EstimatedDuration": "PT2M"}, 30, 90),
+        ({"PercentComplete": 100}, 30, None),
+        ({"EstimatedDuration": "PT10S"}, 30, None),
+        ({"EstimatedDuration": None}, 30, None),
+    ])
+    def test_estimate_job_remaining_secs(self, job_dict, elapsed, remaining):
+        assert estimate_job_remaining_secs(job_dict, elapsed) == remaining
+
+    def test_parse_iso_duration(self):
+        assert parse_iso_duration("PT1H30M") == 5400
+        assert parse_iso_duration("P1DT2.5S") == 86402.5
+        assert parse_iso_duration("PT") is None
+        assert parse_iso_duration("30") is None
+
+    def test_get_retry_after(self):
+        assert get_retry_after({"Retry-After": "15"}) == 15
+        assert 55 <= get_retry_after({"Retry-After": formatdate(time.time() + 60, usegmt=True)}) <= 60
+        assert get_retry_after({"Retry-After": "soon"}) is None
+        assert get_retry_after({}) is None
+        assert get_retry_after(None) is None
+
+    def test_get_job_poll_interval(self, mocker):
+        poll = AdaptivePollInterval()
+        assert get_job_poll_interval(10, poll) is poll
+        mocker.patch.dict('os.environ', {JOB_POLL_ENV: ""})
+        assert get_job_poll_interval(10) is None
+        mocker.patch.dict('os.environ', {JOB_POLL_ENV: "adaptive"})
+        poll = get_job_poll_interval(10)
+        assert poll.initial_secs == 2
+        assert poll.max_secs == 120
+
+    def test_idrac_job_tracking_adaptive(self, mocker, sleep_mock, job_polls):
+        rest_obj = mocker.MagicMock()
+        rest_obj.invoke_request.side_effect = [
+            job_response(mocker, {"JobState": "Running"}),
+            job_response(mocker, {"JobState": "Running"}),
+            job_response(mocker, {"JobState": "Running", "PercentComplete": 60}),
+            job_response(mocker, {"JobState": "Completed", "PercentComplete": 100})]
+        poll = AdaptivePollInterval(initial_secs=2, factor=2, max_secs=60)
+        job_failed, msg, job_dict, wait_time = idrac_redfish_job_tracking(
+            rest_obj, JOB_URI, max_job_wait_sec=600, sleep_interval_secs=10, poll_interval=poll)
+        assert not job_failed
+        assert msg == "Job tracking completed."
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [1, 2, 4, 4]
+        assert wait_time == 10
+        assert job_polls() == 4
+
+    def test_job_tracking_adaptive_retry_after(self, mocker, sleep_mock, job_polls):
+        rest_obj = mocker.MagicMock()
+        rest_obj.invoke_request.side_effect = [
+            HTTPError(JOB_URI, 503, "Service Unavailable", {"Retry-After": "25"}, StringIO("{}")),
+            job_response(mocker, {"LastRunStatus": {"Id": 2050}}, {"Retry-After": "7"}),
+            job_response(mocker, {"LastRunStatus": {"Id": 2060}})]
+        poll = AdaptivePollInterval(initial_secs=2, factor=2, max_secs=60)
+        job_failed, msg, job_dict, wait_time = job_tracking(
+            rest_obj, JOB_URI, sleep_interval_secs=10, poll_interval=poll)
+        assert not job_failed
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [1, 25, 7]
+        assert job_polls() == 3
+
+    def test_job_tracking_adaptive_timeout(self, mocker, sleep_mock, job_polls):
+        rest_obj = mocker.MagicMock()
+        rest_obj.invoke_request.return_value = job_response(mocker, {"JobState": "Running"})
+        poll = AdaptivePollInterval(initial_secs=2, factor=2, max_secs=60)
+        job_failed, msg, job_dict, wait_time = idrac_redfish_job_tracking(
+            rest_obj, JOB_URI, max_job_wait_sec=100, sleep_interval_secs=10, poll_interval=poll)
+        assert job_failed
+        assert wait_time == 100
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [1, 2, 4, 8, 16, 32, 38]
+        assert job_polls() == 6
+
+    def test_job_tracking_adaptive_bounded_by_time(self, mocker, sleep_mock, job_polls):
+        rest_obj = mocker.MagicMock()
+        rest_obj.invoke_request.return_value = job_response(mocker, {"LastRunStatus": {"Id": 2050}})
+        poll = AdaptivePollInterval(initial_secs=2, factor=2, max_secs=60)
+        job_failed, msg, job_dict, wait_time = job_tracking(
+            rest_obj, JOB_URI, max_job_wait_sec=20, sleep_interval_secs=10, poll_interval=poll)
+        assert job_failed
+        assert wait_time == 20
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [1, 2, 4, 8, 6]
+        assert job_polls() == 4
+
+    @pytest.mark.parametrize("tracker, state", [
+        (job_tracking, {"LastRunStatus": {"Id": 2080}}),
+        (idrac_redfish_job_tracking, {"JobState": "Starting"})])
+    def test_job_tracking_adaptive_waits_on_other_states(self, mocker, sleep_mock, job_polls, tracker, state):
+        rest_obj = mocker.MagicMock()
+        rest_obj.invoke_request.return_value = job_response(mocker, state)
+        poll = AdaptivePollInterval(initial_secs=2, factor=2, max_secs=60)
+        job_failed, msg, job_dict, wait_time = tracker(
+            rest_obj, JOB_URI, max_job_wait_sec=20, sleep_interval_secs=10, poll_interval=poll)
+        assert job_failed
+        assert wait_time == 20
+        assert [call[0][0] for call in sleep_mock.call_args_list] == [1, 2, 4, 8, 6]
+        assert rest_obj.invoke_request.call_count == 4
+
+    def test_job_tracking_constant_interval(self, mocker, sleep_mock, job_polls):
+        mocker.patch.dict('os.environ', {JOB_POLL_ENV: ""})
+        rest_obj = mocker.MagicMock()
+        rest_obj.invoke_request.return_value = job_response(mocker, {"JobState": "Running"})
+        job_failed, msg, job_dict, wait_time = idrac_redfish_job_tracking(
+            rest_obj, JOB_URI, max_job_wait_sec=30, sleep_interval_secs=10)
+        assert job_failed
+        assert wait_time == 30
+        assert rest_obj.invoke_request.call_count == 3
+        assert job_polls() == 3
+
+    def test_job_tracking_constant_interval_ignores_request_time(self, mocker, sleep_mock, job_polls):
+        mocker.patch.dict('os.environ', {JOB_POLL_ENV: ""})
+        rest_obj = mocker.MagicMock()
+        rest_obj.invoke_request.return_value = job_response(mocker, {"LastRunStatus": {"Id": 2050}})
+        monotonic = mocker.patch(MODULE_UTIL_PATH + 'utils.time.monotonic')
+        job_failed, msg, job_dict, wait_time = job_tracking(
+            rest_obj, JOB_URI, max_job_wait_sec=30, sleep_interval_secs=10)
+        assert job_failed
+        assert wait_time == 30
+        assert isinstance(wait_time, int)
+        assert rest_obj.invoke_request.call_count == 3
+        assert monotonic.call_count == 0
+
+
+class TestConcurrency(object):
+
+    def test_get_max_workers(self, mocker):
+        mocker.patch.dict('os.environ', {MAX_WORKERS_ENV: ""})
+        assert get_max_workers() == 1
+        assert get_max_workers({"max_workers": None}) == 1
+        assert get_max_workers({"max_workers": 8}) == 8
+        assert get_max_workers({"max_workers": 0}) == 1
+        mocker.patch.dict('os.environ', {MAX_WORKERS_ENV: "6"})
+        assert get_max_workers({}) == 6
+        assert get_max_workers({"max_workers": 2}) == 2
+
+    def test_concurrent_map_sequential_by_default(self, mocker):
+        executor = mocker.patch(MODULE_UTIL_PATH + 'utils.ThreadPoolExecutor')
+        assert concurrent_map(lambda item: item * 2, [1, 2, 3]) == [2, 4, 6]
+        assert executor.call_count == 0
+
+    def test_resource_fetcher_gets_each_uri_once(self, mocker):
+        idrac = mocker.MagicMock()
+        idrac.invoke_request.side_effect = lambda uri, method: mocker.MagicMock(json_data={"Id": uri})
+        fetcher = ResourceFetcher(idrac, max_workers=4)
+        result = fetcher.map(fetcher.get, ["/a", "/b", "/a", "/a", "/b"])
+        assert result == [{"Id": "/a"}, {"Id": "/b"}, {"Id": "/a"}, {"Id": "/a"}, {"Id": "/b"}]
+        assert idrac.invoke_request.call_count == 2
+
+    def test_resource_fetcher_missing_codes(self, mocker):
+        idrac = mocker.MagicMock()
+        idrac.invoke_request.side_effect = lambda uri, method: (_ for _ in ()).throw(
+            HTTPError(uri, int(uri.strip("/")), "error", {}, None))
+        fetcher = ResourceFetcher(idrac)
+        assert fetcher.get("/404") is None
+        assert fetcher.get("/400") is None
+        with pytest.raises(HTTPError):
+            fetcher.get("/500")
+        with pytest.raises(HTTPError):
+            ResourceFetcher(idrac, missing_codes=(404,)).get("/400")
+        assert idrac.invoke_request.call_count == 4
+
+
+class TestFanOut(object):
+    auth_spec = {"idrac_ip": {"required": True, "type": "str"},
+                 "idrac_user": {"required": True, "type": "str"},
+                 "timeout": {"type": "int", "default": 30}}
+
+    def test_fanout_argument_spec(self):
+        spec = fanout_argument_spec(self.auth_spec, "idrac_ip")
+        assert spec["max_workers"] == {"type": "int"}
+        assert spec["target_timeout"] == {"type": "int"}
+        assert spec["idrac_ip"] == spec["idrac_user"] == {"type": "str"}
+        assert "timeout" not in spec
+        assert spec["targets"]["options"] == {"idrac_ip": {"required": True, "type": "str"},
+                                              "idrac_user": {"type": "str"}, "timeout": {"type": "int"}}
+        assert self.auth_spec["idrac_user"]["required"] is True
+
+    def test_nested_concurrent_map_runs_sequentially(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return item
+
+        def run_target(target):
+            return concurrent_map(fetch, range(4), 4)
+        assert concurrent_map(run_target, range(3), 3) == [[0, 1, 2, 3]] * 3
+        assert state["peak"] <= 3
+        assert concurrent_map(run_target, [0], 3) == [[0, 1, 2, 3]]
+        assert state["peak"] >= 2
+
+    def test_fan_out(self, mocker):
+        module = mocker.MagicMock()
+        module.params = {"idrac_user": "root", "timeout": 30, "max_workers": 2, "targets": [
+            {"idrac_ip": "host1", "idrac_user": None, "timeout": None},
+            {"idrac_ip": "host2", "idrac_user": "admin", "timeout": 5},
+            {"idrac_ip": "host3", "idrac_user": None, "timeout": None},
+            {"idrac_ip": "host4", "idrac_user": None, "timeout": None}]}
+
+        def run_module(target_module):
+            host = target_module.params["idrac_ip"]
+            if host == "host3":
+                target_module.fail_json(msg="failed", error_info={})
+            if host == "host4":
+                raise ValueError("invalid")
+            target_module.exit_json(msg="ok", params=target_module.params)
+        results = fan_out(run_module, module, "idrac_ip")
+        assert results["host1"]["params"] == {"idrac_ip": "host1", "idrac_user": "root", "timeout": 30}
+        assert results["host2"]["params"] == {"idrac_ip": "host2", "idrac_user": "admin", "timeout": 5}
+        assert results["host3"] == {"msg": "failed", "failed": True, "error_info": {}}
+        assert results["host4"] == {"msg": "invalid", "failed": True}
+        assert module.exit_json.call_count == 0
+        exit_fan_out(run_module, module, "idrac_ip")
+        assert module.exit_json.call_args[1]["msg"] == "Successfully fetched the details of 2 out of 4 target(s)."
+
+    def test_fan_out_concurrency_and_deadline(self, mocker):
+        mocker.patch.dict("os.environ", {MAX_WORKERS_ENV: "1"})
+        module = mocker.MagicMock()
+        module.params = {"max_workers": None, "target_timeout": None,
+                         "targets": [{"idrac_ip": "host{0}".format(index)} for index in range(8)]}
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def run_module(target_module):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.3 if target_module.params["idrac_ip"] == "host0" else 0.05)
+            with lock:
+                state["active"] -= 1
+            target_module.exit_json(msg="ok")
+        results = fan_out(run_module, module, "idrac_ip")
+        assert state["peak"] > 1
+        assert results["host0"] == {"msg": "ok"}
+        module.params["target_timeout"] = 0.1
+        results = fan_out(run_module, module, "idrac_ip")
+        assert results["host0"] == {"msg": "Unable to fetch the details of the target within 0.1 second(s).",
+                                    "failed": True}
+        assert results["host1"] == {"msg": "ok"}
+
+    def test_check_fanout_options(self, mocker):
+        module = mocker.MagicMock()
+        module.fail_json.side_effect = Exception("fail_json")
+        module.params = {"idrac_user": None, "idrac_password": None, "targets": [
+            {"idrac_ip": "host1", "idrac_user": "root", "idrac_password": "password"}]}
+        check_fanout_options(module, [("idrac_user",)], [("idrac_user", "idrac_password")])
+        module.params["targets"].append({"idrac_ip": "host2", "idrac_user": "admin", "idrac_password": None})
+        with pytest.raises(Exception, match="fail_json"):
+            check_fanout_options(module, [("idrac_user",)], [("idrac_user", "idrac_password")])
+        assert "found in targets" in module.fail_json.call_args[1]["msg"]
+        module.params = {"idrac_user": None, "targets": None}
+        with pytest.raises(Exception, match="fail_json"):
+            check_fanout_options(module, [("idrac_user",)])
+        assert module.fail_json.call_args[1]["msg"] == "one of the following is required: idrac_user"
+
+
+class TestPagination(object):
+
+    def test_get_api_path(self):
+        assert get_api_path("/api/AlertService/AlertCategories?$filter=Name eq 'api'") == \
+            "AlertService/AlertCategories?$filter=Name eq 'api'"
+        assert get_api_path("/api/GroupService/Groups(1)/SubGroups") == "GroupService/Groups(1)/SubGroups"
+        assert get_api_path("DeviceService/Devices") == "DeviceService/Devices"
+
+    def test_next_link_path(self, mocker):
+        pages = {"DeviceService/Devices": {"value": [1], "@odata.nextLink": "/api/DeviceService/Devices?$skip=1&app=ip"},
+                 "DeviceService/Devices?$skip=1&app=ip": {"value": [2]}}
+        ome = mocker.MagicMock()
+        ome.invoke_request.side_effect = lambda method, uri, query_param=None: mocker.MagicMock(json_data=dict(pages[uri], value=list(pages[uri]["value"])))
+        assert get_all_data_with_pagination(ome, "DeviceService/Devices")["report_list"] == [1, 2]
+        assert list(iter_data_with_pagination(ome, "DeviceService/Devices")) == [1, 2]
+
+
+class TestIPIntervalIndex(object):
+
+    def test_ip_interval_index(self):
+        index = IPIntervalIndex([ipaddress.ip_network("192.168.2.0/25"), ipaddress.ip_address("192.168.2.128"),
+                                 ipaddress.ip_network("192.168.2.100/30"), ipaddress.ip_address("10.0.0.1"),
+                                 ipaddress.ip_network("::ffff:192.168.3.0/120")])
+        assert len(index) == 3
+        assert ipaddress.ip_address("192.168.2.0") in index
+        assert ipaddress.ip_address("192.168.2.128") in index
+        assert ipaddress.ip_address("192.168.2.129") not in index
+        assert ipaddress.ip_address("10.0.0.1") in index
+        assert ipaddress.ip_address("10.0.0.0") not in index
+        assert ipaddress.ip_address("192.168.3.10") not in index
+        assert ipaddress.ip_address("::ffff:192.168.3.10") in index
+        assert ipaddress.ip_address("::ffff:192.168.2.10") not in index
+
+    def test_ip_interval_index_netaddr(self):
+        netaddr = pytest.importorskip("netaddr")
+        index = IPIntervalIndex([netaddr.IPRange("192.168.4.1", "192.168.4.9"), netaddr.IPAddress("fe80::1"),
+                                 netaddr.IPNetwork("192.168.4.0/29")])
+        assert len(index) == 2
+        assert netaddr.IPAddress("192.168.4.0") in index
+        assert netaddr.IPAddress("192.168.4.9") in index
+        assert netaddr.IPAddress("192.168.4.10") not in index
+        assert netaddr.IPAddress("fe80::1") in index
+        assert netaddr.IPAddress("fe80::1") not in IPIntervalIndex([])
+
+
+class TestFileCache(object):
+
+    def test_file_sha256(self, tmp_path):
+        data_file = tmp_path / "firmware.bin"
+        data_file.write_bytes(b"abc")
+        assert file_sha256(str(data_file), chunk_size=2) == \
+            "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+
+    def test_cache_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        cache_file = get_cache_file("tokens", "192.168.0.1", 443)
+        assert cache_file.startswith(str(tmp_path / "tokens"))
+        assert cache_file == get_cache_file("tokens", "192.168.0.1", "443")
+        assert cache_file != get_cache_file("tokens", "192.168.0.2", 443)
+        assert read_cache_file(cache_file) is None
+        assert write_cache_file(cache_file, {"token": "1234"}) is True
+        assert read_cache_file(cache_file) == {"token": "1234"}
+        assert write_cache_file(cache_file, {"token": object()}) is False
+        assert read_cache_file(cache_file) == {"token": "1234"}
+        assert [path.name for path in (tmp_path / "tokens").iterdir()] == [cache_file.split("/")[-1]]
+        remove_cache_file(cache_file)
+        remove_cache_file(cache_file)
+        assert read_cache_file(cache_file) is None
+
+
+class TestRegistryCache(object):
+
+    def test_get_registry_index(self):
+        attributes = [
+            {"AttributeName": "BootMode", "Type": "Enumeration", "ReadOnly": False,
+             "Value": [{"ValueName": "Bios", "ValueDisplayName": "BIOS"}, {"ValueName": "Uefi"}]},
+            {"AttributeName": "NumLock", "Type": "Integer", "Readonly": True, "LowerBound": 0, "UpperBound": 5},
+            {"AttributeName": "AssetTag", "Type": "String"}]
+        assert get_registry_index(attributes) == {
+            "BootMode": {"Type": "Enumeration", "ReadOnly": False, "Values": ["Bios", "Uefi"]},
+            "NumLock": {"Type": "Integer", "ReadOnly": False, "LowerBound": 0, "UpperBound": 5},
+            "AssetTag": {"Type": "String", "ReadOnly": False}}
+        index = get_registry_index(attributes, value_key="ValueDisplayName", readonly_key="Readonly")
+        assert index["BootMode"]["Values"] == ["BIOS", None]
+        assert index["NumLock"]["ReadOnly"] is True
+
+    def test_get_cached_registry(self, mocker, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        idrac = mocker.MagicMock()
+        idrac.invoke_request.return_value.json_data = {"Model": "PowerEdge R740", "BiosVersion": "2.1.0"}
+        fetch_registry = mocker.MagicMock(return_value={"BootMode": {"Type": "String", "ReadOnly": False}})
+        args = (idrac, "/redfish/v1/Systems/System.Embedded.1", "BiosVersion", fetch_registry, "BiosRegistry")
+        assert get_cached_registry(*args) == fetch_registry.return_value
+        assert get_cached_registry(*args) == fetch_registry.return_value
+        assert fetch_registry.call_count == 1
+        idrac.invoke_request.return_value.json_data = {"Model": "PowerEdge R740", "BiosVersion": "2.2.0"}
+        get_cached_registry(*args)
+        assert fetch_registry.call_count == 2
+        idrac.invoke_request.return_value.json_data = {}
+        get_cached_registry(*args)
+        assert fetch_registry.call_count == 3
+        assert len(list((tmp_path / "attribute_registries").iterdir())) == 2
+
+    def test_get_cached_registry_empty(self, mocker, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        idrac = mocker.MagicMock()
+        idrac.invoke_request.return_value.json_data = {"Model": "PowerEdge R740", "FirmwareVersion": "7.00.00"}
+        fetch_registry = mocker.MagicMock(return_value={})
+        args = (idrac, "/redfish/v1/Managers/iDRAC.Embedded.1", "FirmwareVersion", fetch_registry)
+        assert get_cached_registry(*args) == {}
+        assert get_cached_registry(*args) == {}
+        assert fetch_registry.call_count == 2
+
+
+SCP_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<SystemConfiguration Model="PowerEdge R740">
+<Component FQDD="iDRAC.Embedded.1">
+<Attribute Name="Users.2#UserName">root</Attribute>
+<!-- <Attribute Name="Users.2#Password">******</Attribute> -->
+<Attribute Name="Users.3#UserName"/>
+</Component>
+<Component FQDD="RAID.Slot.1-1">
+<Attribute Name="RAIDresetConfig">False</Attribute>
+<Component FQDD="Disk.Virtual.0:RAID.Slot.1-1">
+<Attribute Name="Name">vd0 &amp; data</Attribute>
+</Component>
+</Component>
+</SystemConfiguration>"""
+SCP_JSON = {"SystemConfiguration": {"Components": [
+    {"FQDD": "iDRAC.Embedded.1", "Attributes": [{"Name": "Users.2#UserName", "Value": "root"},
+                                                {"Name": "Users.3#UserName", "Value": None}]},
+    {"FQDD": "RAID.Slot.1-1", "Attributes": [{"Name": "RAIDresetConfig", "Value": "False"}],
+     "Components": [{"FQDD": "Disk.Virtual.0:RAID.Slot.1-1", "Attributes": [{"Name": "Name", "Value": "vd0 & data"}]}]}]}}
+SCP_ATTRIBUTES = [("iDRAC.Embedded.1", "Users.2#UserName", "root"), ("iDRAC.Embedded.1", "Users.3#UserName", ""),
+                  ("RAID.Slot.1-1", "RAIDresetConfig", "False"),
+                  ("Disk.Virtual.0:RAID.Slot.1-1", "Name", "vd0 & data")]
+
+
+class TestIterScpAttributes(object):
+
+    @pytest.mark.parametrize("scp", [
+        lambda: SCP_XML, lambda: BytesIO(SCP_XML.encode("utf-8")), lambda: SCP_JSON,
+        lambda: json.dumps(SCP_JSON), lambda: BytesIO(("\n" + json.dumps(SCP_JSON)).encode("utf-8")),
+    ])
+    def test_iter_scp_attributes(self, scp):
+        assert list(iter_scp_attributes(scp())) == SCP_ATTRIBUTES
+        parents = {}
+        assert list(iter_scp_attributes(scp(), fqdds=["RAID.Slot.1-1"], parents=parents)) == SCP_ATTRIBUTES[2:]
+        assert parents == {"RAID.Slot.1-1": None, "Disk.Virtual.0:RAID.Slot.1-1": "RAID.Slot.1-1"}
+
+    def test_iter_scp_attributes_invalid(self):
+        with pytest.raises(ET.ParseError):
+            list(iter_scp_attributes("<SystemConfiguration><Component FQDD='iDRAC.Embedded.1'>"))
+        with pytest.raises(ET.ParseError):
+            list(iter_scp_attributes(json.dumps(SCP_JSON), scp_format="XML"))
@@ -369,8 +369,8 @@ class TestIdracAttributes(FakeAnsibleModule):
     def test_validate_vs_registry(self, idrac_redfish_mock_for_attr, redfish_response_mock, idrac_default_args):
         idrac_default_args.update({"resource_id": "System.Embedded.1", "idrac_attributes": {"Attr": "Value"}})
         attr_dict = {"attr": "value", "attr1": "value1", "attr2": 3}
-        registry = {"attr": {"Readonly": True},
-                    "attr1": {"Type": "Enumeration", "Value": [{"ValueDisplayName": "Attr"}]},
+        registry = {"attr": {"ReadOnly": True},
+                    "attr1": {"Type": "Enumeration", "Values": ["Attr"]},
                     "attr2": {"Type": "Integer", "LowerBound": 1, "UpperBound": 2}}
         result = self.module.validate_vs_registry(registry, attr_dict)
         assert result["attr"] == "Read only Attribute cannot be modified."
@@ -592,3 +592,17 @@ class TestConfigBios(FakeAnsibleModule):
         with pytest.raises(Exception) as ex:
             self.module.validate_negative_job_time_out(f_module)
         assert ex.value.args[0] == "The parameter job_wait_timeout value cannot be negative or zero."
+
+    def test_get_attributes_registry(self, idrac_redfish_mock_for_bios, ome_response_mock, mocker):
+        ome_response_mock.json_data = {"RegistryEntries": {"Attributes": [
+            {"AttributeName": "BootMode", "Type": "Enumeration", "ReadOnly": False,
+             "Value": [{"ValueName": "Bios"}, {"ValueName": "Uefi"}]},
+            {"AttributeName": "SysMemSize", "Type": "String", "ReadOnly": True}]}}
+        registry = self.module.get_attributes_registry(idrac_redfish_mock_for_bios)
+        assert registry == {"BootMode": {"Type": "Enumeration", "ReadOnly": False, "Values": ["Bios", "Uefi"]},
+                            "SysMemSize": {"Type": "String", "ReadOnly": True}}
+        assert self.module.validate_vs_registry(registry, {"BootMode": "Legacy", "SysMemSize": "8 GB"}) == {
+            "BootMode": "Invalid value for enumeration.", "SysMemSize": "Read only attribute cannot be modified."}
+        cache_mock = mocker.patch(MODULE_PATH + 'get_cached_registry', return_value=registry)
+        assert self.module.get_attributes_registry(idrac_redfish_mock_for_bios, registry_cache=True) == registry
+        assert cache_mock.call_args[0][1:3] == (self.module.SYSTEM_BIOS_VERSION_URI, "BiosVersion")
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from io import StringIO
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible.module_utils._text import to_text
+from ansible_collections.dellemc.openmanage.plugins.modules import idrac_gather_facts
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule
+from mock import MagicMock
+
+MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.idrac_gather_facts.'
+SYSTEM = "/redfish/v1/Systems/System.Embedded.1"
+MANAGER = "/redfish/v1/Managers/iDRAC.Embedded.1"
+CHASSIS = "/redfish/v1/Chassis/System.Embedded.1"
+EXPAND = "?$expand=*($levels=1)"
+ODATA = {"@odata.context": "/redfish/v1/$metadata", "@odata.type": "#Type"}
+
+RESOURCES = {
+    "/redfish/v1/Systems": {"Members": [{"@odata.id": SYSTEM}]},
+    "/redfish/v1/Managers": {"Members": [{"@odata.id": MANAGER}]},
+    "/redfish/v1/Chassis": {"Members": [{"@odata.id": CHASSIS}, {"@odata.id": "/redfish/v1/Chassis/Enclosure.1"}]},
+    SYSTEM: dict(ODATA, Oem={"Dell": {"DellSystem": dict(ODATA, **{"@odata.id": "/x", "ChassisServiceTag": "ABC1234"})}}),
+    "/redfish/v1/Managers/System.Embedded.1/Attributes?$select=ServerOS.*": {
+        "Attributes": {"ServerOS.1.HostName": "host"}},
+    SYSTEM + "/Storage/" + EXPAND: {"Members": [{"Id": "RAID.SL.3-1", "Controllers": {
+        "@odata.id": SYSTEM + "/Storage/RAID.SL.3-1/Controllers"}}, {"Id": "CPU.1"}]},
+    SYSTEM + "/Storage/RAID.SL.3-1/Controllers" + EXPAND: {"Members": [
+        {"Id": "RAID.SL.3-1", "@odata.id": "/c", "Ports@odata.count": 2}]},
+    SYSTEM + "/Storage": {"Members": [{"@odata.id": SYSTEM + "/Storage/RAID.SL.3-1"},
+                                      {"@odata.id": SYSTEM + "/Storage/AHCI.1"}]},
+    SYSTEM + "/Storage/RAID.SL.3-1" + EXPAND: {"Drives": [
+        {"Id": "Disk.Bay.0", "@odata.id": "/d", "Links": {}, "Assembly": {}, "MediaType": "SSD"}]},
+    SYSTEM + "/Storage/AHCI.1" + EXPAND: {"Drives": [{"Id": "Disk.Bay.1", "MediaType": "HDD"}]},
+    SYSTEM + "/Storage/RAID.SL.3-1/Volumes" + EXPAND: {"Members": [
+        {"Id": "Disk.Virtual.0", "DellVirtualDisk": {}, "Links": {}}]},
+    SYSTEM + "/Memory" + EXPAND: {"Members": [{"Id": "DIMM.A1", "CPUAffinity@odata.count": 1, "Metrics": {
+        "@odata.id": SYSTEM + "/Memory/DIMM.A1/Metrics"}}]},
+    SYSTEM + "/Memory/DIMM.A1/Metrics": dict(ODATA, Id="Metrics", DataSourceUri="/m", BandwidthPercent=0),
+    CHASSIS + "/PowerSubsystem/PowerSupplies" + EXPAND: {"Members": [{"Id": "PSU.Slot.1", "Metrics": {
+        "@odata.id": CHASSIS + "/PowerSubsystem/PowerSupplies/PSU.Slot.1/Metrics"}}]},
+    CHASSIS + "/PowerSubsystem/PowerSupplies/PSU.Slot.1/Metrics": {"Id": "PowerSupplyMetrics"},
+    CHASSIS + "/ThermalSubsystem/ThermalMetrics": {"Id": "ThermalMetrics", "TemperatureReadingsCelsius@odata.count": 0},
+    CHASSIS + "/Power": {"Voltages": [{"Name": "CPU1 VCORE PG", "@odata.id": "/v"}]},
+    SYSTEM + "/SecureBoot/" + EXPAND: {"SecureBootEnable": False, "@odata.id": "/s"},
+    SYSTEM + "/SecureBoot/SecureBootDatabases" + EXPAND: {"Members": [
+        {"Id": "db", "Certificates": {"@odata.id": SYSTEM + "/SecureBoot/SecureBootDatabases/db/Certificates"}}]},
+    SYSTEM + "/SecureBoot/SecureBootDatabases/db/Certificates" + EXPAND: {"Members": [
+        {"Id": "cert1", "@odata.id": "/cert1"}]},
+}
+
+
+class TestIdracGatherFacts(FakeAnsibleModule):
+    module = idrac_gather_facts
+
+    @pytest.fixture
+    def idrac_facts_mock(self):
+        idrac_obj = MagicMock()
+        requested = []
+
+        def invoke_request(uri, method):
+            requested.append(uri)
+            if uri not in RESOURCES:
+                raise HTTPError("https://testhost.com" + uri, 404, "Not Found", {}, StringIO("{}"))
+            resp = MagicMock()
+            resp.json_data = json.loads(json.dumps(RESOURCES[uri]))
+            return resp
+        idrac_obj.invoke_request.side_effect = invoke_request
+        idrac_obj.requested = requested
+        return idrac_obj
+
+    @pytest.fixture
+    def idrac_connection_facts_mock(self, mocker, idrac_facts_mock):
+        idrac_conn_mock = mocker.patch(MODULE_PATH + 'iDRACRedfishAPI', return_value=idrac_facts_mock)
+        idrac_conn_mock.return_value.__enter__.return_value = idrac_facts_mock
+        return idrac_conn_mock
+
+    def test_strip_keys(self):
+        data = {"@odata.id": "/a", "Links": {}, "Items": [{"Id": 1, "Links": {}, "Ports@odata.count": 1}]}
+        assert self.module.strip_keys(data, ["@odata.id", "Links"]) == {"Items": [{"Id": 1, "Ports@odata.count": 1}]}
+        assert self.module.strip_keys(data, regex=r".*@odata") == {"Links": {}, "Items": [{"Id": 1, "Links": {}}]}
+        assert "@odata.id" in data
+
+    def test_gather_all_facts(self, idrac_default_args, idrac_connection_facts_mock, idrac_facts_mock):
+        idrac_default_args.update({"target": ["System", "Controller", "PhysicalDisk", "VirtualDisk", "Memory",
+                                              "SystemMetrics", "Sensors_Voltage", "SecureBoot", "BIOS"]})
+        result = self._run_module(idrac_default_args)
+        assert result["msg"] == "Successfully gathered the facts."
+        assert result["system"] == {"ChassisServiceTag": "ABC1234", "ServerOS.1.HostName": "host"}
+        assert result["controller"] == [{"Id": "RAID.SL.3-1"}]
+        assert result["physical_disk"] == [{"Id": "Disk.Bay.0", "MediaType": "SSD"},
+                                           {"Id": "Disk.Bay.1", "MediaType": "HDD"}]
+        assert result["virtual_disk"] == [{"Id": "Disk.Virtual.0"}]
+        assert result["memory"][0]["Id"] == "DIMM.A1"
+        assert "CPUAffinity@odata.count" not in result["memory"][0]
+        assert result["memory_metrics"] == [{"Id": "Metrics", "BandwidthPercent": 0}]
+        assert result["power_metrics"] == [{"Id": "PowerSupplyMetrics"}]
+        assert result["thermal_metrics"] == {"Id": "ThermalMetrics"}
+        assert result["voltages"] == [{"Name": "CPU1 VCORE PG"}]
+        assert result["secure_boot"] == {"SecureBootEnable": False, "SecureBootDatabases": [
+            {"Id": "db", "Certificates": [{"Id": "cert1"}]}]}
+        assert result["bios"] == {}
+        assert result["cpu"] == []
+        assert idrac_facts_mock.requested.count(SYSTEM + "/Memory" + EXPAND) == 1
+        assert idrac_facts_mock.requested.count(SYSTEM + "/Storage") == 1
+
+    def test_invalid_system_id(self, idrac_default_args, idrac_connection_facts_mock, idrac_facts_mock):
+        idrac_default_args.update({"computer_system_id": "System.Embedded.2"})
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"] == "Invalid computer system id : System.Embedded.2, valid values are System.Embedded.1"
+        idrac_default_args.update({"computer_system_id": None, "manager_id": "iDRAC.Embedded.2"})
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"] == "Invalid computer manager id : iDRAC.Embedded.2, valid values are iDRAC.Embedded.1"
+
+    def test_resource_error_fails(self, idrac_default_args, idrac_connection_facts_mock, idrac_facts_mock):
+        def invoke_request(uri, method):
+            raise HTTPError("https://testhost.com" + uri, 500, "Internal Server Error", {}, StringIO("{}"))
+        idrac_facts_mock.invoke_request.side_effect = invoke_request
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert "500" in result["msg"]
+
+    @pytest.mark.parametrize("exc_type", [HTTPError, URLError, ValueError])
+    def test_idrac_gather_facts_exception(self, exc_type, idrac_default_args, idrac_connection_facts_mock, mocker):
+        json_str = to_text(json.dumps({"data": "out"}))
+        if exc_type == HTTPError:
+            mocker.patch(MODULE_PATH + "gather_facts",
+                         side_effect=exc_type("https://testhost.com", 401, "Unauthorized", {}, StringIO(json_str)))
+            result = self._run_module_with_fail_json(idrac_default_args)
+            assert result["error_info"] == {"data": "out"}
+        elif exc_type == URLError:
+            mocker.patch(MODULE_PATH + "gather_facts", side_effect=exc_type("url open error"))
+            result = self._run_module(idrac_default_args)
+            assert result["unreachable"] is True
+        else:
+            mocker.patch(MODULE_PATH + "gather_facts", side_effect=exc_type("exception message"))
+            result = self._run_module_with_fail_json(idrac_default_args)
+            assert result["msg"] == "exception message"
@@ -241,6 +241,79 @@ class TestServerConfigProfile(FakeAnsibleModule):
             self._run_module(idrac_default_args)
         assert params['message'] in ex.value.args[0]['msg']
 
+    def test_get_scp_changes_buffer(self, idrac_default_args):
+        import_buffer = "<SystemConfiguration><Component FQDD='RAID.Slot.1-1'><Attribute Name='RAIDMode'>None</Attribute>" \
+                        "<Component FQDD='Disk.Virtual.0:RAID.Slot.1-1'><Attribute Name='Name'>vd0</Attribute>" \
+                        "<Attribute Name='Size'>100</Attribute></Component></Component>" \
+                        "<Component FQDD='BIOS.Setup.1-1'><Attribute Name='BootMode'>Uefi</Attribute>" \
+                        "<!-- <Attribute Name='SysProfile'>Custom</Attribute> --></Component></SystemConfiguration>"
+        current = {"SystemConfiguration": {"Components": [
+            {"FQDD": "RAID.Slot.1-1", "Attributes": [{"Name": "RAIDMode", "Value": "None"}],
+             "Components": [{"FQDD": "Disk.Virtual.0:RAID.Slot.1-1",
+                             "Attributes": [{"Name": "Name", "Value": "vd1"}, {"Name": "Size", "Value": 100}]}]},
+            {"FQDD": "BIOS.Setup.1-1", "Attributes": [{"Name": "BootMode", "Value": "Uefi"}]}]}}
+        f_module = self.get_module_mock(params=idrac_default_args)
+        current_attributes, _parents = self.module.get_scp_attributes(f_module, current)
+        assert current_attributes["Disk.Virtual.0:RAID.Slot.1-1"] == {"Name": "vd1", "Size": "100"}
+        changes, parents = self.module.get_scp_changes(f_module, import_buffer, current_attributes)
+        assert parents == {"RAID.Slot.1-1": None, "BIOS.Setup.1-1": None,
+                           "Disk.Virtual.0:RAID.Slot.1-1": "RAID.Slot.1-1"}
+        assert changes == {"Disk.Virtual.0:RAID.Slot.1-1": {"Name": "vd0"}}
+        assert self.module.get_scp_changes_buffer(changes, parents) == \
+            '<SystemConfiguration><Component FQDD="RAID.Slot.1-1"><Component FQDD="Disk.Virtual.0:RAID.Slot.1-1">' \
+            '<Attribute Name="Name">vd0</Attribute></Component></Component></SystemConfiguration>'
+        with pytest.raises(Exception) as ex:
+            self.module.get_scp_attributes(f_module, "<SystemConfiguration>")
+        assert ex.value.args[0] == "An invalid SCP content is provided. Provide the SCP in a valid XML or JSON format."
+
+    @pytest.mark.parametrize("params", [
+        {"current": "public1", "check_mode": False, "changed": False, "message": NO_CHANGES_FOUND},
+        {"current": "public", "check_mode": True, "changed": True, "message": CHANGES_FOUND},
+        {"current": "public", "check_mode": False, "changed": True, "message": SUCCESS_MSG.format("import")},
+    ])
+    def test_run_import_scp_incremental(self, params, idrac_scp_redfish_mock, idrac_default_args, mocker):
+        idrac_default_args.update({
+            "command": "import", "incremental": True, "job_wait": True, "scp_components": ["IDRAC"],
+            "import_buffer": json.dumps({"SystemConfiguration": {"Components": [{"FQDD": "iDRAC.Embedded.1", "Attributes": [
+                {"Name": "SNMP.1#AgentCommunity", "Value": "public1"}, {"Name": "IPMILan.1#Enable", "Value": "Disabled"}]}]}})})
+        mocker.patch(MODULE_PATH_COMP + "validate_scp_components")
+        mocker.patch(MODULE_PATH + REDFISH_JOB_TRACKING,
+                     return_value=(False, False, {"Message": "Successfully imported", "MessageId": "SYS053"}, {}))
+        idrac_scp_redfish_mock.export_scp.return_value.json_data = {"SystemConfiguration": {"Components": [
+            {"FQDD": "iDRAC.Embedded.1", "Attributes": [{"Name": "SNMP.1#AgentCommunity", "Value": params["current"]},
+                                                        {"Name": "IPMILan.1#Enable", "Value": "Disabled"}]}]}}
+        idrac_scp_redfish_mock.import_scp_share.return_value.headers = {"Location": "/redfish/v1/JID_123456789"}
+        result = self._run_module(idrac_default_args, check_mode=params["check_mode"])
+        assert params["message"] in result["msg"]
+        assert result["changed"] is params["changed"]
+        idrac_scp_redfish_mock.export_scp.assert_called_once_with(
+            export_format="JSON", export_use="Default", target="IDRAC", job_wait=True)
+        idrac_scp_redfish_mock.import_preview.assert_not_called()
+        if params["message"] == SUCCESS_MSG.format("import"):
+            import_buffer = idrac_scp_redfish_mock.import_scp_share.call_args[1]["import_buffer"]
+            assert import_buffer == '<SystemConfiguration><Component FQDD="iDRAC.Embedded.1">' \
+                                    '<Attribute Name="SNMP.1#AgentCommunity">public1</Attribute></Component></SystemConfiguration>'
+        else:
+            idrac_scp_redfish_mock.import_scp_share.assert_not_called()
+
+    def test_import_scp_incremental_local_file(self, idrac_scp_redfish_mock, idrac_default_args, mocker, tmp_path):
+        (tmp_path / FILE_NAME).write_text("<SystemConfiguration><Component FQDD='BIOS.Setup.1-1'>"
+                                          "<Attribute Name='BootMode'>Uefi</Attribute></Component></SystemConfiguration>")
+        idrac_default_args.update({"command": "import", "incremental": True, "job_wait": False,
+                                   "share_name": str(tmp_path), "scp_file": FILE_NAME, "scp_components": ["BIOS"]})
+        mocker.patch(MODULE_PATH_COMP + "validate_scp_components")
+        idrac_scp_redfish_mock.export_scp.return_value.json_data = {"SystemConfiguration": {"Components": [
+            {"FQDD": "BIOS.Setup.1-1", "Attributes": [{"Name": "BootMode", "Value": "Uefi"}]}]}}
+        result = self._run_module(idrac_default_args)
+        assert result["msg"] == NO_CHANGES_FOUND
+        idrac_scp_redfish_mock.import_scp_share.assert_not_called()
+
+    def test_import_scp_incremental_http_share(self, idrac_scp_redfish_mock, idrac_default_args):
+        idrac_default_args.update({"command": "import", "incremental": True, "job_wait": True,
+                                   "share_name": "https://{SCP SHARE IP}/myshare/", "scp_file": FILE_NAME})
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"] == "incremental is supported only when share_name is a local path or import_buffer is provided."
+
     @pytest.mark.parametrize("params", [
         {"mparams": {"share_name": LOCAL_SHARE_NAME, "job_wait": False,
                      "scp_file": FILE_NAME}}
@@ -452,16 +452,6 @@ class TestStorageData(FakeAnsibleModule):
             idr_obj.fetch_controllers_uri()
         assert exc.value.args[0] == "Error"
 
-    def test_fetch_api_data(self, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
-        key = "Storage"
-        obj = MagicMock()
-        mocker.patch(MODULE_PATH + API_INVOKE_MOCKER, return_value=obj)
-        f_module = self.get_module_mock(params=idrac_default_args, check_mode=True)
-        idr_obj = self.module.StorageData(idrac_connection_storage_volume_mock, f_module)
-        key_out, uri_data_out = idr_obj.fetch_api_data(self.storage_controllers[ODATA_ID], -1)
-        assert key == key_out
-        assert obj == uri_data_out
-
     def test_all_storage_data(self, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
         def mock_get_dynamic_uri_request(*args, **kwargs):
             if len(args) == 3 and args[2] == "Members":
@@ -478,6 +468,55 @@ class TestStorageData(FakeAnsibleModule):
         assert set(storage_info.keys()) == {'Controllers'}
         assert set(storage_info["Controllers"].keys()) == {CONTROLLER_ID_FIRST, CONTROLLER_ID_FOURTH}
 
+    def test_all_storage_data_snapshot(self, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
+        storage_uri = self.storage_controllers[ODATA_ID]
+        ctrl_uri = storage_uri + "/" + CONTROLLER_ID_FOURTH
+        drive_uri = ctrl_uri + "/Drives/" + PHYSICAL_DISK_FIRST
+        second_drive_uri = ctrl_uri + "/Drives/Disk.Bay.1:Enclosure.Internal.0-1:RAID.SL.5-1"
+        enclosure_uri = "/redfish/v1/Chassis/" + ENCLOSURE_ID
+        volume_uri = ctrl_uri + "/Volumes/" + VIRTUAL_DISK_FIRST
+        responses = {
+            storage_uri + "?$expand=*($levels=2)": {"Members": [
+                {"Id": "CPU.1", "Drives": [], "Links": {"Enclosures": []}, "Volumes": {"Members": []}},
+                {"Id": CONTROLLER_ID_FOURTH, ODATA_ID: ctrl_uri,
+                 "Drives": [{ODATA_ID: drive_uri, "Id": PHYSICAL_DISK_FIRST}, {ODATA_ID: second_drive_uri}],
+                 "Links": {"Enclosures": [{ODATA_ID: enclosure_uri, "Id": ENCLOSURE_ID,
+                                           "Links": {"Drives": [{ODATA_ID: drive_uri}]}}]},
+                 "Volumes": {ODATA_ID: ctrl_uri + "/Volumes", "Members": [{ODATA_ID: volume_uri}]}}]},
+            second_drive_uri: {ODATA_ID: second_drive_uri, "Id": "Disk.Bay.1:Enclosure.Internal.0-1:RAID.SL.5-1"},
+            volume_uri: {ODATA_ID: volume_uri, "Id": VIRTUAL_DISK_FIRST, "Links": {"Drives": [{ODATA_ID: drive_uri}]}}
+        }
+        requested = []
+
+        def invoke_request(uri, method, data=None):
+            requested.append(uri)
+            if uri not in responses:
+                raise HTTPError(uri, 400, "Bad Request", {}, None)
+            return MagicMock(json_data=deepcopy(responses[uri]))
+        idrac_connection_storage_volume_mock.invoke_request = invoke_request
+        mocker.patch(MODULE_PATH + "StorageData.fetch_controllers_uri", return_value=self.storage_controllers)
+        f_module = self.get_module_mock(params=idrac_default_args, check_mode=True)
+        idr_obj = self.module.StorageData(idrac_connection_storage_volume_mock, f_module)
+        storage_info = idr_obj.all_storage_data()
+        controller = storage_info["Controllers"][CONTROLLER_ID_FOURTH]
+        assert set(storage_info["Controllers"].keys()) == {CONTROLLER_ID_FOURTH}
+        assert controller["Drives"][PHYSICAL_DISK_FIRST]["Id"] == PHYSICAL_DISK_FIRST
+        assert controller["Drives"]["Disk.Bay.1:Enclosure.Internal.0-1:RAID.SL.5-1"] == responses[second_drive_uri]
+        assert controller["Volumes"][VIRTUAL_DISK_FIRST] == responses[volume_uri]
+        assert controller["Links"]["Enclosures"][ENCLOSURE_ID]["Id"] == ENCLOSURE_ID
+        assert sorted(requested) == sorted([storage_uri + "?$expand=*($levels=2)", second_drive_uri, volume_uri])
+
+        # Scenario - firmware without nested expand support
+        responses[storage_uri + "?$expand=*($levels=1)"] = responses.pop(storage_uri + "?$expand=*($levels=2)")
+        responses[storage_uri + "?$expand=*($levels=1)"]["Members"][1]["Volumes"] = {ODATA_ID: ctrl_uri + "/Volumes"}
+        responses[ctrl_uri + "/Volumes?$expand=*($levels=1)"] = {"Members": [responses[volume_uri]]}
+        del requested[:]
+        idr_obj = self.module.StorageData(idrac_connection_storage_volume_mock, f_module)
+        storage_info = idr_obj.all_storage_data()
+        assert storage_info["Controllers"][CONTROLLER_ID_FOURTH]["Volumes"][VIRTUAL_DISK_FIRST] == responses[volume_uri]
+        assert requested.count(volume_uri) == 0
+        assert len(requested) == 4
+
     def test_fetch_storage_data(self, idrac_default_args, idrac_connection_storage_volume_mock, mocker):
         mocker.patch(MODULE_PATH + ALL_STORAGE_DATA_METHOD,
                      return_value=self.storage_data)
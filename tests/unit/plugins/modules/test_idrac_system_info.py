@@ -2,8 +2,8 @@
 
 #
 # Dell OpenManage Ansible Modules
-# Version 7.0.0
-# Copyright (C) 2021-2022 Dell Inc. or its subsidiaries. All Rights Reserved.
+# Version 9.9.0
+# Copyright (C) 2021-2025 Dell Inc. or its subsidiaries. All Rights Reserved.
 
 # GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
 #
@@ -23,10 +23,9 @@ from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from io import StringIO
 from ansible.module_utils._text import to_text
 
-importorskip("omsdk.sdkfile")
-importorskip("omsdk.sdkcreds")
-
 MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.'
+SYSTEM_URI = "/redfish/v1/Systems/System.Embedded.1"
+EXPAND = "?$expand=*($levels=1)"
 
 
 class TestSystemInventory(FakeAnsibleModule):
@@ -34,6 +33,8 @@ class TestSystemInventory(FakeAnsibleModule):
 
     @pytest.fixture
     def idrac_system_info_mock(self, mocker):
+        importorskip("omsdk.sdkfile")
+        importorskip("omsdk.sdkcreds")
         omsdk_mock = MagicMock()
         idrac_obj = MagicMock()
         omsdk_mock.get_entityjson = idrac_obj
@@ -76,3 +77,96 @@ class TestSystemInventory(FakeAnsibleModule):
         else:
             result = self._run_module(idrac_default_args)
         assert 'msg' in result
+
+    def test_idrac_system_info_components_wsman(self, idrac_system_info_connection_mock, idrac_default_args):
+        idrac_system_info_connection_mock.get_json_device.return_value = {"CPU": [{"FQDD": "CPU.Socket.1"}],
+                                                                          "Memory": [{"FQDD": "DIMM.Socket.A1"}]}
+        idrac_default_args.update({"components": ["CPU"]})
+        result = self._run_module(idrac_default_args)
+        assert result["system_info"] == {"CPU": [{"FQDD": "CPU.Socket.1"}]}
+
+
+class TestRedfishSystemInventory(FakeAnsibleModule):
+    module = idrac_system_info
+    resources = {
+        SYSTEM_URI: {"@odata.id": SYSTEM_URI, "Id": "System.Embedded.1", "BiosVersion": "2.4.8",
+                     "Memory": {"@odata.id": SYSTEM_URI + "/Memory"}, "Status": {"Health": "OK"},
+                     "Oem": {"Dell": {"DellSystem": {"@odata.id": "/dell", "BIOSReleaseDate": "11/26/2019",
+                                                     "ChassisServiceTag": "ABC1234"}}}},
+        SYSTEM_URI + "/Processors" + EXPAND: {"Members": [
+            {"@odata.id": SYSTEM_URI + "/Processors/CPU.Socket.1", "Id": "CPU.Socket.1", "ProcessorType": "CPU",
+             "TotalCores": 16, "Links": {}, "Oem": {"Dell": {"DellProcessor": {"CPUFamily": "Intel(R) Xeon(TM)"}}}},
+            {"@odata.id": SYSTEM_URI + "/Processors/Video.Slot.1", "Id": "Video.Slot.1", "ProcessorType": "GPU"}]},
+        SYSTEM_URI + "/Memory" + EXPAND: {"Members": [{"@odata.id": SYSTEM_URI + "/Memory/DIMM.Socket.A1"}]},
+        SYSTEM_URI + "/Memory/DIMM.Socket.A1": {
+            "Id": "DIMM.Socket.A1", "CapacityMiB": 16384, "CPUAffinity@odata.count": 1},
+        SYSTEM_URI + "/Bios": {"@odata.id": SYSTEM_URI + "/Bios", "Id": "Bios", "AttributeRegistry": "BiosAttributeRegistry.v1_0_3",
+                               "Attributes": {"SystemBiosVersion": "2.4.8"}, "Actions": {}},
+        SYSTEM_URI + "/Storage?$expand=*($levels=2)": {"Members": [
+            {"Id": "CPU.1", "Drives": []},
+            {"@odata.id": SYSTEM_URI + "/Storage/RAID.SL.3-1", "Id": "RAID.SL.3-1",
+             "Oem": {"Dell": {"DellController": {"ControllerFirmwareVersion": "52.16.1-4405"}}},
+             "Drives": [{"@odata.id": "/d0", "Id": "Disk.Bay.0", "MediaType": "SSD"}, {"@odata.id": "/d1"}],
+             "Volumes": {"@odata.id": SYSTEM_URI + "/Storage/RAID.SL.3-1/Volumes",
+                         "Members": [{"@odata.id": "/v0"}]}}]},
+        "/d1": {"@odata.id": "/d1", "Id": "Disk.Bay.1", "MediaType": "HDD",
+                "Oem": {"Dell": {"DellPhysicalDisk": {"RaidStatus": "Online"}}}},
+        SYSTEM_URI + "/Storage/RAID.SL.3-1/Volumes" + EXPAND: {"Members": [
+            {"@odata.id": "/v0", "Id": "Disk.Virtual.0:RAID.SL.3-1", "RAIDType": "RAID0"}]},
+    }
+
+    @pytest.fixture
+    def idrac_redfish_mock(self, mocker):
+        idrac_obj = MagicMock()
+        idrac_obj.requested = []
+
+        def invoke_request(uri, method):
+            idrac_obj.requested.append(uri)
+            if uri not in self.resources:
+                raise HTTPError("https://testhost.com" + uri, 404, "Not Found", {}, StringIO("{}"))
+            return MagicMock(json_data=self.resources[uri])
+        idrac_obj.invoke_request.side_effect = invoke_request
+        idrac_conn_mock = mocker.patch(MODULE_PATH + 'idrac_system_info.iDRACRedfishAPI', return_value=idrac_obj)
+        idrac_conn_mock.return_value.__enter__.return_value = idrac_obj
+        return idrac_obj
+
+    def test_flatten_resource(self):
+        entry = self.module.flatten_resource(self.resources[SYSTEM_URI])
+        assert entry == {"Id": "System.Embedded.1", "BiosVersion": "2.4.8", "Status": {"Health": "OK"},
+                         "BIOSReleaseDate": "11/26/2019", "ChassisServiceTag": "ABC1234",
+                         "FQDD": "System.Embedded.1", "Key": "System.Embedded.1", "InstanceID": "System.Embedded.1"}
+
+    def test_redfish_components(self, idrac_default_args, idrac_redfish_mock):
+        idrac_default_args.update({"backend": "redfish", "components": [
+            "System", "BIOS", "CPU", "Memory", "Controller", "PhysicalDisk", "VirtualDisk", "Fan"]})
+        result = self._run_module(idrac_default_args)
+        system_info = result["system_info"]
+        assert result["msg"] == "Successfully fetched the system inventory details."
+        assert system_info["System"][0]["ChassisServiceTag"] == "ABC1234"
+        assert system_info["BIOS"] == [{"Id": "Bios", "AttributeRegistry": "BiosAttributeRegistry.v1_0_3",
+                                        "Attributes": {"SystemBiosVersion": "2.4.8"}, "FQDD": "Bios",
+                                        "Key": "Bios", "InstanceID": "Bios"}]
+        assert system_info["CPU"] == [{"Id": "CPU.Socket.1", "ProcessorType": "CPU", "TotalCores": 16,
+                                       "CPUFamily": "Intel(R) Xeon(TM)", "FQDD": "CPU.Socket.1",
+                                       "Key": "CPU.Socket.1", "InstanceID": "CPU.Socket.1"}]
+        assert system_info["Memory"][0]["CapacityMiB"] == 16384
+        assert "CPUAffinity@odata.count" not in system_info["Memory"][0]
+        assert [ctrl["FQDD"] for ctrl in system_info["Controller"]] == ["RAID.SL.3-1"]
+        assert "Drives" not in system_info["Controller"][0]
+        assert system_info["Controller"][0]["ControllerFirmwareVersion"] == "52.16.1-4405"
+        assert [(disk["FQDD"], disk["MediaType"]) for disk in system_info["PhysicalDisk"]] == [
+            ("Disk.Bay.0", "SSD"), ("Disk.Bay.1", "HDD")]
+        assert system_info["PhysicalDisk"][1]["RaidStatus"] == "Online"
+        assert system_info["VirtualDisk"][0]["RAIDType"] == "RAID0"
+        assert "Fan" not in system_info
+        assert idrac_redfish_mock.requested.count(SYSTEM_URI) == 1
+        assert idrac_redfish_mock.requested.count(SYSTEM_URI + "/Storage?$expand=*($levels=2)") == 1
+        assert not any("Firmware" in uri for uri in idrac_redfish_mock.requested)
+
+    def test_redfish_http_error(self, idrac_default_args, idrac_redfish_mock):
+        json_str = to_text(json.dumps({"data": "out"}))
+        idrac_redfish_mock.invoke_request.side_effect = HTTPError("https://testhost.com", 401, "Unauthorized",
+                                                                  {}, StringIO(json_str))
+        idrac_default_args.update({"backend": "redfish", "components": ["CPU"]})
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["error_info"] == {"data": "out"}
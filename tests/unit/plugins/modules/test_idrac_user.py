@@ -405,3 +405,99 @@ class TestIDRACUser(FakeAnsibleModule):
         is_change_required = self.module.compare_payload(
             json_payload, idrac_attr)
         assert is_change_required is True
+
+    @pytest.fixture
+    def idrac_accounts_mock(self, idrac_user_mock):
+        accounts = {"Members": [{"Id": str(num), "UserName": ""} for num in range(1, 17)]}
+        accounts["Members"][1]["UserName"] = "root"
+        accounts["Members"][2]["UserName"] = "svc_backup"
+        accounts["Members"][3]["UserName"] = "svc_legacy"
+        attributes = {"Attributes": {"Users.3.UserName": "svc_backup", "Users.3.Privilege": 511,
+                                     "Users.3.Enable": "Enabled", "Users.3.IpmiLanPrivilege": None,
+                                     "SNMP.1.AgentEnable": "Enabled"}}
+        responses = {self.module.ACCOUNTS_EXPAND_URI: accounts, self.module.ATTRIBUTE_URI: attributes}
+
+        def invoke_request(uri, method, data=None):
+            resp = MagicMock()
+            resp.json_data = responses.get(uri, {}) if method == "GET" else {"@Message.ExtendedInfo": []}
+            return resp
+        idrac_user_mock.invoke_request.side_effect = invoke_request
+        idrac_user_mock.import_scp.return_value.json_data = {"Oem": {"Dell": {"Message": "Successfully imported"}}}
+        idrac_user_mock.get_server_generation = (14, VERSION)
+        return idrac_user_mock
+
+    def test_get_user_account_from_accounts(self, idrac_accounts_mock, idrac_default_args):
+        idrac_default_args.update({"user_name": "svc_backup"})
+        f_module = self.get_module_mock(params=idrac_default_args, check_mode=False)
+        response = self.module.get_user_account(f_module, idrac_accounts_mock)
+        assert response[0] == {"Users.3#UserName": "svc_backup", "Users.3#Privilege": "511",
+                               "Users.3#Enable": "Enabled", "Users.3#IpmiLanPrivilege": ""}
+        assert response[1:3] == ("/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/3", 3)
+        idrac_default_args.update({"user_name": "new_user"})
+        response = self.module.get_user_account(f_module, idrac_accounts_mock)
+        assert response == ({}, None, None, 5, "/redfish/v1/Managers/iDRAC.Embedded.1/Accounts/5")
+        assert idrac_accounts_mock.export_scp.call_count == 0
+
+    @pytest.mark.parametrize("accounts", [{"Members": [{"@odata.id": "/Accounts/2"}]}, HTTPError(
+        'https://testhost.com', 400, 'Bad Request', {}, None)])
+    def test_get_user_slots_fallback(self, idrac_user_mock, accounts):
+        if isinstance(accounts, HTTPError):
+            idrac_user_mock.invoke_request.side_effect = accounts
+        else:
+            idrac_user_mock.invoke_request.return_value.json_data = accounts
+        idrac_user_mock.get_idrac_local_account_attr.return_value = {USERNAME2: "root", "Users.3#UserName": "test"}
+        assert self.module.get_user_slots(idrac_user_mock) is None
+        snapshot = self.module.AccountSnapshot(idrac_user_mock)
+        assert idrac_user_mock.export_scp.call_count == 1
+        assert snapshot.find_slot("test") == 3
+        assert snapshot.find_empty_slot() == 4
+        assert snapshot.get_user_attributes()[USERNAME2] == "root"
+
+    def test_main_users_batch(self, idrac_connection_user_mock, idrac_accounts_mock, idrac_default_args, mocker):
+        mocker.patch(MODULE_PATH + SLEEP_PATH, return_value=None)
+        idrac_default_args.update({"users": [
+            {"user_name": "svc_backup", "privilege": "Administrator", "enable": True},
+            {"user_name": "svc_monitor", "user_password": "password", "privilege": "ReadOnly"},
+            {"user_name": "svc_legacy", "state": "absent"},
+            {"user_name": "svc_old", "state": "absent"}]})
+        result = self._run_module(idrac_default_args, check_mode=True)
+        assert result["msg"] == CHANGES_FOUND
+        assert result["changed"] is True
+        assert idrac_accounts_mock.import_scp.call_count == 0
+        result = self._run_module(idrac_default_args)
+        assert result["changed"] is True
+        assert result["msg"] == "Successfully applied the changes to the user accounts."
+        assert [(user["slot_id"], user["changed"], user["msg"]) for user in result["users"]] == [
+            (3, False, "Requested changes are already present in the user slot."),
+            (5, True, SUCCESS_MSG), (4, True, "Successfully deleted user account."),
+            (None, False, "The user account is absent.")]
+        patch_call = [call for call in idrac_accounts_mock.invoke_request.call_args_list if call[0][1] == "PATCH"]
+        assert len(patch_call) == 1
+        assert patch_call[0][1]["data"]["Attributes"] == {"Users.5.UserName": "svc_monitor",
+                                                          "Users.5.Password": "password", "Users.5.Privilege": 1}
+        assert idrac_accounts_mock.import_scp.call_count == 1
+        assert '<Attribute Name="Users.4#UserName"></Attribute>' in \
+            idrac_accounts_mock.import_scp.call_args[1]["import_buffer"]
+        assert idrac_accounts_mock.export_scp.call_count == 0
+
+    def test_main_users_batch_invalid_privilege(self, idrac_connection_user_mock, idrac_accounts_mock,
+                                                idrac_default_args):
+        idrac_default_args.update({"users": [{"user_name": "svc_old", "state": "absent"},
+                                             {"user_name": "svc_backup", "custom_privilege": 512}]})
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"] == "custom_privilege value should be from 0 to 511."
+        assert result["failed"] is True
+        assert [user["user_name"] for user in result["users"]] == ["svc_old"]
+        assert idrac_accounts_mock.import_scp.call_count == 0
+
+    def test_main_users_batch_no_change(self, idrac_connection_user_mock, idrac_accounts_mock, idrac_default_args):
+        idrac_default_args.update({"users": [{"user_name": "svc_backup", "enable": True},
+                                             {"user_name": "svc_old", "state": "absent"}]})
+        result = self._run_module(idrac_default_args, check_mode=True)
+        assert result["msg"] == "No changes found to commit!"
+        result = self._run_module(idrac_default_args)
+        assert result["msg"] == "Requested changes are already present in the user slots."
+        assert result["changed"] is False
+        idrac_default_args.update({"user_name": "svc_backup"})
+        result = self._run_module_with_fail_json(idrac_default_args)
+        assert result["msg"] == "parameters are mutually exclusive: user_name|users"
@@ -207,6 +207,37 @@ class TestIDRACUserInfo(FakeAnsibleModule):
         assert resp['failed'] is True
         assert resp['msg'] == "Unable to retrieve the user information."
 
+    def test_user_info_targets(self, idrac_default_args, idrac_connection_user_info_mock, mocker):
+        def get_user_id_accounts(idrac, module, accounts_uri, user_id):
+            if module.params["idrac_ip"] == "192.168.0.2":
+                module.exit_json(msg="'user_id' is not valid.", failed=True)
+            return {"UserName": module.params["idrac_user"]}
+        mocker.patch(MODULE_PATH + "idrac_user_info.get_accounts_uri", return_value="/accounts")
+        mocker.patch(MODULE_PATH + "idrac_user_info.get_user_id_accounts", side_effect=get_user_id_accounts)
+        idrac_default_args.pop("idrac_ip")
+        idrac_default_args.update({"user_id": 2, "targets": [{"idrac_ip": "192.168.0.1", "idrac_user": "admin"},
+                                                             {"idrac_ip": "192.168.0.2"}]})
+        resp = self._run_module(idrac_default_args)
+        assert resp["msg"] == "Successfully fetched the details of 1 out of 2 target(s)."
+        assert resp["results"]["192.168.0.1"]["user_info"] == [{"UserName": "admin"}]
+        assert resp["results"]["192.168.0.2"] == {"msg": "'user_id' is not valid.", "failed": True}
+        assert idrac_connection_user_info_mock.call_args_list[0][0][0]["idrac_password"] == "idrac_password"
+
+    def test_user_info_target_credentials(self, idrac_default_args, idrac_connection_user_info_mock, mocker):
+        mocker.patch(MODULE_PATH + "idrac_user_info.get_accounts_uri", return_value="/accounts")
+        mocker.patch(MODULE_PATH + "idrac_user_info.get_user_id_accounts", return_value={"UserName": "admin"})
+        for key in ("idrac_ip", "idrac_user", "idrac_password"):
+            idrac_default_args.pop(key)
+        idrac_default_args.update({"user_id": 2, "targets": [
+            {"idrac_ip": "192.168.0.1", "idrac_user": "admin", "idrac_password": "password1"},
+            {"idrac_ip": "192.168.0.2", "idrac_user": "root", "idrac_password": "password2"}]})
+        resp = self._run_module(idrac_default_args)
+        assert resp["msg"] == "Successfully fetched the details of 2 out of 2 target(s)."
+        assert idrac_connection_user_info_mock.call_count == 2
+        idrac_default_args["targets"].append({"idrac_ip": "192.168.0.3"})
+        resp = self._run_module_with_fail_json(idrac_default_args)
+        assert resp["msg"] == "one of the following is required: idrac_user, x_auth_token found in targets"
+
     @pytest.mark.parametrize("exc_type",
                              [URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError])
     def test_idrac_user_info_main_exception_handling_case(self, exc_type, mocker, idrac_default_args,
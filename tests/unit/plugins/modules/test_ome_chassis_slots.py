@@ -182,6 +182,7 @@ class TestOmeChassisSlots(FakeAnsibleModule):
             'json_data']
         ome_connection_mock_for_chassis_slots.job_tracking.return_value = (
             False, "job_track_msg")
+        ome_connection_mock_for_chassis_slots.iter_jobs_tracking.return_value = iter([(1, False, "job_track_msg")])
         mocker.patch(
             MODULE_PATH +
             'trigger_refresh_inventory',
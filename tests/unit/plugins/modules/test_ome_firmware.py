@@ -12,11 +12,11 @@ from __future__ import (absolute_import, division, print_function)
 
 __metaclass__ = type
 
-from mock import patch, mock_open
+from mock import mock_open
 
 import pytest
 import json
-import sys
+import time
 from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from io import StringIO
@@ -291,36 +291,91 @@ class TestOmeFirmware(FakeAnsibleModule):
             duppayload.get('device_ids'), duppayload.get('group_ids'), duppayload.get('baseline_ids'))
         assert data == duppayload["out"]
 
-    def test_upload_dup_file_success_case01(self, ome_connection_firmware_mock, ome_response_mock):
+    def test_upload_dup_file_success_case01(self, ome_connection_firmware_mock, ome_response_mock, tmp_path):
         ome_response_mock.json_data = "1577786112600"
         ome_response_mock.success = True
         ome_response_mock.status_code = 200
-        f_module = self.get_module_mock(params={'dup_file': "/root1/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE"})
-        if sys.version_info.major == 3:
-            builtin_module_name = 'builtins'
-        else:
-            builtin_module_name = '__builtin__'
-        with patch("{0}.open".format(builtin_module_name), mock_open(read_data="data")) as mock_file:
-            result = self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
+        dup_file = tmp_path / "BIOS_87V69_WN64_2.4.7.EXE"
+        dup_file.write_bytes(b"data")
+        f_module = self.get_module_mock(params={'dup_file': str(dup_file)})
+        result = self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
         assert result == (True, "1577786112600")
+        call_kwargs = ome_connection_firmware_mock.invoke_request.call_args[1]
+        assert call_kwargs["headers"]["Content-Length"] == "4"
+        assert call_kwargs["data"].name == str(dup_file)
 
     def test_upload_dup_file_failure_case02(self, ome_default_args,
-                                            ome_connection_firmware_mock, ome_response_mock):
+                                            ome_connection_firmware_mock, ome_response_mock, tmp_path):
         ome_response_mock.json_data = {"value": [{"Id": [1111, 2222, 3333], "DeviceServiceTag": "KLBR222",
                                                   "dup_file": "/root/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE"}]}
         ome_response_mock.status_code = 500
-
-        if sys.version_info.major == 3:
-            builtin_module_name = 'builtins'
-        else:
-            builtin_module_name = '__builtin__'
+        dup_file = tmp_path / "BIOS_87V69_WN64_2.4.7.EXE"
+        dup_file.write_bytes(b"data")
         f_module = self.get_module_mock(
-            params={'dup_file': "/root1/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE", 'hostname': 'XX.XX.XX.XX'})
-        with patch("{0}.open".format(builtin_module_name), mock_open(read_data="data")) as mock_file:
-            with pytest.raises(Exception) as exc:
-                self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
-        assert exc.value.args[0] == "Unable to upload {0} to {1}".format('/root1/Ansible_EXE/BIOS_87V69_WN64_2.4.7.EXE',
-                                                                         'XX.XX.XX.XX')
+            params={'dup_file': str(dup_file), 'hostname': 'XX.XX.XX.XX'})
+        with pytest.raises(Exception) as exc:
+            self.module.upload_dup_file(ome_connection_firmware_mock, f_module)
+        assert exc.value.args[0] == "Unable to upload {0} to {1}".format(str(dup_file), 'XX.XX.XX.XX')
+
+    def test_single_dup_update_token_cache(self, ome_connection_firmware_mock, ome_response_mock, tmp_path,
+                                           monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_CACHE_DIR", str(tmp_path / "cache"))
+        dup_file = tmp_path / "BIOS_87V69_WN64_2.4.7.EXE"
+        dup_file.write_bytes(b"data")
+        f_module = self.get_module_mock(params={'dup_file': str(dup_file), 'hostname': '192.168.0.1', 'port': 443,
+                                                'device_group_names': ["servers"], 'dup_token_cache_ttl': 3600})
+        f_module.check_mode = False
+        mocker.patch(MODULE_PATH + 'ome_firmware.get_group_ids', return_value=[1])
+        components = mocker.patch(MODULE_PATH + 'ome_firmware.get_applicable_components',
+                                  return_value=["target_data"])
+        upload = mocker.patch(MODULE_PATH + 'ome_firmware.upload_dup_file',
+                              side_effect=self.module.upload_dup_file)
+        ome_response_mock.status_code = 200
+        ome_response_mock.json_data = 1234
+        assert self.module.single_dup_update(ome_connection_firmware_mock, f_module) == ["target_data"]
+        assert self.module.single_dup_update(ome_connection_firmware_mock, f_module) == ["target_data"]
+        assert upload.call_count == 1
+        assert components.call_args[0][1]["SingleUpdateReportFileToken"] == "1234"
+        components.side_effect = [HTTPError('https://testhost.com', 400, 'Bad Request', {}, None), ["target_data"]]
+        ome_response_mock.json_data = 5678
+        assert self.module.single_dup_update(ome_connection_firmware_mock, f_module) == ["target_data"]
+        assert upload.call_count == 2
+        assert components.call_args[0][1]["SingleUpdateReportFileToken"] == "5678"
+        assert self.module.get_cached_dup_token(self.module.get_dup_cache_file(f_module)) == "5678"
+        f_module.params["hostname"] = "192.168.0.2"
+        assert self.module.get_cached_dup_token(self.module.get_dup_cache_file(f_module)) is None
+
+    def test_single_dup_update_stale_token_report(self, ome_connection_firmware_mock, ome_response_mock, tmp_path,
+                                                  monkeypatch, mocker):
+        monkeypatch.setenv("OMAM_CACHE_DIR", str(tmp_path / "cache"))
+        dup_file = tmp_path / "BIOS_87V69_WN64_2.4.7.EXE"
+        dup_file.write_bytes(b"data")
+        f_module = self.get_module_mock(params={'dup_file': str(dup_file), 'hostname': '192.168.0.1', 'port': 443,
+                                                'device_id': [11], 'dup_token_cache_ttl': 3600})
+        f_module.check_mode = False
+        mocker.patch(MODULE_PATH + 'ome_firmware._validate_device_attributes', return_value=[11])
+        mocker.patch(MODULE_PATH + 'ome_firmware.get_device_ids', return_value=([11], {}))
+        upload = mocker.patch(MODULE_PATH + 'ome_firmware.upload_dup_file',
+                              side_effect=self.module.upload_dup_file)
+        cache_file = self.module.get_dup_cache_file(f_module)
+        valid = [{"Id": 11, "Data": "BIOS=5678", "TargetType": {"Id": 1000, "Name": "SERVER"}}]
+        foreign = [{"Id": 22, "Data": "BIOS=1234", "TargetType": {"Id": 1000, "Name": "SERVER"}}]
+        ome_response_mock.status_code = 200
+        ome_response_mock.json_data = 5678
+        for stale_report in ([], foreign):
+            self.module.write_cache_file(cache_file, {"token": "1234", "expires": time.time() + 60})
+            mocker.patch(MODULE_PATH + 'ome_firmware.get_applicable_components', side_effect=[stale_report, valid])
+            assert self.module.single_dup_update(ome_connection_firmware_mock, f_module) == valid
+            assert self.module.get_cached_dup_token(cache_file) == "5678"
+        assert upload.call_count == 2
+
+    def test_is_dup_report_valid(self):
+        target = {"Id": 11, "Data": "BIOS=1234", "TargetType": {"Id": 1000, "Name": "SERVER"}}
+        assert self.module.is_dup_report_valid([target], ["11"])
+        assert self.module.is_dup_report_valid([target])
+        assert not self.module.is_dup_report_valid([target], [22])
+        assert not self.module.is_dup_report_valid([], [11])
+        assert not self.module.is_dup_report_valid(None)
 
     def test_get_device_ids_success_case(self, ome_connection_firmware_mock, ome_response_mock, ome_default_args):
         ome_default_args.update()
@@ -136,26 +136,24 @@ class TestOmeFirmwareBaseline(FakeAnsibleModule):
                                         {"inp": catrepo_param3, "out": catrepo_out3}])
     def test_get_catrepo_ids(self, ome_connection_mock_for_firmware_baseline,
                              ome_response_mock, params):
-        ome_connection_mock_for_firmware_baseline.get_all_items_with_pagination.return_value = {
-            "value": [
-                {
-                    "Id": 22,
-                    "Repository": {
-                        "Id": 12,
-                        "Name": "catalog1",
-                    },
-                    "Status": "Completed"
+        ome_connection_mock_for_firmware_baseline.iter_items_with_pagination.return_value = iter([
+            {
+                "Id": 22,
+                "Repository": {
+                    "Id": 12,
+                    "Name": "catalog1",
                 },
-                {
-                    "Id": 23,
-                    "Repository": {
-                        "Id": 12,
-                        "Name": "catalog2",
-                    },
-                    "Status": "Completed"
-                }
-            ]
-        }
+                "Status": "Completed"
+            },
+            {
+                "Id": 23,
+                "Repository": {
+                    "Id": 12,
+                    "Name": "catalog2",
+                },
+                "Status": "Completed"
+            }
+        ])
         f_module = self.get_module_mock(params=params["inp"])
         catrepo = self.module.get_catrepo_ids(f_module, params["inp"], ome_connection_mock_for_firmware_baseline)
         assert catrepo == params["out"]
@@ -170,7 +168,7 @@ class TestOmeFirmwareBaseline(FakeAnsibleModule):
     def test_check_existing_baseline(self, mocker, params, ome_connection_mock_for_firmware_baseline, ome_response_mock):
         ome_response_mock.success = params.get("success", True)
         ome_response_mock.json_data = params["json_data"]
-        ome_connection_mock_for_firmware_baseline.get_all_items_with_pagination.return_value = params['json_data']
+        ome_connection_mock_for_firmware_baseline.iter_items_with_pagination.return_value = iter(params['json_data']['value'])
         f_module = self.get_module_mock(params=params["mparams"])
         res = self.module.check_existing_baseline(f_module, ome_connection_mock_for_firmware_baseline)
         assert res == params["res"]
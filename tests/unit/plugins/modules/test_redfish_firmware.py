@@ -239,7 +239,7 @@ class TestRedfishFirmware(FakeAnsibleModule):
         mocker.patch(MODULE_PATH + "redfish_firmware._get_update_service_target",
                      return_value=('2134', HTTPS_ADDRESS_DELL, 'multipart/form-data'))
         mocker.patch("ansible_collections.dellemc.openmanage.plugins.modules.redfish_firmware._encode_form_data",
-                     return_value=({"file": (3, HTTPS_ADDRESS_DELL, FIRMWARE_DATA)}, FIRMWARE_DATA))
+                     return_value=({"file": (3, HTTPS_ADDRESS_DELL, FIRMWARE_DATA)}, FIRMWARE_DATA, 3))
         redfish_default_args.update({"image_uri": HTTPS_IMAGE_URI,
                                      "transfer_protocol": "HTTP", "timeout": 0, "job_wait_timeout": 0})
         f_module = self.get_module_mock(params=redfish_default_args)
@@ -255,6 +255,26 @@ class TestRedfishFirmware(FakeAnsibleModule):
             result = self.module.firmware_update(redfish_firmware_connection_mock, f_module)
         assert result == redfish_response_mock
 
+    def test_encode_form_data_streamed(self, tmp_path):
+        from urllib3.fields import RequestField
+        from urllib3.filepost import encode_multipart_formdata
+        image = tmp_path / "BIOS_X.EXE"
+        image.write_bytes(b"\x00\x01firmware" * 5000)
+        with open(str(image), "rb") as img_file:
+            body, ctype, length = self.module._encode_form_data(
+                {"file": ("BIOS_X.EXE", img_file, "multipart/form-data")})
+            req_field = RequestField(name="file", data=image.read_bytes(), filename="BIOS_X.EXE")
+            req_field.make_multipart(content_type="multipart/form-data")
+            expected, expected_ctype = encode_multipart_formdata([req_field], boundary=body.boundary)
+            chunks = iter(lambda: body.read(8192), b"")
+            assert b"".join(chunks) == expected
+            assert ctype == expected_ctype
+            assert length == len(body) == len(expected)
+            body.seek(0)
+            assert body.read() == expected
+            with pytest.raises(ValueError):
+                body.seek(10)
+
     @pytest.mark.parametrize("params", [{"ip": "192.161.1.1:443"}, {"ip": "192.161.1.1"},
                                         {"ip": "82f5:d985:a2d5:f0c3:5392:cc52:27d1:4da6"},
                                         {"ip": "[82f5:d985:a2d5:f0c3:5392:cc52:27d1:4da6]"},
@@ -264,7 +284,7 @@ class TestRedfishFirmware(FakeAnsibleModule):
         mocker.patch(MODULE_PATH + "redfish_firmware._get_update_service_target",
                      return_value=('2134', HTTPS_ADDRESS_DELL, 'multipart/form-data'))
         mocker.patch(MODULE_PATH + "redfish_firmware._encode_form_data",
-                     return_value=({"file": (3, HTTPS_ADDRESS_DELL, FIRMWARE_DATA)}, FIRMWARE_DATA))
+                     return_value=({"file": (3, HTTPS_ADDRESS_DELL, FIRMWARE_DATA)}, FIRMWARE_DATA, 3))
         redfish_default_args.update({"baseuri": params["ip"], "image_uri": HTTPS_IMAGE_URI,
                                      "transfer_protocol": "HTTP", "timeout": 0, "job_wait_timeout": 0})
         f_module = self.get_module_mock(params=redfish_default_args)
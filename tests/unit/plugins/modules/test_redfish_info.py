@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.9.0
+# Copyright (C) 2025 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from io import StringIO
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible.module_utils._text import to_text
+from ansible_collections.dellemc.openmanage.plugins.modules import redfish_info
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule
+from mock import MagicMock
+
+MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.redfish_info.'
+SYSTEM_URI = "/redfish/v1/Systems/System.Embedded.1"
+MANAGER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1"
+
+
+class TestRedfishInfo(FakeAnsibleModule):
+    module = redfish_info
+
+    @pytest.fixture
+    def redfish_connection_mock(self, mocker):
+        hosts = {}
+
+        def redfish_obj(module_params, req_session=False):
+            host = module_params["baseuri"]
+            obj = MagicMock()
+            obj.__enter__.return_value = obj
+            if host == "unreachable":
+                obj.__enter__.side_effect = URLError("No route to host")
+
+            def invoke_request(method, uri):
+                return MagicMock(json_data={"Id": uri.split("/")[-1], "host": host})
+            obj.invoke_request.side_effect = invoke_request
+            hosts[host] = obj
+            return obj
+        mocker.patch(MODULE_PATH + 'Redfish', side_effect=redfish_obj)
+        return hosts
+
+    def test_redfish_info(self, redfish_default_args, redfish_connection_mock):
+        redfish_default_args.update({"resource_uris": [SYSTEM_URI, MANAGER_URI, SYSTEM_URI]})
+        result = self._run_module(redfish_default_args)
+        assert result["msg"] == "Successfully retrieved the Redfish resources."
+        assert result["redfish_info"] == {SYSTEM_URI: {"Id": "System.Embedded.1", "host": "XX.XX.XX.XX"},
+                                          MANAGER_URI: {"Id": "iDRAC.Embedded.1", "host": "XX.XX.XX.XX"}}
+        assert redfish_connection_mock["XX.XX.XX.XX"].invoke_request.call_count == 2
+
+    def test_redfish_info_targets(self, redfish_default_args, redfish_connection_mock):
+        redfish_default_args.pop("baseuri")
+        redfish_default_args.update({"resource_uris": [SYSTEM_URI], "max_workers": 3, "targets": [
+            {"baseuri": "192.168.0.1"}, {"baseuri": "192.168.0.2", "timeout": 60}, {"baseuri": "unreachable"}]})
+        result = self._run_module(redfish_default_args)
+        assert result["msg"] == "Successfully fetched the details of 2 out of 3 target(s)."
+        assert result["results"]["192.168.0.2"]["redfish_info"] == {
+            SYSTEM_URI: {"Id": "System.Embedded.1", "host": "192.168.0.2"}}
+        assert result["results"]["unreachable"]["unreachable"] is True
+        assert "redfish_info" not in result
+
+    def test_redfish_info_host_required(self, redfish_default_args):
+        redfish_default_args.pop("baseuri")
+        redfish_default_args.update({"resource_uris": [SYSTEM_URI]})
+        result = self._run_module_with_fail_json(redfish_default_args)
+        assert "baseuri, targets" in result["msg"]
+
+    def test_redfish_info_http_error(self, redfish_default_args, redfish_connection_mock, mocker):
+        json_str = to_text(json.dumps({"data": "out"}))
+        mocker.patch(MODULE_PATH + "get_resources",
+                     side_effect=HTTPError("https://testhost.com", 404, "Not Found", {}, StringIO(json_str)))
+        redfish_default_args.update({"resource_uris": [SYSTEM_URI]})
+        result = self._run_module(redfish_default_args)
+        assert result["failed"] is True
+        assert result["error_info"] == {"data": "out"}